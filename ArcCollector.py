@@ -0,0 +1,55 @@
+from types import FrameType, TracebackType, FunctionType, CodeType
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
+from CoverageCollector import CoverageCollector, Coverage
+
+# 간선 (이전 줄, 다음 줄)을 정수 하나로 저장: 이전 줄 << ARC_SHIFT | 다음 줄
+ARC_SHIFT = 32
+ARC_MASK = (1 << ARC_SHIFT) - 1
+EXIT_LINE = 0  # 함수에서 빠져나가는 간선의 도착 줄
+
+# 실행된 줄 사이의 간선(분기)을 수집하는 수집기
+# 이벤트: (함수 이름, 이전 줄, 다음 줄). 함수 진입 간선은 def 줄에서, 종료 간선은 EXIT_LINE으로 이어짐
+# 같은 줄을 다른 경로로 실행한 경우도 구별할 수 있음
+class ArcCollector(CoverageCollector):
+    def __init__(self) -> None:
+        super().__init__()
+        # 코드 객체 -> 정수로 압축된 간선 집합
+        self._arcs: Dict[CodeType, Set[int]] = {}
+        self._functions: Dict[CodeType, Callable] = {}
+        self._last_line: Dict[FrameType, int] = {}  # 실행 중인 프레임의 마지막 줄
+
+    def collect(self, frame: FrameType, event: str, arg: Any) -> None:
+        code = frame.f_code
+        arcs = self._arcs.get(code)
+        if arcs is None:
+            arcs = self._arcs[code] = set()
+            self._functions[code] = self.frame_function(frame)
+        lineno = frame.f_lineno
+        if event == 'line':
+            last_line = self._last_line.get(frame, code.co_firstlineno)
+            arcs.add(last_line << ARC_SHIFT | lineno)
+            self._last_line[frame] = lineno
+        elif event == 'call':  # 함수 시작 또는 제너레이터 재개
+            self._last_line[frame] = lineno
+        elif event == 'return':
+            last_line = self._last_line.pop(frame, lineno)
+            arcs.add(last_line << ARC_SHIFT | EXIT_LINE)
+
+    # (함수, 이전 줄, 다음 줄) 집합
+    def arcs(self) -> Set[Tuple[Callable, int, int]]:
+        return {(self._functions[code], arc >> ARC_SHIFT, arc & ARC_MASK)
+                for code, arcs in self._arcs.items() for arc in arcs}
+
+    def events(self) -> Set[Tuple[str, int, int]]:
+        return {(func.__name__, from_line, to_line) for func, from_line, to_line in self.arcs()}
+
+    def coverage(self) -> Coverage:
+        coverage = set()
+        for func, from_line, to_line in self.arcs():
+            coverage.add((func, from_line))
+            if to_line != EXIT_LINE:
+                coverage.add((func, to_line))
+        return coverage
+
+    def covered_functions(self) -> Set[Callable]:
+        return set(self._functions.values())
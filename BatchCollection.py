@@ -0,0 +1,85 @@
+from types import FrameType, TracebackType, FunctionType
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
+import multiprocessing
+from RecordedCollector import record
+from TraceScope import TraceScope
+
+# 테스트: (결과, 인자) 튜플 또는 인자 없는 테스트 함수
+Test = Union[Tuple[str, Any], Callable[[], Any]]
+
+# fork로 생성된 작업 프로세스가 물려받는 현재 배치 (테스트를 피클하지 않아도 됨)
+_BATCH: Optional[Tuple[Type, List[Any], Optional[Callable], List[Test], str, str,
+                       Optional[TraceScope]]] = None
+
+# 테스트 함수 자체는 추적하지 않는 범위: 수집기가 기록하는 함수는 테스트가 처음 호출한 함수
+# (같은 프로세스에서 with debugger.collect_pass(): middle(...)로 수집한 결과와 같음)
+def test_scope(test: Callable, scope: Optional[TraceScope]) -> TraceScope:
+    if scope is None:
+        return TraceScope(exclude=[test])
+    return TraceScope(scope.include, scope.exclude + [test])
+
+# 테스트 하나를 자체 수집기로 실행하고, 결과와 피클 가능한 기록을 반환
+def run_test(collector_class: Type, items_to_ignore: List[Any],
+             function: Optional[Callable], test: Test,
+             pass_outcome: str, fail_outcome: str,
+             scope: Optional[TraceScope] = None) -> Tuple[str, Dict[str, Any]]:
+    collector = collector_class()
+    collector.add_items_to_ignore(items_to_ignore)
+    if callable(test):
+        collector.set_scope(test_scope(test, scope))
+        outcome = pass_outcome
+        try:
+            with collector:
+                test()
+        except Exception as exc:
+            outcome = fail_outcome
+            collector._exception = type(exc)
+    else:
+        if scope is not None:
+            collector.set_scope(scope)
+        outcome, args = test
+        assert function is not None, "Need a function to call with test arguments"
+        try:
+            with collector:
+                if isinstance(args, dict):
+                    function(**args)
+                else:
+                    function(*args)
+        except Exception as exc:
+            collector._exception = type(exc)
+    return outcome, record(collector)
+
+def _run_batch_test(index: int) -> Tuple[str, Dict[str, Any]]:
+    assert _BATCH is not None
+    collector_class, items_to_ignore, function, tests, pass_outcome, fail_outcome, scope = _BATCH
+    return run_test(collector_class, items_to_ignore, function, tests[index],
+                    pass_outcome, fail_outcome, scope)
+
+def _run_pickled_test(task: Tuple[Type, List[Any], Optional[Callable], Test, str, str,
+                                  Optional[TraceScope]]) -> Tuple[str, Dict[str, Any]]:
+    return run_test(*task)
+
+# 테스트들을 프로세스 풀에서 실행하고 (결과, 기록) 목록을 테스트 순서대로 반환
+def collect_records(collector_class: Type, items_to_ignore: List[Any],
+                    function: Optional[Callable], tests: List[Test],
+                    pass_outcome: str = 'PASS', fail_outcome: str = 'FAIL',
+                    processes: Optional[int] = None,
+                    chunksize: int = 16,
+                    scope: Optional[TraceScope] = None) -> List[Tuple[str, Dict[str, Any]]]:
+    global _BATCH
+    if processes == 1 or len(tests) <= 1:
+        return [run_test(collector_class, items_to_ignore, function, test,
+                         pass_outcome, fail_outcome, scope) for test in tests]
+    if 'fork' in multiprocessing.get_all_start_methods():
+        _BATCH = (collector_class, items_to_ignore, function, tests, pass_outcome, fail_outcome,
+                  scope)
+        try:
+            with multiprocessing.get_context('fork').Pool(processes) as pool:
+                return pool.map(_run_batch_test, range(len(tests)), chunksize)
+        finally:
+            _BATCH = None
+    # fork가 없으면 테스트와 함수가 피클 가능해야 함
+    tasks = [(collector_class, items_to_ignore, function, test, pass_outcome, fail_outcome, scope)
+             for test in tests]
+    with multiprocessing.Pool(processes) as pool:
+        return pool.map(_run_pickled_test, tasks, chunksize)
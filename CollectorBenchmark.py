@@ -0,0 +1,68 @@
+from types import FrameType, TracebackType, FunctionType
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
+import time
+import warnings
+from Middle import middle, MIDDLE_PASSING_TESTCASES, MIDDLE_FAILING_TESTCASES
+from RemoveHtmlMarkup import remove_html_markup
+from CoverageCollector import CoverageCollector
+from MonitoringCoverageCollector import MonitoringCoverageCollector, HAVE_MONITORING
+
+BENCHMARK_HTML_INPUTS = ['<b>foo</b>', '"<b>foo</b>"', '<a href="x">' + 'bar' * 100 + '</a>', 'x' * 1000]
+
+# 수집기 클래스로 모든 입력을 실행하고 걸린 시간(초)을 반환
+def time_collector(collector_class: Type, function: Callable, inputs: List[Tuple], repeat: int = 10) -> float:
+    start = time.perf_counter()
+    for i in range(repeat):
+        for args in inputs:
+            with collector_class():
+                function(*args)
+    return time.perf_counter() - start
+
+# 두 수집기가 같은 커버리지를 만드는지 확인
+def same_coverage(function: Callable, inputs: List[Tuple],
+                  collector_classes: List[Type]) -> bool:
+    for args in inputs:
+        events = []
+        for collector_class in collector_classes:
+            with collector_class() as collector:
+                function(*args)
+            events.append(collector.events())
+        if any(e != events[0] for e in events):
+            return False
+    return True
+
+# middle()과 remove_html_markup()에 대해 settrace/sys.monitoring 수집기 비교
+def benchmark_collectors(collector_classes: Optional[List[Type]] = None,
+                         repeat: int = 10) -> Dict[str, Dict[str, float]]:
+    if collector_classes is None:
+        collector_classes = [CoverageCollector, MonitoringCoverageCollector]
+    if not HAVE_MONITORING and MonitoringCoverageCollector in collector_classes:
+        # Python 3.12 미만에서는 settrace 방식으로 동작하므로 settrace끼리 비교하게 됨
+        warnings.warn("sys.monitoring is not available (Python < 3.12); "
+                      "MonitoringCoverageCollector falls back to settrace")
+    subjects: List[Tuple[Callable, List[Tuple]]] = [
+        (middle, MIDDLE_PASSING_TESTCASES + MIDDLE_FAILING_TESTCASES),
+        (remove_html_markup, [(s,) for s in BENCHMARK_HTML_INPUTS]),
+    ]
+    results: Dict[str, Dict[str, float]] = {}
+    for function, inputs in subjects:
+        if not same_coverage(function, inputs, collector_classes):
+            raise ValueError(f"Collectors disagree on the coverage of {function.__name__}()")
+        results[function.__name__] = {
+            collector_class.__name__: time_collector(collector_class, function, inputs, repeat)
+            for collector_class in collector_classes}
+    return results
+
+def print_benchmark(results: Dict[str, Dict[str, float]]) -> None:
+    for name, timings in results.items():
+        baseline = next(iter(timings.values()))
+        for collector_name, seconds in timings.items():
+            speedup = baseline / seconds
+            # 함수가 짧으면 수집기 시작/종료 비용이 커서 settrace보다 느릴 수 있음
+            note = " slower" if speedup < 1.0 else ""
+            print(f"{name:20} {collector_name:30} {seconds:8.4f}s "
+                  f"({speedup:5.1f}x){note}")
+
+
+# 활용
+# print_benchmark(benchmark_collectors())
@@ -1,21 +1,56 @@
-from types import FrameType, TracebackType, FunctionType
+from types import FrameType, TracebackType, FunctionType, CodeType
 from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
 import inspect
 import traceback
 import sys
 from Tracer import Tracer
+from TraceSink import TraceSink
+from TraceScope import TraceScope
 
 class ConditionalTracer(Tracer):
-    def __init__(self, *, condition: Optional[str] = None) -> None:
+    def __init__(self, *, condition: Optional[str] = None,
+                 functions: Optional[List[Union[Callable, CodeType]]] = None,
+                 lines: Optional[Tuple[int, int]] = None,
+                 sink: Optional[TraceSink] = None,
+                 scope: Optional[TraceScope] = None) -> None:
         if condition is None:
             condition = 'False'
         self.condition: str = condition
         self.last_report: Optional[bool] = None
-        super().__init__()
-    
+        # 식 -> 컴파일된 코드 객체 (이벤트마다 다시 파싱하지 않도록 생성 시 컴파일)
+        self.compiled: Dict[str, CodeType] = {}
+        self.compile_expr(condition)
+        # 조건을 평가할 함수(코드 객체)와 줄 범위 (None이면 제한 없음)
+        self.code_objects: Optional[Set[CodeType]] = None
+        if functions is not None:
+            self.code_objects = {self.code_object(function) for function in functions}
+        self.lines = lines
+        super().__init__(sink=sink, scope=scope)
+
+    def code_object(self, function: Union[Callable, CodeType]) -> CodeType:
+        if isinstance(function, CodeType):
+            return function
+        return inspect.unwrap(function).__code__  # type: ignore
+
+    def compile_expr(self, expr: str) -> CodeType:
+        code = self.compiled.get(expr)
+        if code is None:
+            code = compile(expr, '<condition>', 'eval')
+            self.compiled[expr] = code
+        return code
+
+    # 프레임이 지정된 함수와 줄 범위 안에 있는지 확인 (범위 밖이면 조건을 평가하지 않음)
+    def in_scope(self, frame: FrameType) -> bool:
+        if self.code_objects is not None and frame.f_code not in self.code_objects:
+            return False
+        if self.lines is not None:
+            first, last = self.lines
+            return first <= frame.f_lineno <= last
+        return True
+
     def eval_in_context(self, expr: str, frame: FrameType) -> Optional[bool]:
         try:
-            cond = eval(expr, None, frame.f_locals)
+            cond = eval(self.compile_expr(expr), None, frame.f_locals)
         except NameError:
             cond = None
         return cond
@@ -24,7 +59,7 @@ class ConditionalTracer(Tracer):
         return self.eval_in_context(self.condition, frame)
 
     def traceit(self, frame: FrameType, event: str, arg: Any) -> None:
-        report = self.do_report(frame, event, arg)
+        report = self.do_report(frame, event, arg) if self.in_scope(frame) else False
         if report != self.last_report:
             if report:
                 self.log("...")
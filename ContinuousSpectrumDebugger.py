@@ -2,8 +2,25 @@ from types import FrameType, TracebackType, FunctionType
 from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
 from Collector import Collector
 from DiscreteSpectrumDebugger import DiscreteSpectrumDebugger
+from SuspiciousnessFormulas import Formula, get_formula, normalize
 
 class ContinuousSpectrumDebugger(DiscreteSpectrumDebugger):
+
+    FORMULA: Union[str, Formula] = 'tarantula'  # 기본 의심도 공식
+
+    def __init__(self, *args: Any, formula: Optional[Union[str, Formula]] = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        if formula is None:
+            formula = self.FORMULA
+        self.formula = formula
+        # 공식 -> (계산 시점의 실행 수, 의심도 배열, 정규화된 배열)
+        self._scores_cache: Dict[Any, Tuple[int, List[Optional[float]], List[Optional[float]]]] = {}
+
+    def empty_copy(self) -> 'ContinuousSpectrumDebugger':
+        debugger = cast(ContinuousSpectrumDebugger, super().empty_copy())
+        debugger._scores_cache = {}
+        return debugger
+
     def collectors_with_event(self, event: Any, category: str) -> Set[Collector]:
         all_runs = self.collectors[category]
         collectors_with_event = set(collector for collector in all_runs if event in collector.events())
@@ -14,12 +31,31 @@ class ContinuousSpectrumDebugger(DiscreteSpectrumDebugger):
         collectors_without_event = set(collector for collector in all_runs if event not in collector.events())
         return collectors_without_event
 
+    # 이벤트가 나타난 실행 수와 나타나지 않은 실행 수 (실패: ef, nf / 통과: ep, np)
+    def event_counts(self, event: Any) -> Tuple[int, int, int, int]:
+        spectrum = self.spectrum_index()
+        failed = spectrum.count(event, self.FAIL)
+        passed = spectrum.count(event, self.PASS)
+        return (failed, passed,
+                spectrum.runs(self.FAIL) - failed,
+                spectrum.runs(self.PASS) - passed)
+
+    # 모든 이벤트에 대한 (ef, ep, nf, np) 배열 (spectrum.events 순서)
+    def spectrum_counts(self) -> Tuple[List[int], List[int], List[int], List[int]]:
+        spectrum = self.spectrum_index()
+        failed = spectrum.counts(self.FAIL)
+        passed = spectrum.counts(self.PASS)
+        total_failed = spectrum.runs(self.FAIL)
+        total_passed = spectrum.runs(self.PASS)
+        return (failed, passed,
+                [total_failed - ef for ef in failed],
+                [total_passed - ep for ep in passed])
+
     def event_fraction(self, event: Any, category: str) -> float:
         if category not in self.collectors:
             return 0.0
-        all_collectors = self.collectors[category]
-        collectors_with_event = self.collectors_with_event(event, category)
-        fraction = len(collectors_with_event) / len(all_collectors)
+        spectrum = self.spectrum_index()
+        fraction = spectrum.count(event, category) / spectrum.runs(category)
         return fraction
 
     def passed_fraction(self, event: Any) -> float:
@@ -29,18 +65,55 @@ class ContinuousSpectrumDebugger(DiscreteSpectrumDebugger):
         return self.event_fraction(event, self.FAIL)
 
     def hue(self, event: Any) -> Optional[float]:
-        passed = self.passed_fraction(event)
-        failed = self.failed_fraction(event)
-        if passed + failed > 0:
-            return passed / (passed + failed)
-        else:
+        id = self.spectrum_index().event_ids.get(event)
+        if id is None:
+            return None
+        suspiciousness = self.normalized_scores()[id]
+        if suspiciousness is None:
             return None
+        return 1 - suspiciousness
 
     def suspiciousness(self, event: Any) -> Optional[float]:
-        hue = self.hue(event)
-        if hue is None:
+        id = self.spectrum_index().event_ids.get(event)
+        if id is None:
             return None
-        return 1 - hue
+        return self.scores()[id]
+
+    # 공식으로 모든 이벤트의 의심도를 한 번에 계산 (spectrum.events 순서, 캐시됨)
+    def scores(self, formula: Optional[Union[str, Formula]] = None) -> List[Optional[float]]:
+        return self._cached_scores(formula)[1]
+
+    def normalized_scores(self, formula: Optional[Union[str, Formula]] = None) -> List[Optional[float]]:
+        return self._cached_scores(formula)[2]
+
+    def _cached_scores(self, formula: Optional[Union[str, Formula]]) -> Tuple[int, List[Optional[float]], List[Optional[float]]]:
+        if formula is None:
+            formula = self.formula
+        spectrum = self.spectrum_index()
+        runs = sum(spectrum.run_counts.values())
+        cached = self._scores_cache.get(formula)
+        if cached is None or cached[0] != runs:
+            scores = get_formula(formula)(*self.spectrum_counts())
+            cached = (runs, scores, normalize(scores))
+            self._scores_cache[formula] = cached
+        return cached
+
+    # 여러 공식의 순위를 비교 (공식 -> 의심도 내림차순 이벤트 목록)
+    def rankings(self, *formulas: Union[str, Formula]) -> Dict[Any, List[Any]]:
+        events = self.spectrum_index().events
+        rankings = {}
+        for formula in formulas:
+            scores = self.scores(formula)
+            order = sorted((i for i in range(len(events)) if scores[i] is not None),
+                           key=scores.__getitem__, reverse=True)
+            rankings[formula] = [events[i] for i in order]
+        return rankings
+
+    def all_suspiciousness(self, events: List[Any]) -> List[Optional[float]]:
+        event_ids = self.spectrum_index().event_ids
+        scores = self.scores()
+        return [scores[event_ids[event]] if event in event_ids else None
+                for event in events]
 
     def tooltip(self, event: Any) -> str:
         return self.percentage(event)
@@ -1,6 +1,7 @@
-from types import FrameType, TracebackType, FunctionType
+from types import FrameType, TracebackType, FunctionType, CodeType, MethodType
 from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
 import inspect
+import weakref
 from Collector import Collector
 from StackInspector import StackInspector
 
@@ -12,12 +13,24 @@ class CoverageCollector(Collector, StackInspector):
     def __init__(self) -> None:
         super().__init__()
         self._coverage: Coverage = set()
+        # 코드 객체 -> 함수 (약한 참조): 스택 탐색은 코드 객체마다 한 번만 수행
+        self._resolved: 'weakref.WeakKeyDictionary[CodeType, Callable[[], Optional[Callable]]]' = \
+            weakref.WeakKeyDictionary()
+
+    # 프레임에서 실행 중인 코드에 대응하는 함수
+    def frame_function(self, frame: FrameType) -> Callable:
+        code = frame.f_code
+        ref = self._resolved.get(code)
+        function = ref() if ref is not None else None
+        if function is None:
+            function = self.search_func(code.co_name, frame)
+            if function is None:
+                function = self.create_function(frame)
+            self._resolved[code] = weak_reference(function)
+        return function
 
     def collect(self, frame: FrameType, event: str, arg: Any) -> None:
-        name = frame.f_code.co_name
-        function = self.search_func(name, frame)
-        if function is None:
-            function = self.create_function(frame)
+        function = self.frame_function(frame)
         location = (function, frame.f_lineno)
         self._coverage.add(location)
 
@@ -30,6 +43,15 @@ class CoverageCollector(Collector, StackInspector):
     def coverage(self) -> Coverage:
         return self._coverage
 
+# 함수에 대한 약한 참조 (약한 참조를 지원하지 않는 객체는 그대로 유지)
+def weak_reference(function: Callable) -> Callable[[], Optional[Callable]]:
+    try:
+        if isinstance(function, MethodType):
+            return weakref.WeakMethod(function)
+        return weakref.ref(function)
+    except TypeError:
+        return lambda: function
+
 def code_with_coverage(function: Callable, coverage: Coverage) -> None:
     source_lines, starting_line_number = inspect.getsourcelines(function)
     line_number = starting_line_number
@@ -2,6 +2,7 @@ from types import FrameType, TracebackType, FunctionType
 from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
 import ast
 import random
+from PathCopy import copy_node
 
 class CrossoverOperator:
     
@@ -58,19 +59,33 @@ class CrossoverOperator:
             setattr(t2, body_attr, new_body_2)
             return True
         # 전략 1: 같은 이름을 가진 함수/클래스 쌍을 찾아 교차
-        for child_1 in body_1:
+        for i, child_1 in enumerate(body_1):
             if hasattr(child_1, 'name'):  # 이름 속성이 있는 노드만 검사
-                for child_2 in body_2:
+                for j, child_2 in enumerate(body_2):
                     if hasattr(child_2, 'name') and child_1.name == child_2.name:
-                        if self.crossover_attr(child_1, child_2, body_attr):
+                        if self.crossover_children(t1, t2, body_attr, i, j):
                             return True
         # 전략 2: 랜덤하게 선택된 요소 쌍에 대해 교차 시도
-        for child_1 in random.sample(body_1, len(body_1)):
-            for child_2 in random.sample(body_2, len(body_2)):
-                if self.crossover_attr(child_1, child_2, body_attr):
+        for i in random.sample(range(len(body_1)), len(body_1)):
+            for j in random.sample(range(len(body_2)), len(body_2)):
+                if self.crossover_children(t1, t2, body_attr, i, j):
                     return True
         return False
 
+    # t1, t2의 i, j번째 자식의 복사본끼리 교차하고, 성공하면 복사본으로 교체
+    # (부모 세대의 트리와 공유하는 자식 노드는 바꾸지 않음)
+    def crossover_children(self, t1: ast.AST, t2: ast.AST, body_attr: str,
+                           i: int, j: int) -> bool:
+        body_1 = getattr(t1, body_attr)
+        body_2 = getattr(t2, body_attr)
+        child_1 = copy_node(body_1[i])
+        child_2 = copy_node(body_2[j])
+        if not self.crossover_attr(child_1, child_2, body_attr):
+            return False
+        body_1[i] = child_1
+        body_2[j] = child_2
+        return True
+
     # if-else 노드에서 Crossover 연산
     def crossover_branches(self, t1: ast.AST, t2: ast.AST) -> bool:
         # 입력 노드가 AST 객체인지 확인
@@ -90,9 +105,12 @@ class CrossoverOperator:
             return True  # 교차 성공
         return False  # 교차 실패
 
+    # 두 트리를 교차한 새 트리 쌍을 반환 (t1, t2는 바뀌지 않고, 바뀐 경로의 노드만 복사됨)
     def crossover(self, t1: ast.AST, t2: ast.AST) -> Tuple[ast.AST, ast.AST]:
         assert isinstance(t1, ast.AST)
         assert isinstance(t2, ast.AST)
+        t1 = copy_node(t1)
+        t2 = copy_node(t2)
         for body_attr in ['body', 'orelse', 'finalbody']:
             if self.crossover_attr(t1, t2, body_attr):
                 return t1, t2
@@ -4,27 +4,29 @@ import sys
 import inspect
 import warnings
 from ast import AST
-from StackInspector import StackInspector
+from StackInspector import StackInspector, StaticLocation
 
 class DataTracker(StackInspector):
 
     def __init__(self, log: bool = False) -> None:
         self.log = log
 
-    def set(self, name: str, value: Any, loads: Optional[Set[str]] = None) -> Any:
+    # loc: 계측된 코드가 상수로 전달하는 정적 위치 (없으면 스택에서 위치를 찾음)
+    def set(self, name: str, value: Any, loads: Optional[Set[str]] = None,
+            loc: Optional[StaticLocation] = None) -> Any:
         if self.log:
             caller_func, lineno = self.caller_location()
             print(f"{caller_func.__name__}:{lineno}: setting {name}")
         return value
 
-    def get(self, name: str, value: Any) -> Any:
+    def get(self, name: str, value: Any, loc: Optional[StaticLocation] = None) -> Any:
         if self.log:
             caller_func, lineno = self.caller_location()
             print(f"{caller_func.__name__}:{lineno}: getting {name}")
         return value
 
-    def augment(self, name: str, value: Any) -> Any:
-        self.set(name, self.get(name, value))
+    def augment(self, name: str, value: Any, loc: Optional[StaticLocation] = None) -> Any:
+        self.set(name, self.get(name, value, loc=loc), loc=loc)
         return value
 
     def test(self, cond: AST) -> AST:
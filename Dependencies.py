@@ -1,5 +1,5 @@
 from types import FrameType, TracebackType, FunctionType
-from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, Iterable, cast
 import sys
 import inspect
 import warnings
@@ -7,6 +7,8 @@ from graphviz import Digraph
 import re
 import html
 from StackInspector import StackInspector
+from SourceCache import getsourcelines
+from DependencyGraph import DependencyGraph, DependencyView
 
 Location = Tuple[Callable, int]
 Node = Tuple[str, Location]
@@ -18,17 +20,19 @@ class Dependencies(StackInspector):
     NODE_COLOR = 'peachpuff'
     FONT_NAME = 'Courier'
 
-    def __init__(self, data: Optional[Dependency] = None, control: Optional[Dependency] = None) -> None:
+    # graph: 이미 만들어진 그래프 (예: 의존성 로그에서 읽은 그래프)를 그대로 사용
+    def __init__(self, data: Optional[Dependency] = None, control: Optional[Dependency] = None, *,
+                 graph: Optional[DependencyGraph] = None) -> None:
         if data is None:
             data = {}
         if control is None:
             control = {}
-        self.data = data
-        self.control = control
-        for var in self.data:
-            self.control.setdefault(var, set())
-        for var in self.control:
-            self.data.setdefault(var, set())
+        # 노드를 정수 id로 바꾼 그래프에 저장; data와 control은 그래프 위의 dict 뷰
+        if graph is None:
+            graph = DependencyGraph.from_nodes(data, control)
+        self.graph = graph
+        self.data = self.graph.data
+        self.control = self.graph.control
         self.validate()
 
     def _source(self, node: Node) -> str:
@@ -37,7 +41,7 @@ class Dependencies(StackInspector):
         if not func:
             return ''
         try:
-            source_lines, first_lineno = inspect.getsourcelines(func)
+            source_lines, first_lineno = getsourcelines(func)
         except OSError:
             warnings.warn(f"Couldn't find source " f"for {func} ({func.__name__})")
             return ''
@@ -84,16 +88,7 @@ class Dependencies(StackInspector):
         return self.graph()._repr_mimebundle_(include, exclude)
 
     def all_vars(self) -> Set[Node]:
-        all_vars = set()
-        for var in self.data:
-            all_vars.add(var)
-            for source in self.data[var]:
-                all_vars.add(source)
-        for var in self.control:
-            all_vars.add(var)
-            for source in self.control[var]:
-                all_vars.add(source)
-        return all_vars
+        return self.graph.all_nodes()
 
     def draw_edge(self, g: Digraph, mode: str, node_from: str, node_to: str, **kwargs: Any) -> None:
         if mode == 'flow':
@@ -104,14 +99,16 @@ class Dependencies(StackInspector):
             raise ValueError("`mode` must be 'flow' or 'depend'")
 
     def draw_dependencies(self, g: Digraph, mode: str) -> None:
-        for var in self.all_vars():
+        table = self.graph.table
+        for var_id in self.graph.node_ids():
+            var = table.node(var_id)
             g.node(self.id(var), label=self.label(var), tooltip=self.tooltip(var))
-            if var in self.data:
-                for source in self.data[var]:
-                    self.draw_edge(g, mode, self.id(source), self.id(var))
-            if var in self.control:
-                for source in self.control[var]:
-                    self.draw_edge(g, mode, self.id(source), self.id(var),style='dashed', color='grey')
+            if self.data.is_key(var_id):
+                for source in self.data.sources(var_id):
+                    self.draw_edge(g, mode, self.id(table.node(source)), self.id(var))
+            if self.control.is_key(var_id):
+                for source in self.control.sources(var_id):
+                    self.draw_edge(g, mode, self.id(table.node(source)), self.id(var),style='dashed', color='grey')
 
     def id(self, var: Node) -> str:
         id = ""
@@ -153,7 +150,9 @@ class Dependencies(StackInspector):
 
     def all_functions(self) -> Dict[Callable, List[Tuple[int, Node]]]:
         functions: Dict[Callable, List[Tuple[int, Node]]] = {}
-        for var in self.all_vars():
+        table = self.graph.table
+        for var_id in self.graph.node_ids():
+            var = table.node(var_id)
             (name, location) = var
             func, lineno = location
             if func not in functions:
@@ -164,7 +163,13 @@ class Dependencies(StackInspector):
         return functions
 
     def expand_criteria(self, criteria: List[Criterion]) -> List[Node]:
-        all_vars = []
+        table = self.graph.table
+        return [table.node(var_id) for var_id in self.criteria_ids(criteria)]
+
+    # 기준에 맞는 노드 id (이름, 함수, 위치별 색인에서 찾음)
+    def criteria_ids(self, criteria: List[Criterion]) -> List[int]:
+        index = self.graph.index()
+        var_ids = []
         for criterion in criteria:
             criterion_var = None
             criterion_func = None
@@ -178,42 +183,43 @@ class Dependencies(StackInspector):
                 criterion_func, criterion_lineno = criterion[1]
             else:
                 raise ValueError("Invalid argument")
-            for var in self.all_vars():
-                (var_name, location) = var
-                func, lineno = location
-                name_matches = (criterion_func is None or criterion_func == func or criterion_func.__name__ == func.__name__)
-                location_matches = (criterion_lineno is None or criterion_lineno == lineno)
-                var_matches = (criterion_var is None or criterion_var == var_name)
-                if name_matches and location_matches and var_matches:
-                    all_vars.append(var)
-        return all_vars
+            func_name = criterion_func.__name__ if criterion_func is not None else None
+            var_ids += index.lookup(criterion_var, func_name, criterion_lineno)
+        return var_ids
 
-    def backward_slice(self, *criteria: Criterion, mode: str = 'cd', depth: int = -1) -> 'Dependencies':
-        data = {}
-        control = {}
-        queue = self.expand_criteria(criteria) 
-        seen = set()
-        while len(queue) > 0 and depth != 0:
-            var = queue[0]
-            queue = queue[1:]
-            seen.add(var)
-            if 'd' in mode:
-                data[var] = self.data[var]
-                for next_var in data[var]:
-                    if next_var not in seen:
-                        queue.append(next_var)
-            else:
-                data[var] = set()
-            if 'c' in mode:
-                control[var] = self.control[var]
-                for next_var in control[var]:
-                    if next_var not in seen:
-                        queue.append(next_var)
-            else:
-                control[var] = set()
-            depth -= 1
+    # 주어진 노드들과 그 사이의 의존성(mode에 해당하는 것만)으로 이루어진 그래프
+    def subgraph(self, var_ids: Iterable[int], mode: str = 'cd') -> 'Dependencies':
+        table = self.graph.table
+        var_ids = list(var_ids)
+        included = set(var_ids)
+        data: Dependency = {}
+        control: Dependency = {}
+        for var_id in var_ids:
+            var = table.node(var_id)
+            for (kind, view, deps) in [('d', self.data, data), ('c', self.control, control)]:
+                if kind in mode:
+                    deps[var] = {table.node(dep) for dep in view.sources(var_id) if dep in included}
+                else:
+                    deps[var] = set()
         return Dependencies(data, control)
 
+    # 기준 노드가 (depth 단계 이내에서) 의존하는 모든 노드
+    def backward_slice(self, *criteria: Criterion, mode: str = 'cd', depth: int = -1) -> 'Dependencies':
+        levels = self.graph.reachable(self.criteria_ids(list(criteria)), mode, depth)
+        return self.subgraph(levels, mode)
+
+    # 기준 노드의 값이 (depth 단계 이내에서) 영향을 주는 모든 노드
+    def forward_slice(self, *criteria: Criterion, mode: str = 'cd', depth: int = -1) -> 'Dependencies':
+        levels = self.graph.reachable(self.criteria_ids(list(criteria)), mode, depth, forward=True)
+        return self.subgraph(levels, mode)
+
+    # source에서 sink로 가는 의존성 경로 위의 모든 노드
+    # (source의 순방향 슬라이스와 sink의 역방향 슬라이스의 교집합)
+    def chop(self, source: Criterion, sink: Criterion, *, mode: str = 'cd') -> 'Dependencies':
+        affected = self.graph.reachable(self.criteria_ids([source]), mode, forward=True)
+        relevant = self.graph.reachable(self.criteria_ids([sink]), mode)
+        return self.subgraph((var_id for var_id in relevant if var_id in affected), mode)
+
     def format_var(self, var: Node, current_func: Optional[Callable] = None) -> str:
         name, location = var
         func, lineno = location
@@ -296,9 +302,9 @@ class Dependencies(StackInspector):
             if fn == item or fn.__name__ == item.__name__:
                 func = fn
                 break
-        all_vars = self.all_vars()
-        slice_locations = set(location for (name, location) in all_vars)
-        source_lines, first_lineno = inspect.getsourcelines(func)
+        table = self.graph.table
+        slice_locations = set(table.location(var_id) for var_id in self.graph.node_ids())
+        source_lines, first_lineno = getsourcelines(func)
         n = first_lineno
         for line in source_lines:
             line_location = (func, n)
@@ -335,15 +341,17 @@ class Dependencies(StackInspector):
             n += 1
 
     def validate(self) -> None:
-        assert isinstance(self.data, dict)
-        assert isinstance(self.control, dict)
-        for node in (self.data.keys()) | set(self.control.keys()):
-            var_name, location = node
-            assert isinstance(var_name, str)
-            func, lineno = location
-            assert callable(func)
-            assert isinstance(lineno, int)
-        for var in self.all_vars():
+        assert isinstance(self.data, DependencyView)
+        assert isinstance(self.control, DependencyView)
+        table = self.graph.table
+        for view in (self.data, self.control):
+            for var_id in view.ids():
+                assert isinstance(table.name(var_id), str)
+                func, lineno = table.location(var_id)
+                assert callable(func)
+                assert isinstance(lineno, int)
+        for var_id in self.graph.node_ids():
+            var = table.node(var_id)
             source = self.source(var)
             if not source:
                 continue
@@ -0,0 +1,304 @@
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, Iterable, Iterator, Sequence, MutableMapping, cast
+from array import array
+from itertools import accumulate
+from collections import deque
+
+Location = Tuple[Callable, int]
+Node = Tuple[str, Location]
+
+NODE_KEY_SHIFT = 32  # (이름 id, 함수 id, 줄 번호)를 정수 하나로 합칠 때의 이동 비트 수
+
+# 노드 (변수 이름, (함수, 줄 번호))를 정수 id로 바꾸는 표
+# 이름과 함수는 한 번씩만 저장하고, 노드는 (이름 id, 함수 id, 줄 번호) 배열로 저장
+# 노드 튜플은 필요할 때만 만들어짐
+class NodeTable:
+    def __init__(self) -> None:
+        self.names: List[str] = []
+        self.name_ids: Dict[str, int] = {}
+        self.functions: List[Callable] = []
+        self.function_ids: Dict[Callable, int] = {}
+        self.node_names = array('l')  # 노드 id -> 이름 id
+        self.node_functions = array('l')  # 노드 id -> 함수 id
+        self.node_linenos = array('l')  # 노드 id -> 줄 번호
+        self.node_ids: Dict[int, int] = {}  # node_key() -> 노드 id
+
+    def node_key(self, name_id: int, function_id: int, lineno: int) -> int:
+        return (name_id << NODE_KEY_SHIFT | function_id) << NODE_KEY_SHIFT | lineno
+
+    def intern(self, node: Node) -> int:
+        name, (function, lineno) = node
+        name_id = self.name_ids.get(name)
+        if name_id is None:
+            name_id = self.name_ids[name] = len(self.names)
+            self.names.append(name)
+        function_id = self.function_ids.get(function)
+        if function_id is None:
+            function_id = self.function_ids[function] = len(self.functions)
+            self.functions.append(function)
+        key = self.node_key(name_id, function_id, lineno)
+        id = self.node_ids.get(key)
+        if id is None:
+            id = self.node_ids[key] = len(self.node_names)
+            self.node_names.append(name_id)
+            self.node_functions.append(function_id)
+            self.node_linenos.append(lineno)
+        return id
+
+    # 표에 없는 노드이면 None
+    def lookup(self, node: Node) -> Optional[int]:
+        try:
+            name, (function, lineno) = node
+            name_id = self.name_ids.get(name)
+            function_id = self.function_ids.get(function)
+        except (TypeError, ValueError):
+            return None
+        if name_id is None or function_id is None or not isinstance(lineno, int):
+            return None
+        return self.node_ids.get(self.node_key(name_id, function_id, lineno))
+
+    def name(self, id: int) -> str:
+        return self.names[self.node_names[id]]
+
+    def location(self, id: int) -> Location:
+        return self.functions[self.node_functions[id]], self.node_linenos[id]
+
+    def node(self, id: int) -> Node:
+        return self.names[self.node_names[id]], (self.functions[self.node_functions[id]],
+                                                 self.node_linenos[id])
+
+    def __len__(self) -> int:
+        return len(self.node_names)
+
+
+# 노드 id의 보조 색인: 변수 이름별, 함수 이름별, (함수 이름, 줄 번호)별
+# 함수는 이름으로 비교 (같은 이름의 다시 정의된 함수도 같은 함수로 취급)
+class NodeIndex:
+    def __init__(self, table: NodeTable, ids: Iterable[int]) -> None:
+        self.table = table
+        self.ids = ids
+        self.by_name: Dict[str, List[int]] = {}
+        self.by_function: Dict[str, List[int]] = {}
+        self.by_location: Dict[Tuple[str, int], List[int]] = {}
+        function_names = [function.__name__ for function in table.functions]
+        for id in ids:
+            name = table.names[table.node_names[id]]
+            function_name = function_names[table.node_functions[id]]
+            self.by_name.setdefault(name, []).append(id)
+            self.by_function.setdefault(function_name, []).append(id)
+            self.by_location.setdefault((function_name, table.node_linenos[id]), []).append(id)
+
+    # 조건에 맞는 노드 id (None인 조건은 모두 일치)
+    def lookup(self, name: Optional[str] = None, function_name: Optional[str] = None,
+               lineno: Optional[int] = None) -> List[int]:
+        if function_name is not None and lineno is not None:
+            ids: Iterable[int] = self.by_location.get((function_name, lineno), [])
+            lineno = None
+        elif function_name is not None:
+            ids = self.by_function.get(function_name, [])
+        elif name is not None:
+            ids = self.by_name.get(name, [])
+            name = None
+        else:
+            ids = self.ids
+        table = self.table
+        if name is not None:
+            name_id = table.name_ids.get(name)
+            ids = [id for id in ids if table.node_names[id] == name_id]
+        if lineno is not None:
+            ids = [id for id in ids if table.node_linenos[id] == lineno]
+        return list(ids)
+
+
+# CSR 배열: 키 노드 id 순서(order), 노드 id -> targets 시작 위치(offsets), 이어 붙인 의존 대상(targets)
+Edges = Tuple[array, array, array]
+
+def csr(size: int, order: Sequence[int], sources: List[Sequence[int]]) -> Edges:
+    counts = [0] * size
+    for id, deps in zip(order, sources):
+        counts[id] = len(deps)
+    offsets = array('l', accumulate(counts, initial=0))
+    targets = array('l', [0]) * offsets[-1]
+    for id, deps in zip(order, sources):
+        start = offsets[id]
+        targets[start:start + len(deps)] = array('l', deps)
+    return array('l', order), offsets, targets
+
+
+# 한 종류(데이터 또는 제어)의 의존성: 노드 -> 의존하는 노드 집합
+# 간선은 CSR 배열로 저장하고, 기존 Dict[Node, Set[Node]] API는 이 배열 위의 뷰로 제공
+# 생성 후 변경된 노드의 간선은 overlay에 따로 저장
+class DependencyView(MutableMapping):
+    def __init__(self, graph: 'DependencyGraph', edges: Edges) -> None:
+        self.graph = graph
+        self.order, self.offsets, self.targets = edges
+        self.present = bytearray(len(graph.table))  # 노드 id -> 키인지 여부
+        for id in self.order:
+            self.present[id] = 1
+        self.overlay: Dict[int, array] = {}
+
+    def is_key(self, id: int) -> bool:
+        return id < len(self.present) and self.present[id] == 1
+
+    # 노드 id가 의존하는 노드 id 목록
+    def sources(self, id: int) -> Sequence[int]:
+        deps = self.overlay.get(id)
+        if deps is not None:
+            return deps
+        if id + 1 >= len(self.offsets):
+            return ()
+        return self.targets[self.offsets[id]:self.offsets[id + 1]]
+
+    def ids(self) -> Sequence[int]:
+        return self.order
+
+    def __getitem__(self, node: Node) -> Set[Node]:
+        id = self.graph.table.lookup(node)
+        if id is None or not self.is_key(id):
+            raise KeyError(node)
+        table = self.graph.table
+        return {table.node(dep) for dep in self.sources(id)}
+
+    def __setitem__(self, node: Node, deps: Iterable[Node]) -> None:
+        table = self.graph.table
+        id = table.intern(node)
+        self.overlay[id] = array('l', [table.intern(dep) for dep in deps])
+        if not self.is_key(id):
+            if id >= len(self.present):
+                self.present.extend(bytes(id + 1 - len(self.present)))
+            self.present[id] = 1
+            self.order.append(id)
+        self.graph.changed()
+
+    def __delitem__(self, node: Node) -> None:
+        id = self.graph.table.lookup(node)
+        if id is None or not self.is_key(id):
+            raise KeyError(node)
+        self.present[id] = 0
+        self.overlay[id] = array('l')
+        self.order = array('l', [key for key in self.order if key != id])
+        self.graph.changed()
+
+    def __contains__(self, node: Any) -> bool:
+        id = self.graph.table.lookup(node)
+        return id is not None and self.is_key(id)
+
+    def __iter__(self) -> Iterator[Node]:
+        table = self.graph.table
+        return (table.node(id) for id in self.order)
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+
+# 데이터/제어 의존성 그래프: 두 의존성이 같은 노드 표를 공유
+# 변경될 때마다 version이 증가 (노드 집합 등 파생된 값의 캐시를 무효화)
+class DependencyGraph:
+    def __init__(self, table: NodeTable, data: Edges, control: Edges) -> None:
+        self.table = table
+        self.version = 0
+        self._node_ids: Optional[Tuple[int, array]] = None
+        self._users: Dict[str, Tuple[int, array, array]] = {}  # 종류 -> (version, offsets, targets)
+        self._index: Optional[Tuple[int, NodeIndex]] = None
+        self.data = DependencyView(self, data)
+        self.control = DependencyView(self, control)
+
+    # Dict[Node, Set[Node]] 형식의 의존성으로부터 그래프를 만듦
+    # 한쪽에만 있는 키는 다른 쪽에 빈 의존성으로 추가
+    @classmethod
+    def from_nodes(cls, data: Dict[Node, Set[Node]], control: Dict[Node, Set[Node]]) -> 'DependencyGraph':
+        table = NodeTable()
+        edges = []
+        for deps, other in [(data, control), (control, data)]:
+            order = []
+            sources = []
+            for node, dep_nodes in list(deps.items()) + [(node, set()) for node in other if node not in deps]:
+                order.append(table.intern(node))
+                sources.append([table.intern(dep) for dep in dep_nodes])
+            edges.append((order, sources))
+        return cls(table, *(csr(len(table), order, sources) for order, sources in edges))
+
+    def changed(self) -> None:
+        self.version += 1
+
+    def views(self, mode: str) -> List[DependencyView]:
+        views = []
+        if 'd' in mode:
+            views.append(self.data)
+        if 'c' in mode:
+            views.append(self.control)
+        return views
+
+    # 역방향 인접 배열 (CSR): 노드 id -> 그 노드에 의존하는 노드 id
+    def users(self, kind: str) -> Tuple[array, array]:
+        cached = self._users.get(kind)
+        if cached is None or cached[0] != self.version:
+            view = self.data if kind == 'd' else self.control
+            counts = [0] * len(self.table)
+            for id in view.ids():
+                for dep in view.sources(id):
+                    counts[dep] += 1
+            offsets = array('l', accumulate(counts, initial=0))
+            targets = array('l', [0]) * offsets[-1]
+            fill = offsets[:-1]
+            for id in view.ids():
+                for dep in view.sources(id):
+                    targets[fill[dep]] = id
+                    fill[dep] += 1
+            cached = self._users[kind] = (self.version, offsets, targets)
+        return cached[1], cached[2]
+
+    # 시작 노드에서 mode의 의존성을 따라 도달할 수 있는 노드 -> 단계(시작 노드는 0)
+    # 너비 우선 탐색으로 각 노드와 간선을 한 번씩만 방문: O(V + E)
+    # depth: 따라갈 의존성 단계 수 (0이면 시작 노드만, 1이면 직접 의존하는 노드까지, 음수이면 제한 없음)
+    # forward: 의존하는 노드 대신 의존받는 노드(사용처) 방향으로 탐색
+    def reachable(self, start: Iterable[int], mode: str = 'cd', depth: int = -1,
+                  forward: bool = False) -> Dict[int, int]:
+        levels: Dict[int, int] = {}
+        if forward:
+            adjacency = [self.users(kind) for kind in 'dc' if kind in mode]
+            def neighbors(id: int) -> Iterator[int]:
+                for offsets, targets in adjacency:
+                    if id + 1 < len(offsets):
+                        yield from targets[offsets[id]:offsets[id + 1]]
+        else:
+            views = self.views(mode)
+            def neighbors(id: int) -> Iterator[int]:
+                for view in views:
+                    yield from view.sources(id)
+        queue: deque = deque()
+        for id in start:
+            if id not in levels:
+                levels[id] = 0
+                queue.append(id)
+        while queue:
+            id = queue.popleft()
+            level = levels[id] + 1
+            if 0 <= depth < level:
+                continue
+            for next_id in neighbors(id):
+                if next_id not in levels:
+                    levels[next_id] = level
+                    queue.append(next_id)
+        return levels
+
+    # 키와 그 의존 대상인 모든 노드의 id (정렬된 배열, 그래프가 바뀔 때까지 캐시됨)
+    def node_ids(self) -> array:
+        if self._node_ids is None or self._node_ids[0] != self.version:
+            used = bytearray(len(self.table))
+            for view in (self.data, self.control):
+                for id in view.ids():
+                    used[id] = 1
+                    for dep in view.sources(id):
+                        used[dep] = 1
+            self._node_ids = (self.version, array('l', [id for id, flag in enumerate(used) if flag]))
+        return self._node_ids[1]
+
+    # 처음 필요할 때 만들고, 그래프가 바뀌면 다시 만듦
+    def index(self) -> NodeIndex:
+        if self._index is None or self._index[0] != self.version:
+            self._index = (self.version, NodeIndex(self.table, self.node_ids()))
+        return self._index[1]
+
+    def all_nodes(self) -> Set[Node]:
+        table = self.table
+        return {table.node(id) for id in self.node_ids()}
@@ -0,0 +1,197 @@
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, Iterable, IO, cast
+from array import array
+import mmap
+from itertools import accumulate
+import struct
+from RecordedCollector import FunctionResolver, FunctionKey, function_key
+from DependencyGraph import NodeTable, DependencyGraph, Edges, NODE_KEY_SHIFT
+from Dependencies import Dependencies
+
+Location = Tuple[Callable, int]
+Node = Tuple[str, Location]
+
+# 의존성 로그: 헤더 다음에 레코드가 이어짐
+#   F: 함수 (id, qualname, 파일명)   S: 변수 이름 (id, 이름)
+#   N: 노드 (id, 이름 id, 함수 id, 줄 번호)   K: 키 노드 (id)
+#   E: 간선 (종류, 노드 id, 의존 대상 노드 id) - 종류 0은 데이터, 1은 제어
+# 같은 간선은 한 번만 기록되므로 로그 크기는 실행 시간이 아닌 서로 다른 간선 수에 비례
+DEPENDENCY_LOG_MAGIC = b'DEPLOG1\n'
+
+DATA_EDGE = 0
+CONTROL_EDGE = 1
+
+ID = struct.Struct('<I')
+LENGTH = struct.Struct('<H')
+NODE = struct.Struct('<IIII')
+EDGE = struct.Struct('<BII')
+
+def pack_string(s: str) -> bytes:
+    data = s.encode('utf-8', 'backslashreplace')
+    return LENGTH.pack(len(data)) + data
+
+
+# 의존성을 실행 중에 파일에 추가로 기록
+# 메모리에는 이름/함수/노드 id와 이미 기록한 간선만 정수로 유지
+class DependencyLog:
+    def __init__(self, file: Union[str, IO[bytes]]) -> None:
+        if isinstance(file, str):
+            self.filename = file
+            self.file: IO[bytes] = open(file, 'wb')
+        else:
+            self.filename = getattr(file, 'name', None)
+            self.file = file
+        self.file.write(DEPENDENCY_LOG_MAGIC)
+        self.resolver = FunctionResolver()  # 기록한 함수 (같은 프로세스에서 다시 읽을 때 사용)
+        self.name_ids: Dict[str, int] = {}
+        self.function_ids: Dict[FunctionKey, int] = {}
+        self.node_ids: Dict[int, int] = {}
+        self.keys = bytearray()  # 노드 id -> 키로 기록되었는지 여부
+        self.edges: Set[int] = set()  # 기록한 (종류, 노드 id, 대상 id)
+
+    def name_id(self, name: str) -> int:
+        id = self.name_ids.get(name)
+        if id is None:
+            id = self.name_ids[name] = len(self.name_ids)
+            self.file.write(b'S' + ID.pack(id) + pack_string(name))
+        return id
+
+    def function_id(self, function: Callable) -> int:
+        key = function_key(function)
+        id = self.function_ids.get(key)
+        if id is None:
+            id = self.function_ids[key] = len(self.function_ids)
+            self.resolver.add_function(function)
+            qualname, filename = key
+            self.file.write(b'F' + ID.pack(id) + pack_string(qualname) + pack_string(filename))
+        return id
+
+    def node_id(self, node: Node) -> int:
+        name, (function, lineno) = node
+        name_id = self.name_id(name)
+        function_id = self.function_id(function)
+        key = (name_id << NODE_KEY_SHIFT | function_id) << NODE_KEY_SHIFT | lineno
+        id = self.node_ids.get(key)
+        if id is None:
+            id = self.node_ids[key] = len(self.node_ids)
+            self.file.write(b'N' + NODE.pack(id, name_id, function_id, lineno))
+        return id
+
+    # 노드와 그 데이터/제어 의존성을 기록 (Dependencies의 키가 됨)
+    def add(self, node: Node, data: Iterable[Node], control: Iterable[Node]) -> None:
+        id = self.node_id(node)
+        if id >= len(self.keys):
+            self.keys.extend(bytes(id + 1 - len(self.keys)))
+        if not self.keys[id]:
+            self.keys[id] = 1
+            self.file.write(b'K' + ID.pack(id))
+        for kind, deps in [(DATA_EDGE, data), (CONTROL_EDGE, control)]:
+            for dep in deps:
+                dep_id = self.node_id(dep)
+                edge = ((kind << NODE_KEY_SHIFT) | id) << NODE_KEY_SHIFT | dep_id
+                if edge not in self.edges:
+                    self.edges.add(edge)
+                    self.file.write(b'E' + EDGE.pack(kind, id, dep_id))
+
+    def flush(self) -> None:
+        if not self.file.closed:
+            self.file.flush()
+
+    def close(self) -> None:
+        self.file.close()
+
+    # 지금까지 기록한 의존성 (함수는 기록할 때의 함수 객체로 복원)
+    def dependencies(self) -> Dependencies:
+        self.flush()
+        if self.filename is None:
+            raise ValueError("Cannot read back a log without a file name")
+        return load_dependencies(self.filename, resolver=self.resolver)
+
+    def __enter__(self) -> Any:
+        return self
+
+    def __exit__(self, exc_type: Type, exc_value: BaseException, traceback: Any) -> Optional[bool]:
+        self.close()
+        return None
+
+
+# 로그의 레코드를 차례로 반환: (종류, 값들)
+def read_dependency_log(data: Union[bytes, mmap.mmap]) -> Iterable[Tuple[bytes, tuple]]:
+    if data[:len(DEPENDENCY_LOG_MAGIC)] != DEPENDENCY_LOG_MAGIC:
+        raise ValueError("Not a dependency log")
+    pos = len(DEPENDENCY_LOG_MAGIC)
+
+    def string() -> str:
+        nonlocal pos
+        length, = LENGTH.unpack_from(data, pos)
+        pos += LENGTH.size
+        s = bytes(data[pos:pos + length]).decode('utf-8')
+        pos += length
+        return s
+
+    while pos < len(data):
+        tag = data[pos:pos + 1]
+        pos += 1
+        if tag == b'E':
+            values: tuple = EDGE.unpack_from(data, pos)
+            pos += EDGE.size
+        elif tag == b'N':
+            values = NODE.unpack_from(data, pos)
+            pos += NODE.size
+        elif tag == b'K':
+            values = ID.unpack_from(data, pos)
+            pos += ID.size
+        elif tag == b'S':
+            id, = ID.unpack_from(data, pos)
+            pos += ID.size
+            values = (id, string())
+        elif tag == b'F':
+            id, = ID.unpack_from(data, pos)
+            pos += ID.size
+            values = (id, string(), string())
+        else:
+            raise ValueError(f"Invalid record {tag!r} at offset {pos - 1}")
+        yield tag, values
+
+
+# 로그에서 바로 압축된 의존성 그래프를 만듦 (노드 튜플이나 집합을 만들지 않음)
+# 로그는 메모리 매핑으로 두 번 읽음: 간선 수를 센 뒤 CSR 배열을 채움
+def load_dependencies(file: str, resolver: Optional[FunctionResolver] = None) -> Dependencies:
+    if resolver is None:
+        resolver = FunctionResolver()
+    with open(file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        table = NodeTable()
+        names: Dict[int, str] = {}
+        functions: Dict[int, Callable] = {}
+        node_ids = array('l')  # 로그의 노드 id -> 표의 노드 id
+        order = array('l')
+        counts = [array('l'), array('l')]  # 종류별 노드 id -> 간선 수
+        for tag, values in read_dependency_log(data):
+            if tag == b'E':
+                kind, id, dep_id = values
+                counts[kind][node_ids[id]] += 1
+            elif tag == b'K':
+                order.append(node_ids[values[0]])
+            elif tag == b'N':
+                id, name_id, function_id, lineno = values
+                node_ids.append(table.intern((names[name_id], (functions[function_id], lineno))))
+                for kind_counts in counts:
+                    kind_counts.extend([0] * (len(table) - len(kind_counts)))
+            elif tag == b'S':
+                names[values[0]] = values[1]
+            elif tag == b'F':
+                id, qualname, filename = values
+                functions[id] = resolver.resolve((qualname, filename))
+
+        offsets = [array('l', accumulate(kind_counts, initial=0)) for kind_counts in counts]
+        targets = [array('l', [0]) * kind_offsets[-1] for kind_offsets in offsets]
+        fill = [kind_offsets[:-1] for kind_offsets in offsets]
+        for tag, values in read_dependency_log(data):
+            if tag == b'E':
+                kind, id, dep_id = values
+                id = node_ids[id]
+                targets[kind][fill[kind][id]] = node_ids[dep_id]
+                fill[kind][id] += 1
+
+    edges = [cast(Edges, (array('l', order), offsets[kind], targets[kind]))
+             for kind in (DATA_EDGE, CONTROL_EDGE)]
+    return Dependencies(graph=DependencyGraph(table, *edges))
@@ -3,8 +3,9 @@ from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable,
 import inspect
 import itertools
 from DataTracker import DataTracker
-from StackInspector import StackInspector
+from StackInspector import StackInspector, StaticLocation
 from Dependencies import Dependencies
+from DependencyLog import DependencyLog
 
 Location = Tuple[Callable, int]
 Node = Tuple[str, Location]
@@ -14,8 +15,14 @@ class DependencyTracker(DataTracker):
     
     TEST = '<test>'
     
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    # stream: 의존성을 메모리 대신 기록할 의존성 로그 (파일 이름 또는 DependencyLog)
+    def __init__(self, *args: Any, stream: Optional[Union[str, DependencyLog]] = None, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
+        # 파일 이름으로 받은 로그는 이 추적기가 열었으므로 close()에서 닫음
+        self.owns_stream = isinstance(stream, str)
+        if isinstance(stream, str):
+            stream = DependencyLog(stream)
+        self.stream = stream
 
         self.origins: Dict[str, Location] = {}  # 현재 변수가 마지막으로 설정된 위치
         self.data_dependencies: Dependency = {} 
@@ -24,6 +31,7 @@ class DependencyTracker(DataTracker):
         self.last_read: List[str] = []  # 최근에 읽힌 변수 리스트
         self.last_checked_location = (StackInspector.unknown, 1) # 마지막으로 확인된 코드 위치
         self._ignore_location_change = False # 코드 실행 중 위치 변경을 무시할지 여부
+        self.static_locations: Dict[StaticLocation, Location] = {}  # 정적 위치 -> 처음 찾은 코드 위치
         
         self.data: List[List[str]] = [[]]  # Data stack
         self.control: List[List[str]] = [[]]  # Control stack
@@ -31,10 +39,19 @@ class DependencyTracker(DataTracker):
         self.frames: List[Dict[Union[int, str], Any]] = [{}]  # Argument stack
         self.args: Dict[Union[int, str], Any] = {}  # Current args
     
-    def get(self, name: str, value: Any) -> Any:
-        self.check_location()
+    def get(self, name: str, value: Any, loc: Optional[StaticLocation] = None) -> Any:
+        self.check_location(self.resolve_location(loc))
         self.last_read.append(name)
-        return super().get(name, value)
+        return super().get(name, value, loc=loc)
+
+    # 정적 위치가 주어지면 처음 한 번만 스택을 탐색하고, 이후에는 기억해 둔 위치를 사용
+    def resolve_location(self, loc: Optional[StaticLocation]) -> Location:
+        if loc is None:
+            return self.caller_location()
+        location = self.static_locations.get(loc)
+        if location is None:
+            location = self.static_locations[loc] = self.caller_location()
+        return location
 
     def clear_read(self) -> None:
         if self.log:
@@ -45,8 +62,9 @@ class DependencyTracker(DataTracker):
                 f"(from {direct_caller})")
         self.last_read = []
 
-    def check_location(self) -> None:
-        location = self.caller_location()
+    def check_location(self, location: Optional[Location] = None) -> None:
+        if location is None:
+            location = self.caller_location()
         func, lineno = location
         last_func, last_lineno = self.last_checked_location
         if self.last_checked_location != location:
@@ -66,7 +84,8 @@ class DependencyTracker(DataTracker):
     def ignore_location_change(self) -> None:
         self.last_checked_location = self.caller_location()
 
-    def set(self, name: str, value: Any, loads: Optional[Set[str]] = None) -> Any:
+    def set(self, name: str, value: Any, loads: Optional[Set[str]] = None,
+            loc: Optional[StaticLocation] = None) -> Any:
         def add_dependencies(dependencies: Set[Node], vars_read: List[str], tp: str) -> None:
             for var_read in vars_read:
                 if var_read in self.origins:
@@ -81,22 +100,41 @@ class DependencyTracker(DataTracker):
                             f"new {tp} dependency: "
                             f"{name} <= {var_read} "
                             f"({origin_func.__name__}:{origin_lineno})")
-        self.check_location()
-        ret = super().set(name, value)
-        location = self.caller_location()
-        add_dependencies(self.data_dependencies.setdefault
-                        ((name, location), set()),
-                        self.last_read, tp="data")
-        add_dependencies(self.control_dependencies.setdefault
-                        ((name, location), set()),
+        location = self.resolve_location(loc)
+        self.check_location(location)
+        ret = super().set(name, value, loc=loc)
+        node = (name, location)
+        data: Set[Node] = set()
+        control: Set[Node] = set()
+        add_dependencies(data, self.last_read, tp="data")
+        add_dependencies(control,
                         cast(List[str], itertools.chain.from_iterable(self.control)),
                         tp="control")
+        self.add_node(node, data, control)
         self.origins[name] = location
         self.last_read = [name]
         self._ignore_location_change = False
         return ret
 
+    def add_node(self, node: Node, data: Set[Node], control: Set[Node]) -> None:
+        if self.stream is not None:
+            self.stream.add(node, data, control)
+            return
+        self.data_dependencies.setdefault(node, set()).update(data)
+        self.control_dependencies.setdefault(node, set()).update(control)
+
+    def flush(self) -> None:
+        if self.stream is not None:
+            self.stream.flush()
+
+    def close(self) -> None:
+        self.flush()
+        if self.stream is not None and self.owns_stream:
+            self.stream.close()
+
     def dependencies(self) -> Dependencies:
+        if self.stream is not None:
+            return self.stream.dependencies()
         return Dependencies(self.data_dependencies, self.control_dependencies)
 
     def test(self, value: Any) -> Any:
@@ -2,6 +2,8 @@ from types import FrameType, TracebackType, FunctionType
 from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
 from Collector import Collector
 from StatisticalDebugger import StatisticalDebugger
+from BatchCollection import Test, collect_records
+from RecordedCollector import FunctionResolver, replay
 
 class DifferenceDebugger(StatisticalDebugger):
 
@@ -14,6 +16,20 @@ class DifferenceDebugger(StatisticalDebugger):
     def collect_fail(self, *args: Any, **kwargs: Any) -> Collector:
         return self.collect(self.FAIL, *args, **kwargs)
 
+    # 테스트들을 프로세스 풀에서 각자의 수집기로 실행한 뒤 결과를 self.collectors에 합침
+    # tests: (결과, 인자) 튜플(function 필요) 또는 인자 없는 테스트 함수 (예외 발생 시 FAIL)
+    def collect_batch(self, tests: List[Test], function: Optional[Callable] = None, *,
+                      processes: Optional[int] = None, chunksize: int = 16) -> List[Collector]:
+        records = collect_records(self.collector_class, [self.__class__], function, list(tests),
+                                  self.PASS, self.FAIL, processes=processes, chunksize=chunksize,
+                                  scope=self.scope)
+        resolver = FunctionResolver([getattr(item, '__globals__', {})
+                                     for item in [function] + list(tests) if callable(item)])
+        if function is not None:
+            resolver.add_function(function)
+        return [self.add_collector(outcome, replay(data, resolver))
+                for outcome, data in records]
+
     def pass_collectors(self) -> List[Collector]:
         return self.collectors[self.PASS]
 
@@ -35,6 +51,8 @@ class DifferenceDebugger(StatisticalDebugger):
     def __enter__(self) -> Any:
         self.collector = self.collector_class()
         self.collector.add_items_to_ignore([self.__class__])
+        if self.scope is not None:
+            self.collector.set_scope(self.scope)
         self.collector.__enter__()
         return self
 
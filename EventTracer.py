@@ -1,16 +1,25 @@
-from types import FrameType, TracebackType, FunctionType
+from types import FrameType, TracebackType, FunctionType, CodeType
 from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
 import inspect
 import traceback
 import sys
 from ConditionalTracer import ConditionalTracer
+from TraceSink import TraceSink
+from TraceScope import TraceScope
 
 class EventTracer(ConditionalTracer):
 
-    def __init__(self, *, condition: Optional[str] = None, events: List[str] = []) -> None:
+    def __init__(self, *, condition: Optional[str] = None, events: List[str] = [],
+                 functions: Optional[List[Union[Callable, CodeType]]] = None,
+                 lines: Optional[Tuple[int, int]] = None,
+                 sink: Optional[TraceSink] = None,
+                 scope: Optional[TraceScope] = None) -> None:
         self.events = events
         self.last_event_values: Dict[str, Any] = {}
-        super().__init__(condition=condition)
+        super().__init__(condition=condition, functions=functions, lines=lines, sink=sink,
+                         scope=scope)
+        for event in events:
+            self.compile_expr(event)
 
     def events_changed(self, events: List[str], frame: FrameType) -> bool:
         change = False
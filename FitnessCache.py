@@ -0,0 +1,75 @@
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
+from collections import OrderedDict
+import sqlite3
+
+FITNESS_CACHE_SIZE = 10000
+
+# 크기가 제한된(LRU) 적합도 캐시. filename을 주면 sqlite 파일에 저장해 다음 세션에서 재사용
+# suite: 테스트 집합의 지문 (테스트가 바뀌면 저장된 적합도를 사용하지 않음)
+class FitnessCache:
+    def __init__(self, maxsize: int = FITNESS_CACHE_SIZE,
+                 filename: Optional[str] = None, suite: str = '') -> None:
+        self.maxsize = maxsize
+        self.suite = suite
+        self.entries: 'OrderedDict[bytes, float]' = OrderedDict()
+        self.db: Optional[sqlite3.Connection] = None
+        self.unsaved = 0  # 아직 커밋하지 않은 저장 수
+        if filename is not None:
+            self.db = sqlite3.connect(filename)
+            self.db.execute("CREATE TABLE IF NOT EXISTS fitness "
+                            "(suite TEXT, candidate BLOB, fitness REAL, "
+                            "PRIMARY KEY (suite, candidate))")
+
+    def __contains__(self, key: bytes) -> bool:
+        return self.get(key) is not None
+
+    def __getitem__(self, key: bytes) -> float:
+        fitness = self.get(key)
+        if fitness is None:
+            raise KeyError(key)
+        return fitness
+
+    def __setitem__(self, key: bytes, fitness: float) -> None:
+        self.put(key, fitness)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: bytes) -> Optional[float]:
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        if self.db is None:
+            return None
+        row = self.db.execute("SELECT fitness FROM fitness WHERE suite = ? AND candidate = ?",
+                              (self.suite, key)).fetchone()
+        if row is None:
+            return None
+        self.remember(key, row[0])
+        return row[0]
+
+    def put(self, key: bytes, fitness: float) -> None:
+        self.remember(key, fitness)
+        if self.db is not None:
+            self.db.execute("INSERT OR REPLACE INTO fitness VALUES (?, ?, ?)",
+                            (self.suite, key, fitness))
+            self.unsaved += 1
+            if self.unsaved >= 100:
+                self.flush()
+
+    def remember(self, key: bytes, fitness: float) -> None:
+        self.entries[key] = fitness
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def flush(self) -> None:
+        if self.db is not None:
+            self.db.commit()
+        self.unsaved = 0
+
+    def close(self) -> None:
+        self.flush()
+        if self.db is not None:
+            self.db.close()
+            self.db = None
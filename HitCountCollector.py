@@ -0,0 +1,64 @@
+from types import FrameType, TracebackType, FunctionType, CodeType
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
+from array import array
+import dis
+from CoverageCollector import CoverageCollector, Coverage
+
+# 실행 횟수 구간: 1, 2-3, 4-7, 8-15, ... (횟수의 비트 길이)
+def count_bucket(count: int) -> int:
+    return count.bit_length()
+
+def bucket_range(bucket: int) -> Tuple[int, int]:
+    return 1 << (bucket - 1), (1 << bucket) - 1
+
+def last_lineno(code: CodeType) -> int:
+    if hasattr(code, 'co_lines'):  # Python 3.10+
+        lines = [line for _, _, line in code.co_lines() if line is not None]
+    else:
+        lines = [line for _, line in dis.findlinestarts(code)]
+    return max(lines, default=code.co_firstlineno)
+
+
+# 줄마다 실행 횟수를 세는 수집기
+# 횟수는 코드 객체마다 (줄 번호 - 첫 줄 번호)로 색인된 배열에 저장
+# 이벤트: (함수 이름, 줄 번호, 횟수 구간) - 한 번 실행된 반복문과 10,000번 실행된 반복문을 구별
+class HitCountCollector(CoverageCollector):
+    def __init__(self) -> None:
+        super().__init__()
+        self._counts: Dict[CodeType, array] = {}
+        self._functions: Dict[CodeType, Callable] = {}
+
+    def collect(self, frame: FrameType, event: str, arg: Any) -> None:
+        # 'call' 이벤트는 def 줄에서 발생하므로 def 줄의 횟수는 호출 횟수
+        if event != 'line' and event != 'call':
+            return
+        code = frame.f_code
+        counts = self._counts.get(code)
+        if counts is None:
+            size = last_lineno(code) - code.co_firstlineno + 1
+            counts = self._counts[code] = array('Q', bytes(8 * size))
+            self._functions[code] = self.frame_function(frame)
+        offset = frame.f_lineno - code.co_firstlineno
+        if offset >= len(counts):
+            counts.extend([0] * (offset - len(counts) + 1))
+        counts[offset] += 1
+
+    # (함수, 줄 번호) -> 실행 횟수
+    def hit_counts(self) -> Dict[Tuple[Callable, int], int]:
+        hits = {}
+        for code, counts in self._counts.items():
+            function = self._functions[code]
+            for offset, count in enumerate(counts):
+                if count:
+                    hits[(function, code.co_firstlineno + offset)] = count
+        return hits
+
+    def events(self) -> Set[Tuple[str, int, int]]:
+        return {(func.__name__, lineno, count_bucket(count))
+                for (func, lineno), count in self.hit_counts().items()}
+
+    def coverage(self) -> Coverage:
+        return set(self.hit_counts().keys())
+
+    def covered_functions(self) -> Set[Callable]:
+        return set(self._functions.values())
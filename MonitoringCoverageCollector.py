@@ -0,0 +1,130 @@
+from types import FrameType, TracebackType, FunctionType, CodeType
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
+import sys
+from CoverageCollector import CoverageCollector
+
+# PEP 669 (Python 3.12+) 모니터링 API가 없으면 settrace 방식으로 동작
+HAVE_MONITORING = hasattr(sys, 'monitoring')
+
+
+# sys.settrace 대신 sys.monitoring을 사용하는 CoverageCollector
+# 각 (코드, 줄) 위치는 한 번만 보고된 후 비활성화되므로 반복문도 원래 속도로 실행됨
+class MonitoringCoverageCollector(CoverageCollector):
+
+    # 사용할 도구 id 후보 (순서대로 확인): COVERAGE_ID(1), 이름 없는 3, 4, PROFILER_ID(2)
+    # DEBUGGER_ID(0)와 OPTIMIZER_ID(5)는 다른 도구를 위해 남겨 둠
+    TOOL_IDS = [1, 3, 4, 2]
+    # 이 클래스의 수집기가 위치별로 이벤트를 비활성화한 도구 id (마지막 restart_events() 이후)
+    # free_tool_id()는 비활성화 상태를 지우지 않으므로 같은 id를 다시 쓰면 이미 본 위치의 이벤트가 오지 않음
+    disabled_tool_ids: Set[int] = set()
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.tool_id: Optional[int] = None
+        # 코드 객체 -> 대응 함수 (무시할 코드는 None)
+        self._code_functions: Dict[CodeType, Optional[Callable]] = {}
+
+    def code_function(self, code: CodeType, frame: FrameType) -> Optional[Callable]:
+        # 코드 객체마다 한 번만 무시 여부와 함수를 결정
+        if code in self._code_functions:
+            return self._code_functions[code]
+        function: Optional[Callable] = None
+        if self.in_trace_scope(code) and not self.ignored_frame(frame):
+            function = self.search_func(code.co_name, frame)
+            if function is None:
+                function = self.create_function(frame)
+        self._code_functions[code] = function
+        return function
+
+    def ignored_frame(self, frame: FrameType) -> bool:
+        if self.our_frame(frame):
+            return True
+        for item in self.items_to_ignore:
+            if (isinstance(item, type) and 'self' in frame.f_locals and
+                isinstance(frame.f_locals['self'], item)):
+                return True
+            if item.__name__ == frame.f_code.co_name:
+                return True
+        return False
+
+    def _py_start(self, code: CodeType, instruction_offset: int) -> Any:
+        frame = sys._getframe(1)
+        function = self.code_function(code, frame)
+        if function is None:
+            return sys.monitoring.DISABLE
+        # settrace의 'call' 이벤트처럼 함수 정의 줄도 커버리지에 포함
+        self._coverage.add((function, code.co_firstlineno))
+        if self._function is None:
+            # 첫 번째 호출의 함수와 인자 저장
+            self._function = self.create_function(frame)
+            self._args = frame.f_locals.copy()
+            self._argstring = ", ".join([f"{var}={repr(self._args[var])}" for var in self._args])
+        return sys.monitoring.DISABLE
+
+    def _line(self, code: CodeType, lineno: int) -> Any:
+        if code in self._code_functions:
+            function = self._code_functions[code]
+        else:
+            function = self.code_function(code, sys._getframe(1))
+        if function is not None:
+            self._coverage.add((function, lineno))
+        return sys.monitoring.DISABLE
+
+    def __enter__(self) -> Any:
+        if not HAVE_MONITORING:
+            return super().__enter__()
+        # with 문을 실행 중인 프레임은 settrace와 마찬가지로 기록하지 않음
+        frame: Optional[FrameType] = sys._getframe()
+        while frame is not None:
+            self._code_functions[frame.f_code] = None
+            frame = frame.f_back
+        monitoring = sys.monitoring
+        tool_id = self.use_tool_id()
+        monitoring.register_callback(tool_id, monitoring.events.PY_START, self._py_start)
+        monitoring.register_callback(tool_id, monitoring.events.LINE, self._line)
+        if tool_id in self.disabled_tool_ids:
+            # 이전 수집기가 비활성화한 위치를 다시 활성화
+            # restart_events()는 모든 도구의 이벤트를 다시 활성화하므로, 깨끗한 id가 없을 때만 호출
+            monitoring.restart_events()
+            self.disabled_tool_ids.clear()
+        monitoring.set_events(tool_id, monitoring.events.PY_START | monitoring.events.LINE)
+        return self
+
+    # 다른 도구(coverage.py, 중첩된 수집기 등)가 쓰고 있지 않은 도구 id를 예약
+    # 비활성화된 위치가 남아 있지 않은 id를 우선 사용
+    def use_tool_id(self) -> int:
+        monitoring = sys.monitoring
+        free_ids = [tool_id for tool_id in self.TOOL_IDS if monitoring.get_tool(tool_id) is None]
+        free_ids.sort(key=self.disabled_tool_ids.__contains__)
+        for tool_id in free_ids:
+            try:
+                monitoring.use_tool_id(tool_id, self.__class__.__name__)
+            except ValueError:
+                continue
+            self.tool_id = tool_id
+            return tool_id
+        in_use = {tool_id: monitoring.get_tool(tool_id) for tool_id in self.TOOL_IDS}
+        raise RuntimeError(f"No free sys.monitoring tool id for {self.__class__.__name__} "
+                           f"(in use: {in_use})")
+
+    def __exit__(self, exc_tp: Type, exc_value: BaseException, exc_traceback: TracebackType) -> Optional[bool]:
+        if not HAVE_MONITORING:
+            return super().__exit__(exc_tp, exc_value, exc_traceback)
+        monitoring = sys.monitoring
+        tool_id = self.tool_id
+        assert tool_id is not None
+        monitoring.set_events(tool_id, monitoring.events.NO_EVENTS)
+        monitoring.register_callback(tool_id, monitoring.events.PY_START, None)
+        monitoring.register_callback(tool_id, monitoring.events.LINE, None)
+        monitoring.free_tool_id(tool_id)
+        self.disabled_tool_ids.add(tool_id)
+        self.tool_id = None
+        if not self._function:
+            if exc_tp:
+                return False
+            else:
+                raise ValueError("No call collected")
+        if self.is_internal_error(exc_tp, exc_value, exc_traceback):
+            return False
+        else:
+            return None
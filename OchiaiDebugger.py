@@ -1,21 +1,8 @@
 from types import FrameType, TracebackType, FunctionType
 from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
-import math
 from ContinuousSpectrumDebugger import ContinuousSpectrumDebugger
 from RankingDebugger import RankingDebugger
 
 class OchiaiDebugger(ContinuousSpectrumDebugger, RankingDebugger):
-    def suspiciousness(self, event: Any) -> Optional[float]:
-        failed = len(self.collectors_with_event(event, self.FAIL))
-        not_in_failed = len(self.collectors_without_event(event, self.FAIL))
-        passed = len(self.collectors_with_event(event, self.PASS))
-        try:
-            return failed / math.sqrt((failed + not_in_failed) * (failed + passed))
-        except ZeroDivisionError:
-            return None
 
-    def hue(self, event: Any) -> Optional[float]:
-        suspiciousness = self.suspiciousness(event)
-        if suspiciousness is None:
-            return None
-        return 1 - suspiciousness
\ No newline at end of file
+    FORMULA = 'ochiai'
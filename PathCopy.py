@@ -0,0 +1,78 @@
+from types import FrameType, TracebackType, FunctionType
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
+import ast
+from StructuralHash import forget_hash
+from StatementIndex import forget_index
+
+# 루트에서 노드까지의 경로: (부모 노드, 필드 이름, 리스트 인덱스 또는 None)
+Path = List[Tuple[ast.AST, str, Optional[int]]]
+
+# 수리 후보들은 변경되지 않는 트리로 취급하고, 바뀐 부분만 복사해 나머지 서브트리는 공유함
+# (트리 전체를 deepcopy하지 않음)
+
+# 노드의 얕은 복사본. 리스트 필드는 새 리스트로 복사하므로 복사본의 자식을 바꿔도 원본은 그대로
+def copy_node(node: ast.AST) -> ast.AST:
+    new_node = node.__class__.__new__(node.__class__)
+    new_node.__dict__.update(node.__dict__)
+    for name, value in ast.iter_fields(node):
+        if isinstance(value, list):
+            setattr(new_node, name, list(value))
+    forget_hash(new_node)
+    forget_index(new_node)
+    return new_node
+
+# tree에서 target 노드까지의 경로를 반환 (없으면 None)
+# 문장은 식 안에 들어 있을 수 없으므로, target이 문장이면 식은 탐색하지 않음
+def node_path(tree: ast.AST, target: ast.AST) -> Optional[Path]:
+    skip = ast.expr if isinstance(target, ast.stmt) else ()
+    return _node_path(tree, target, skip)
+
+def _node_path(node: ast.AST, target: ast.AST, skip: Any) -> Optional[Path]:
+    if node is target:
+        return []
+    for name, value in ast.iter_fields(node):
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                if isinstance(item, ast.AST) and not isinstance(item, skip):
+                    path = _node_path(item, target, skip)
+                    if path is not None:
+                        return [(node, name, index)] + path
+        elif isinstance(value, ast.AST) and not isinstance(value, skip):
+            path = _node_path(value, target, skip)
+            if path is not None:
+                return [(node, name, None)] + path
+    return None
+
+# 경로 끝의 노드를 replacement로 바꾼 새 트리를 반환. 경로 위의 노드만 복사함
+# replacement는 NodeTransformer와 같이 노드, 노드 리스트(여러 문장으로 교체) 또는 None(삭제)
+def replace_node(tree: ast.AST, path: Path,
+                 replacement: Union[ast.AST, List[ast.AST], None]) -> ast.AST:
+    if not path:
+        assert isinstance(replacement, ast.AST), "Cannot replace the root by a list"
+        return replacement
+    root = copy_node(tree)
+    parent = root
+    for depth, (_, name, index) in enumerate(path):
+        value = getattr(parent, name)
+        if depth < len(path) - 1:  # 경로 중간: 자식을 복사해 연결
+            if index is None:
+                child = copy_node(value)
+                setattr(parent, name, child)
+            else:
+                child = copy_node(value[index])
+                value[index] = child
+            parent = child
+        elif index is None:  # 경로 끝: 단일 필드
+            if replacement is None:
+                delattr(parent, name)
+            else:
+                setattr(parent, name, replacement)
+        else:  # 경로 끝: 리스트 필드
+            if replacement is None:
+                new_items = []
+            elif isinstance(replacement, ast.AST):
+                new_items = [replacement]
+            else:
+                new_items = list(replacement)
+            value[index:index + 1] = new_items
+    return root
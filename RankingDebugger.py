@@ -4,15 +4,11 @@ from DiscreteSpectrumDebugger import DiscreteSpectrumDebugger
 
 class RankingDebugger(DiscreteSpectrumDebugger):
     def rank(self) -> List[Any]:
-        
-        def susp(event: Any) -> float:
-            suspiciousness = self.suspiciousness(event)
-            assert suspiciousness is not None
-            return suspiciousness
-        
         events = list(self.all_events())
-        events.sort(key=susp, reverse=True)
-        return events
+        scores = self.all_suspiciousness(events)
+        assert None not in scores
+        order = sorted(range(len(events)), key=scores.__getitem__, reverse=True)
+        return [events[i] for i in order]
 
     def __repr__(self) -> str:
         return repr(self.rank())
\ No newline at end of file
@@ -0,0 +1,142 @@
+from types import FrameType, TracebackType, FunctionType
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
+import sys
+import os
+import pickle
+from Collector import Collector
+
+Coverage = Set[Tuple[Callable, int]]
+FunctionKey = Tuple[str, str]  # (qualname, filename)
+LocationKey = Tuple[str, str, int]  # (qualname, filename, lineno)
+
+# 함수 객체 대신 프로세스/세션 간에 안정적인 (qualname, 파일명) 키를 사용
+def function_key(function: Callable) -> FunctionKey:
+    code = getattr(function, '__code__', None)
+    filename = code.co_filename if code is not None else '<unknown>'
+    qualname = getattr(function, '__qualname__', function.__name__)
+    return qualname, filename
+
+def location_key(location: Tuple[Callable, int]) -> LocationKey:
+    function, lineno = location
+    qualname, filename = function_key(function)
+    return qualname, filename, lineno
+
+def picklable(obj: Any) -> bool:
+    try:
+        pickle.dumps(obj)
+    except Exception:
+        return False
+    return True
+
+
+# (qualname, 파일명) 키를 현재 프로세스의 함수 객체로 되돌림
+class FunctionResolver:
+    def __init__(self, namespaces: Optional[List[Dict[str, Any]]] = None) -> None:
+        self.namespaces = namespaces or []
+        self.functions: Dict[FunctionKey, Callable] = {}
+
+    def add_function(self, function: Callable) -> None:
+        self.functions.setdefault(function_key(function), function)
+
+    # 같은 키를 가진 함수 중 처음 본 함수 (여러 프로세스/샤드의 함수를 하나로 통일)
+    def canonical(self, function: Callable) -> Callable:
+        return self.functions.setdefault(function_key(function), function)
+
+    def resolve(self, key: FunctionKey) -> Callable:
+        if key not in self.functions:
+            function = self.lookup(key)
+            if function is None:
+                function = self.placeholder(key)
+            self.functions[key] = function
+        return self.functions[key]
+
+    def lookup(self, key: FunctionKey) -> Optional[Callable]:
+        qualname, filename = key
+        namespaces = list(self.namespaces)
+        for module in list(sys.modules.values()):
+            module_file = getattr(module, '__file__', None)
+            if module_file and os.path.abspath(module_file) == os.path.abspath(filename):
+                namespaces.append(vars(module))
+        for namespace in namespaces:
+            item: Any = namespace.get(qualname.split('.')[0])
+            for name in qualname.split('.')[1:]:
+                item = getattr(item, name, None)
+            if callable(item) and function_key(item) == key:
+                return item
+        return None
+
+    # 찾을 수 없는 함수(중첩 함수 등)는 같은 이름과 파일명을 가진 빈 함수로 대체
+    def placeholder(self, key: FunctionKey) -> Callable:
+        qualname, filename = key
+        name = qualname.split('.')[-1]
+        code = compile('', filename, 'exec').replace(co_name=name)
+        function = FunctionType(code, {}, name)
+        function.__qualname__ = qualname
+        return function
+
+
+# 다른 프로세스나 파일에서 수집된 실행 결과를 담는 수집기 (추적은 하지 않음)
+class RecordedCollector(Collector):
+    def __init__(self, function: Optional[Callable] = None,
+                 args: Optional[Dict[str, Any]] = None,
+                 argstring: Optional[str] = None,
+                 exception: Optional[Type] = None,
+                 events: Optional[Set[Any]] = None,
+                 coverage: Optional[Coverage] = None) -> None:
+        super().__init__()
+        self._function = function
+        self._args = args
+        self._argstring = argstring
+        self._exception = exception
+        self._events: Set[Any] = events if events is not None else set()
+        self._coverage: Coverage = coverage if coverage is not None else set()
+
+    def events(self) -> Set[Any]:
+        return self._events
+
+    def coverage(self) -> Coverage:
+        return self._coverage
+
+    def covered_functions(self) -> Set[Callable]:
+        return {func for func, lineno in self._coverage}
+
+    def __enter__(self) -> Any:
+        raise ValueError("Recorded collectors cannot collect")
+
+
+# 수집기를 함수 객체 없이 피클 가능한 기록(dict)으로 변환
+def record(collector: Collector) -> Dict[str, Any]:
+    args = collector._args
+    exception = collector.exception()
+    return {
+        'function': function_key(collector.function()),
+        'args': args if picklable(args) else None,
+        'argstring': collector._argstring,
+        'exception': exception if picklable(exception) else None,
+        'events': list(collector.events()),
+        'coverage': [location_key(location) for location in collector.coverage()],
+    }
+
+# 기록을 현재 프로세스의 함수 객체를 사용하는 수집기로 복원
+def replay(data: Dict[str, Any], resolver: Optional[FunctionResolver] = None) -> RecordedCollector:
+    if resolver is None:
+        resolver = FunctionResolver()
+    coverage = {(resolver.resolve((qualname, filename)), lineno)
+                for qualname, filename, lineno in data['coverage']}
+    return RecordedCollector(function=resolver.resolve(tuple(data['function'])),  # type: ignore
+                             args=data['args'],
+                             argstring=data['argstring'],
+                             exception=data['exception'],
+                             events=set(data['events']),
+                             coverage=coverage)
+
+# 수집기를 함수 객체가 resolver 기준으로 통일된 기록 수집기로 복사
+def canonical_collector(collector: Collector, resolver: FunctionResolver) -> RecordedCollector:
+    function = collector._function
+    return RecordedCollector(function=resolver.canonical(function) if function else None,
+                             args=collector._args,
+                             argstring=collector._argstring,
+                             exception=collector.exception(),
+                             events=set(collector.events()),
+                             coverage={(resolver.canonical(func), lineno)
+                                       for func, lineno in collector.coverage()})
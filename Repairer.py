@@ -6,6 +6,11 @@ import warnings
 import copy
 import inspect
 import random
+import multiprocessing
+import heapq
+import hashlib
+import marshal
+from types import CodeType
 from StatementVisitor import all_statements_and_functions, all_statements
 from PrintContent import print_content
 from StackInspector import StackInspector
@@ -13,6 +18,11 @@ from RankingDebugger import RankingDebugger
 from StatementMutator import StatementMutator
 from CrossoverOperator import CrossoverOperator, CrossoverError
 from DefinitionVisitor import DefinitionVisitor
+from TestHistory import TestHistory
+from StructuralHash import structural_hash, tree_size
+from FitnessCache import FitnessCache, FITNESS_CACHE_SIZE
+from TestSandbox import Watchdog, sandboxed_call
+from TraceScope import TraceScope
 # from Middle import middle, middle_test, MIDDLE_PASSING_TESTCASES, MIDDLE_FAILING_TESTCASES
 # from OchiaiDebugger import OchiaiDebugger
 
@@ -28,7 +38,14 @@ class Repairer(StackInspector):
                 log: Union[bool, int] = False,
                 mutator_class: Type = StatementMutator, # 변이를 수행할 클래스
                 crossover_class: Type = CrossoverOperator, # 교차를 수행할 클래스
-                globals: Optional[Dict[str, Any]] = None):
+                globals: Optional[Dict[str, Any]] = None,
+                processes: int = 1, # 적합도 평가에 사용할 프로세스 수
+                prioritize: bool = True, # 탈락 비율 순 테스트 실행 및 조기 종료
+                cache_size: int = FITNESS_CACHE_SIZE, # 메모리에 유지할 적합도 캐시 크기
+                cache_file: Optional[str] = None, # 적합도를 저장할 sqlite 파일
+                timeout: Optional[float] = None, # 테스트 케이스별 제한 시간(초)
+                memory_limit: Optional[int] = None, # 테스트 케이스별 추가 메모리 제한(바이트)
+                sandbox: bool = False): # 테스트 케이스를 별도 프로세스에서 실행
 
         # 입력된 디버거가 RankingDebugger인지 검증
         assert isinstance(debugger, RankingDebugger)
@@ -57,11 +74,17 @@ class Repairer(StackInspector):
 
         # 수리 대상 코드 출력 (디버깅용)
         self.log_tree("Target code to be repaired:", self.target_tree)
-        if ast.dump(self.target_tree) != ast.dump(self.source_tree):
+        if structural_hash(self.target_tree) != structural_hash(self.source_tree):
             self.log_tree("Source code to take repairs from:", self.source_tree)
 
-        # 적합도 캐시: 수리 과정에서 계산된 적합도를 저장
-        self.fitness_cache: Dict[str, float] = {}
+        # 테스트 실행 제한: 무한 루프 등으로 멈춘 후보는 실패로 처리
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        # 메모리 제한은 별도 프로세스에서만 적용할 수 있음
+        self.sandbox = sandbox or memory_limit is not None
+
+        # 적합도 캐시: 수리 과정에서 계산된 적합도를 구조 해시 별로 저장
+        self.fitness_cache = FitnessCache(cache_size, cache_file, self.suite_fingerprint())
 
         # 변이, 교차 도구 설정
         self.mutator: StatementMutator = mutator_class(
@@ -75,6 +98,61 @@ class Repairer(StackInspector):
             globals = self.caller_globals()  # 호출자의 globals 값 가져오기
         self.globals = globals
 
+        # 적합도 평가용 작업 프로세스 풀 (processes > 1일 때만 사용)
+        self.processes = processes
+        self.pool: Optional[Any] = None
+
+        # 테스트 우선순위와 조기 종료 설정
+        self.prioritize = prioritize
+        self.test_history = TestHistory()
+        # 선택 기준 적합도: 이보다 낮아질 수밖에 없는 후보는 테스트를 중단
+        self.cutoff: Optional[float] = None
+        self.truncated = False  # 마지막 평가가 조기 종료되었는지 여부
+        # 조기 종료로 얻은 적합도 상한: 현재 선택 기준에서만 유효하므로 세대마다 비움
+        self.fitness_bounds: Dict[bytes, float] = {}
+        self.test_executions = 0  # 실행한 테스트 케이스 수
+
+    # 테스트 집합의 지문: 저장된 적합도는 같은 테스트에 대해서만 재사용
+    def suite_fingerprint(self) -> str:
+        h = hashlib.blake2b(digest_size=16)
+        function = self.debugger.function()
+        h.update(repr(function.__name__ if function else None).encode())
+        h.update(repr((self.timeout, self.memory_limit)).encode())
+        for test_set in [self.debugger.PASS, self.debugger.FAIL]:
+            h.update(repr((test_set, self.weight(test_set))).encode())
+            for c in self.debugger.collectors[test_set]:
+                h.update(c.argstring().encode() + b'\0')
+        # 테스트나 보조 함수의 코드가 바뀌면 저장된 적합도를 재사용하지 않음
+        for source in self.test_sources():
+            h.update(source + b'\0')
+        return h.hexdigest()
+
+    # 테스트 진입 함수와, 그 함수가 (간접적으로) 사용하는 수리 대상이 아닌 전역 함수/클래스의 소스
+    # 수리 대상은 후보의 구조 해시에 이미 포함되고, 라이브러리 코드는 따라가지 않음
+    def test_sources(self) -> List[bytes]:
+        targets = set(self.toplevel_defs(self.target_tree))
+        user_code = TraceScope(exclude_libraries=True)
+        sources = []
+        seen: Set[int] = set()
+        stack: List[Any] = [self.debugger.function()]
+        while stack:
+            item = stack.pop()
+            if id(item) in seen:
+                continue
+            seen.add(id(item))
+            sources.append(item_source(item))
+            if not isinstance(item, FunctionType):
+                continue
+            for name in sorted(code_names(item.__code__), reverse=True):
+                value = item.__globals__.get(name)
+                if name in targets or id(value) in seen:
+                    continue
+                if isinstance(value, FunctionType) and user_code.contains(value.__code__):
+                    stack.append(value)
+                elif isinstance(value, type) and value.__module__ == item.__module__:
+                    stack.append(value)
+        return sources
+
     # 주어진 함수의 소스 코드를 반환
     def getsource(self, item: Union[str, Any]) -> str:
         if isinstance(item, str):  # 문자열이면
@@ -118,34 +196,54 @@ class Repairer(StackInspector):
             tree.body += item_tree.body  # 합쳐진 트리의 body에 추가
         return tree
 
+    # 테스트 케이스 하나를 실행하고 통과 여부를 반환
+    def run_test(self, test_set: str, c: Any, function: Callable, validate: bool = False) -> bool:
+        self.test_executions += 1
+        if self.log >= 4:  # 로그 수준이 4 이상이면 테스트 시작 메시지 출력
+            print(f"Testing {c.id()}...", end="")
+        try:
+            # 테스트 케이스 실행: 함수에 테스트 케이스의 인자 전달
+            self.call_test(function, c.args())
+        except Exception as err:
+            # 테스트 실패 시 처리
+            if self.log >= 4:  # 로그 수준이 4 이상이면 실패 메시지 출력
+                print(f"failed ({err.__class__.__name__})")
+            # `validate`가 True이고, 통과해야 할 테스트(PASS)가 실패한 경우 오류 발생
+            if validate and test_set == self.debugger.PASS:
+                raise err.__class__(
+                    f"{c.id()} should have passed, but failed")
+            return False
+        if self.log >= 4:  # 로그 수준이 4 이상이면 통과 메시지 출력
+            print("passed")
+        # `validate`가 True이고, 실패해야 할 테스트(FAIL)가 통과한 경우 오류 발생
+        if validate and test_set == self.debugger.FAIL:
+            raise FailureNotReproducedError(
+                f"{c.id()} should have failed, but passed")
+        return True
+
+    # 제한 시간/메모리 제한을 적용해 테스트 케이스 하나를 실행
+    # 제한을 넘으면 TestTimeout 또는 MemoryError가 발생하고, 테스트는 실패로 처리됨
+    def call_test(self, function: Callable, args: Dict[str, Any]) -> None:
+        if self.sandbox:
+            sandboxed_call(function, args, timeout=self.timeout,
+                           memory_limit=self.memory_limit)
+        elif self.timeout is not None:
+            with Watchdog(self.timeout):
+                function(**args)
+        else:
+            function(**args)
+
     # 주어진 테스트 집합을 실행
-    def run_test_set(self, test_set: str, validate: bool = False) -> int:
+    def run_test_set(self, test_set: str, validate: bool = False,
+                     function: Optional[Callable] = None) -> int:
         passed = 0  # 통과한 테스트 수 초기화
         collectors = self.debugger.collectors[test_set]  # 테스트 케이스 수집기 목록
-        function = self.debugger.function()  # 디버거에서 함수 가져오기
+        if function is None:
+            function = self.debugger.function()  # 디버거에서 함수 가져오기
         assert function is not None  # 함수가 None이 아닌지 확인
         for c in collectors:  # 테스트 케이스마다 실행
-            if self.log >= 4:  # 로그 수준이 4 이상이면 테스트 시작 메시지 출력
-                print(f"Testing {c.id()}...", end="")
-            try:
-                # 테스트 케이스 실행: 함수에 테스트 케이스의 인자 전달
-                function(**c.args())
-            except Exception as err:
-                # 테스트 실패 시 처리
-                if self.log >= 4:  # 로그 수준이 4 이상이면 실패 메시지 출력
-                    print(f"failed ({err.__class__.__name__})")
-                # `validate`가 True이고, 통과해야 할 테스트(PASS)가 실패한 경우 오류 발생
-                if validate and test_set == self.debugger.PASS:
-                    raise err.__class__(
-                        f"{c.id()} should have passed, but failed")
-                continue  # 다음 테스트 케이스로 이동
-            passed += 1  # 테스트 통과 수 증가
-            if self.log >= 4:  # 로그 수준이 4 이상이면 통과 메시지 출력
-                print("passed")
-            # `validate`가 True이고, 실패해야 할 테스트(FAIL)가 통과한 경우 오류 발생
-            if validate and test_set == self.debugger.FAIL:
-                raise FailureNotReproducedError(
-                    f"{c.id()} should have failed, but passed")
+            if self.run_test(test_set, c, function, validate=validate):
+                passed += 1  # 테스트 통과 수 증가
         return passed  # 통과한 테스트 수 반환
 
     # 주어진 테스트 집합의 가중치(Weight)를 반환
@@ -155,15 +253,55 @@ class Repairer(StackInspector):
             self.debugger.FAIL: WEIGHT_FAILING   # FAIL 테스트에 대한 가중치
         }[test_set]
 
-    # 테스트를 실행하고, 가중치를 적용한 적합도(fitness)를 반환
-    def run_tests(self, validate: bool = False) -> float:
+    # 통과한 테스트 수로부터 적합도를 계산
+    def weighted_fitness(self, passed: Dict[str, int]) -> float:
         fitness = 0.0  # 초기 적합도 점수
-        # PASS 및 FAIL 테스트 실행
         for test_set in [self.debugger.PASS, self.debugger.FAIL]:
-            passed = self.run_test_set(test_set, validate=validate)  # 통과한 테스트 수
-            ratio = passed / len(self.debugger.collectors[test_set])  # 통과 비율 계산
+            ratio = passed[test_set] / len(self.debugger.collectors[test_set])  # 통과 비율 계산
             fitness += self.weight(test_set) * ratio  # 가중치를 곱해 적합도 점수 계산
-        return fitness  # 최종 적합도 점수 반환
+        return fitness
+
+    # 테스트를 실행하고, 가중치를 적용한 적합도(fitness)를 반환
+    def run_tests(self, validate: bool = False, function: Optional[Callable] = None) -> float:
+        if self.prioritize and not validate:
+            return self.run_prioritized_tests(function)
+        passed = {}
+        # PASS 및 FAIL 테스트 실행
+        for test_set in [self.debugger.PASS, self.debugger.FAIL]:
+            passed[test_set] = self.run_test_set(test_set, validate=validate, function=function)  # 통과한 테스트 수
+        return self.weighted_fitness(passed)  # 최종 적합도 점수 반환
+
+    # 후보를 자주 탈락시키는 테스트부터 실행하고, 도달 가능한 최대 적합도가
+    # 선택 기준(cutoff)보다 낮아지면 중단. 중단한 경우 최대 적합도(상한)를 반환
+    def run_prioritized_tests(self, function: Optional[Callable] = None) -> float:
+        if function is None:
+            function = self.debugger.function()
+        assert function is not None
+        collectors = self.debugger.collectors
+        test_sets = [self.debugger.PASS, self.debugger.FAIL]
+        tests = [(test_set, i) for test_set in test_sets
+                 for i in range(len(collectors[test_set]))]
+
+        def test_weight(test: Any) -> float:
+            test_set, i = test
+            return self.weight(test_set) / len(collectors[test_set])
+
+        passed = {test_set: 0 for test_set in test_sets}
+        remaining = {test_set: len(collectors[test_set]) for test_set in test_sets}
+        for test in self.test_history.order(tests, test_weight):
+            test_set, i = test
+            outcome = self.run_test(test_set, collectors[test_set][i], function)
+            self.test_history.record(test, outcome)
+            remaining[test_set] -= 1
+            if outcome:
+                passed[test_set] += 1
+            elif self.cutoff is not None:
+                reachable = self.weighted_fitness(
+                    {test_set: passed[test_set] + remaining[test_set] for test_set in test_sets})
+                if reachable < self.cutoff:
+                    self.truncated = True
+                    return reachable
+        return self.weighted_fitness(passed)
 
     # 테스트 결과를 검증
     def validate(self) -> None:
@@ -172,22 +310,42 @@ class Repairer(StackInspector):
 
     # 주어진 수리 후보(tree)의 적합도(fitness)를 계산
     def fitness(self, tree: ast.AST) -> float:
-        # AST를 문자열로 변환해 캐시 키 생성
-        key = cast(str, ast.dump(tree))
-        if key in self.fitness_cache:  # 캐시에 이미 결과가 있으면 반환
-            return self.fitness_cache[key]
-        # 원래 정의를 저장
-        original_defs: Dict[str, Any] = {}
-        for name in self.toplevel_defs(tree):  # 최상위 함수/클래스 정의 찾기
-            if name in self.globals:  # 정의가 globals에 존재하면 저장
-                original_defs[name] = self.globals[name]
-            else:
-                warnings.warn(f"Couldn't find definition of {repr(name)}")
-        assert original_defs, f"Couldn't find any definition"  # 정의가 없으면 오류 발생
+        # AST의 구조 해시를 캐시 키로 사용
+        key = structural_hash(tree)
+        cached = self.fitness_cache.get(key)
+        if cached is None:
+            cached = self.fitness_bounds.get(key)
+        if cached is not None:  # 캐시에 이미 결과가 있으면 반환
+            return cached
         if self.log >= 3:  # 로그 출력
             print("Repair candidate:")
             print_content(ast.unparse(tree), '.py')  # AST를 소스 코드로 출력
             print()
+        fitness = self.evaluate(tree)
+        if self.log >= 3:  # 로그 출력
+            print(f"Fitness = {fitness}")
+        self.remember_fitness(key, fitness, self.truncated)
+        return fitness
+
+    # 적합도 결과를 캐시에 저장
+    # 조기 종료로 얻은 상한은 실제 적합도가 아니므로 캐시 대신 fitness_bounds에 저장
+    def remember_fitness(self, key: bytes, fitness: float, truncated: bool) -> None:
+        if truncated:
+            self.fitness_bounds[key] = fitness
+        else:
+            self.fitness_cache.put(key, fitness)
+
+    # 수리 후보를 원래 정의 대신 설치하고 테스트를 실행해 적합도를 계산 (끝나면 원래 정의로 복원)
+    def evaluate(self, tree: ast.AST) -> float:
+        self.truncated = False
+        # 수리 후보가 정의하는 최상위 함수/클래스 이름
+        names = []
+        for name in self.toplevel_defs(tree):  # 최상위 함수/클래스 정의 찾기
+            if name in self.globals:  # 정의가 globals에 존재하면 교체 대상
+                names.append(name)
+            else:
+                warnings.warn(f"Couldn't find definition of {repr(name)}")
+        assert names, f"Couldn't find any definition"  # 정의가 없으면 오류 발생
         # 수리 후보를 컴파일
         try:
             code = compile(cast(ast.Module, tree), '<Repairer>', 'exec')
@@ -196,27 +354,70 @@ class Repairer(StackInspector):
         if code is None:  # 컴파일 실패 시 적합도 0.0 반환
             if self.log >= 3:
                 print(f"Fitness = 0.0 (compilation error)")
-            fitness = 0.0
-            return fitness
-        # 컴파일된 코드를 실행해 새 정의를 `self.globals`에 설정
-        exec(code, self.globals)
-        # 테스트에서 호출될 함수의 네임스페이스(`__globals__`)에 새 정의 설정
+            return 0.0
+        # 컴파일된 코드를 `self.globals`의 복사본에서 실행해 새 정의 생성
+        namespace = dict(self.globals)
+        exec(code, namespace)
+        # 새 정의를 원래 정의가 있는 모든 네임스페이스에 설정
+        # (테스트 함수의 모듈, `self.globals`, 대상이 정의된 모듈: 테스트가 보조 함수를 거쳐 호출해도 후보가 실행됨)
         function = self.debugger.function()
         assert function is not None
         assert hasattr(function, '__globals__')
-        for name in original_defs:  # 수정된 정의를 함수의 네임스페이스에 복사
-            function.__globals__[name] = self.globals[name]  # type: ignore
-        # 테스트를 실행해 적합도 점수 계산
-        fitness = self.run_tests(validate=False)
-        # 원래 정의로 복원
-        for name in original_defs:
-            function.__globals__[name] = original_defs[name]  # type: ignore
-            self.globals[name] = original_defs[name]
-        if self.log >= 3:  # 로그 출력
-            print(f"Fitness = {fitness}")
-        # 적합도 결과를 캐시에 저장
-        self.fitness_cache[key] = fitness
-        return fitness
+        namespaces = [function.__globals__, self.globals]  # type: ignore
+        for name in names:
+            namespaces.append(getattr(self.globals[name], '__globals__', self.globals))
+        originals: List[Tuple[Dict[str, Any], str, Any]] = []
+        seen: Set[Tuple[int, str]] = set()
+        for name in names:
+            for ns in namespaces:
+                if name in ns and (id(ns), name) not in seen:
+                    seen.add((id(ns), name))
+                    originals.append((ns, name, ns[name]))
+        try:
+            for ns, name, original in originals:
+                ns[name] = namespace[name]
+            # 테스트를 실행해 적합도 점수 계산
+            return self.run_tests(validate=False)
+        finally:
+            # 원래 정의로 복원
+            for ns, name, original in originals:
+                ns[name] = original
+
+    # 캐시되지 않은 후보들의 적합도를 작업 프로세스 풀에서 한꺼번에 계산
+    def evaluate_population(self, population: List[ast.AST]) -> None:
+        if self.pool is None:
+            return
+        candidates: Dict[bytes, str] = {}  # 캐시 키 -> 소스 코드
+        for tree in population:
+            key = structural_hash(tree)
+            if key not in self.fitness_cache and key not in self.fitness_bounds and key not in candidates:
+                candidates[key] = ast.unparse(tree)
+        if not candidates:
+            return
+        tasks = [(source, self.cutoff, self.test_history) for source in candidates.values()]
+        for key, (fitness, truncated, outcomes, executions) in zip(candidates, self.pool.map(_evaluate_source, tasks)):
+            self.remember_fitness(key, fitness, truncated)
+            self.test_history.update(outcomes)
+            self.test_executions += executions
+
+    # fork로 작업 프로세스 풀 시작 (작업 프로세스는 이 Repairer의 복사본을 사용)
+    def start_workers(self) -> None:
+        global _REPAIRER
+        if self.processes <= 1 or self.pool is not None:
+            return
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            warnings.warn("Parallel fitness evaluation needs the 'fork' start method")
+            return
+        _REPAIRER = self
+        self.pool = multiprocessing.get_context('fork').Pool(self.processes)
+
+    def stop_workers(self) -> None:
+        global _REPAIRER
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+            _REPAIRER = None
 
     # tree에서 최상위 함수 및 클래스 정의의 이름 목록을 반환
     def toplevel_defs(self, tree: ast.AST) -> List[str]:
@@ -228,15 +429,28 @@ class Repairer(StackInspector):
     # 초기 개체군을 생성
     def initial_population(self, size: int) -> List[ast.AST]:
         # AST(추상 구문 트리)로 이루어진 개체군 목록 반환
-        return [self.target_tree] + [self.mutator.mutate(copy.deepcopy(self.target_tree)) for i in range(size - 1)]
+        # 변이는 원본 트리를 바꾸지 않으므로 복사하지 않아도 됨
+        return [self.target_tree] + [self.mutator.mutate(self.target_tree) for i in range(size - 1)]
 
     # 결함이 있는 프로그램을 수리
     def repair(self, population_size: int = POPULATION_SIZE, iterations: int = 100) -> Tuple[ast.AST, float]:
+        # 이전 수리의 선택 기준과 그 기준으로 얻은 상한은 이번 개체군에 맞지 않으므로 초기화
+        self.cutoff = None
+        self.truncated = False
+        self.fitness_bounds = {}
         # 테스트 실행 결과 검증
         self.validate()
+        self.start_workers()
+        try:
+            return self._repair(population_size, iterations)
+        finally:
+            self.stop_workers()
+            self.fitness_cache.flush()
+
+    def _repair(self, population_size: int, iterations: int) -> Tuple[ast.AST, float]:
         # 초기 개체군 생성
         population = self.initial_population(population_size)
-        last_key = ast.dump(self.target_tree)  # 마지막 최고 코드 키 저장
+        last_key = structural_hash(self.target_tree)  # 마지막 최고 코드 키 저장
         # 진화 알고리즘 실행
         for iteration in range(iterations):
             population = self.evolve(population)  # 개체군 진화
@@ -249,7 +463,7 @@ class Repairer(StackInspector):
                     f"fitness = {fitness:.5}   \r", end="")
             # 로그 출력 (새로운 최고 코드 발견 시)
             if self.log >= 2:
-                best_key = ast.dump(best_tree)
+                best_key = structural_hash(best_tree)
                 if best_key != last_key:
                     print()
                     print()
@@ -270,15 +484,17 @@ class Repairer(StackInspector):
     def evolve(self, population: List[ast.AST]) -> List[ast.AST]:
         # 개체군의 크기
         n = len(population)
+        # 이전 세대의 선택 기준으로 얻은 상한은 다시 평가
+        self.fitness_bounds = {}
         # 부모 교차를 통해 자식 후보 생성
         offspring: List[ast.AST] = []
         while len(offspring) < n:
-            # 부모 개체 랜덤 선택 및 복사
-            parent_1 = copy.deepcopy(random.choice(population))
-            parent_2 = copy.deepcopy(random.choice(population))
+            # 부모 개체 랜덤 선택 (교차와 변이는 새 트리를 만들므로 복사하지 않음)
+            parent_1 = random.choice(population)
+            parent_2 = random.choice(population)
             try:
                 # 부모 교차 시도
-                self.crossover.crossover(parent_1, parent_2)
+                parent_1, parent_2 = self.crossover.crossover(parent_1, parent_2)
             except CrossoverError:
                 pass  # 교차 실패 시 부모 그대로 유지
             offspring += [parent_1, parent_2]  # 교차 결과 추가
@@ -286,24 +502,71 @@ class Repairer(StackInspector):
         offspring = [self.mutator.mutate(tree) for tree in offspring]
         # 자식 후보를 기존 개체군에 추가
         population += offspring
+        # 부모 세대부터 순서대로 적합도 계산 (병렬 모드에서는 한꺼번에 계산)
+        keys: List[Tuple[float, int]] = []
+        selection: List[float] = []  # 지금까지 평가된 후보 중 상위 n개의 적합도 (최소 힙)
+        for candidates in [population[:n], population[n:]]:
+            self.evaluate_population(candidates)
+            for tree in candidates:
+                keys.append(self.fitness_key(tree))
+                if self.prioritize:
+                    # n번째로 높은 적합도보다 낮아질 후보는 선택될 수 없으므로 이후 평가를 조기 종료
+                    if len(selection) < n:
+                        heapq.heappush(selection, keys[-1][0])
+                    else:
+                        heapq.heappushpop(selection, keys[-1][0])
+                    if len(selection) == n:
+                        self.cutoff = selection[0]
         # 적합도에 따라 개체군 정렬 (내림차순)
-        population.sort(key=self.fitness_key, reverse=True)
+        order = sorted(range(len(population)), key=keys.__getitem__, reverse=True)
         # 상위 n개의 개체만 유지 (기존 개체군 크기 유지)
-        population = population[:n]
+        population = [population[i] for i in order[:n]]
         return population  # 진화된 개체군 반환
 
     # 개체군 정렬 시 사용할 키 값을 반환
     def fitness_key(self, tree: ast.AST) -> Tuple[float, int]:
-        # 트리 크기 계산: AST의 모든 노드 개수를 세어 트리 크기 구하기
-        tree_size = len([node for node in ast.walk(tree)])
-        # 반환 값: (적합도, 트리 크기의 음수)
-        return (self.fitness(tree), -tree_size)
+        # 반환 값: (적합도, 트리 크기의 음수) - 트리 크기는 구조 해시와 함께 계산되어 저장됨
+        return (self.fitness(tree), -tree_size(tree))
 
 
 class FailureNotReproducedError(ValueError):
     pass
 
 
+# 코드 객체(중첩된 함수 포함)가 참조하는 전역 이름
+def code_names(code: CodeType) -> Set[str]:
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= code_names(const)
+    return names
+
+# 함수/클래스의 소스 (소스가 없는 함수는 바이트코드)
+def item_source(item: Any) -> bytes:
+    try:
+        return inspect.getsource(item).encode()
+    except (OSError, TypeError):
+        code = getattr(item, '__code__', None)
+        if code is None:
+            return repr(item).encode()
+        return marshal.dumps(code)
+
+
+# 작업 프로세스가 fork 시점에 물려받는 Repairer
+_REPAIRER: Optional[Repairer] = None
+
+# 작업 프로세스에서 수리 후보 소스 코드의 적합도를 계산
+# (적합도, 조기 종료 여부, 테스트별 결과, 실행한 테스트 수)를 반환
+def _evaluate_source(task: Tuple[str, Optional[float], TestHistory]) -> Tuple[float, bool, List[Tuple[Any, bool]], int]:
+    assert _REPAIRER is not None
+    source, _REPAIRER.cutoff, _REPAIRER.test_history = task
+    _REPAIRER.test_history.log_outcomes = True
+    _REPAIRER.test_executions = 0
+    fitness = _REPAIRER.evaluate(ast.parse(source))
+    return (fitness, _REPAIRER.truncated,
+            _REPAIRER.test_history.clear_outcomes(), _REPAIRER.test_executions)
+
+
 # middle_debugger = OchiaiDebugger()
 # for x, y, z in MIDDLE_PASSING_TESTCASES + MIDDLE_FAILING_TESTCASES:
 #     with middle_debugger:
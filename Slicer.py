@@ -6,6 +6,7 @@ from ast import AST, NodeTransformer
 from Instrumenter import Instrumenter
 from DependencyTracker import DependencyTracker
 from Dependencies import Dependencies
+from DependencyLog import DependencyLog
 from Transformer import *
 from PrintContent import print_content
 
@@ -14,16 +15,20 @@ from PrintContent import print_content
 - `log=2`: Also log execution
 - `log=3`: Also log individual transformer steps
 - `log=4`: Also log source line numbers
+- `stream=<file>`: Append dependencies to an on-disk log instead of keeping them in memory
 """
 
 class Slicer(Instrumenter):
     def __init__(self, *items_to_instrument: Any,
                 dependency_tracker: Optional[DependencyTracker] = None,
                 globals: Optional[Dict[str, Any]] = None,
-                log: Union[bool, int] = False):
+                log: Union[bool, int] = False,
+                stream: Optional[Union[str, DependencyLog]] = None):
+        if stream is not None and dependency_tracker is not None:
+            raise ValueError("Pass either stream or dependency_tracker, not both")
         super().__init__(*items_to_instrument, globals=globals, log=log)
         if dependency_tracker is None:
-            dependency_tracker = DependencyTracker(log=(log > 1))
+            dependency_tracker = DependencyTracker(log=(log > 1), stream=stream)
         self.dependency_tracker = dependency_tracker
         self.saved_dependencies = None
 
@@ -89,6 +94,7 @@ class Slicer(Instrumenter):
     def restore(self) -> None:
         if DATA_TRACKER in self.globals:
             self.saved_dependencies = self.globals[DATA_TRACKER]
+            self.saved_dependencies.close()
             del self.globals[DATA_TRACKER]
         super().restore()
 
@@ -0,0 +1,118 @@
+from types import FrameType, TracebackType, FunctionType, CodeType
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
+import os
+import time
+import inspect
+import itertools
+import linecache
+
+# 파일의 변경 여부(mtime)를 다시 확인하기까지의 최소 간격(초)
+CHECK_INTERVAL = 1.0
+
+# 파일 하나의 소스: 줄 목록, 줄 시작 위치, 함수별 소스 블록
+class SourceFile:
+    def __init__(self, filename: str, lines: List[str], stat: Optional[Tuple[float, int]]) -> None:
+        self.filename = filename
+        self.lines = lines
+        self.stat = stat  # (mtime, 크기) - 실제 파일이 아니면 None
+        self.checked = time.monotonic()
+        self._offsets: Optional[List[int]] = None
+        # 코드 객체 -> (소스 줄 목록, 시작 줄 번호)
+        self.blocks: Dict[CodeType, Tuple[List[str], int]] = {}
+
+    # 각 줄이 파일에서 시작하는 문자 위치 (필요할 때 한 번만 계산)
+    def offsets(self) -> List[int]:
+        if self._offsets is None:
+            self._offsets = [0] + list(itertools.accumulate(len(line) for line in self.lines))
+        return self._offsets
+
+
+def file_stat(filename: str) -> Optional[Tuple[float, int]]:
+    try:
+        st = os.stat(filename)
+    except (OSError, ValueError):
+        return None
+    return st.st_mtime, st.st_size
+
+
+# 파일 이름과 코드 객체별로 소스를 저장하는 캐시
+# 파일이 바뀌면(mtime, 크기) 다시 읽음. 확인은 CHECK_INTERVAL마다 한 번만 수행
+class SourceCache:
+    def __init__(self, check_interval: float = CHECK_INTERVAL) -> None:
+        self.check_interval = check_interval
+        self.files: Dict[str, SourceFile] = {}
+
+    # 파일의 소스 (없으면 OSError)
+    def file(self, filename: str, module_globals: Optional[Dict[str, Any]] = None) -> SourceFile:
+        source_file = self.files.get(filename)
+        if source_file is not None and self.is_stale(source_file):
+            del self.files[filename]
+            linecache.checkcache(filename)
+            source_file = None
+        if source_file is None:
+            lines = linecache.getlines(filename, module_globals)
+            if not lines:
+                raise OSError(f"could not get source code of {filename}")
+            source_file = SourceFile(filename, lines, file_stat(filename))
+            self.files[filename] = source_file
+        return source_file
+
+    def is_stale(self, source_file: SourceFile) -> bool:
+        if source_file.stat is None:
+            return False
+        now = time.monotonic()
+        if now - source_file.checked < self.check_interval:
+            return False
+        source_file.checked = now
+        return file_stat(source_file.filename) != source_file.stat
+
+    def lines(self, filename: str, module_globals: Optional[Dict[str, Any]] = None) -> List[str]:
+        return self.file(filename, module_globals).lines
+
+    # 파일의 lineno번째 줄 (줄바꿈 문자 제외)
+    def line(self, filename: str, lineno: int,
+             module_globals: Optional[Dict[str, Any]] = None) -> str:
+        lines = self.lines(filename, module_globals)
+        if not 1 <= lineno <= len(lines):
+            return ""
+        return lines[lineno - 1].rstrip('\r\n')
+
+    # 파일에서 lineno번째 줄이 시작하는 문자 위치
+    def offset(self, filename: str, lineno: int) -> int:
+        return self.file(filename).offsets()[lineno - 1]
+
+    # inspect.getsourcelines()와 같지만, 함수(코드 객체)별로 결과를 저장
+    def getsourcelines(self, obj: Any) -> Tuple[List[str], int]:
+        code = self.code_object(obj)
+        if code is None:
+            return inspect.getsourcelines(obj)
+        source_file = self.file(code.co_filename)
+        if code not in source_file.blocks:
+            source_file.blocks[code] = inspect.getsourcelines(obj)
+        return source_file.blocks[code]
+
+    def getsource(self, obj: Any) -> str:
+        return ''.join(self.getsourcelines(obj)[0])
+
+    def code_object(self, obj: Any) -> Optional[CodeType]:
+        if inspect.ismethod(obj):
+            obj = obj.__func__
+        if inspect.isfunction(obj):
+            obj = inspect.unwrap(obj).__code__
+        if inspect.iscode(obj):
+            return obj
+        return None
+
+    def clear(self) -> None:
+        self.files = {}
+
+
+# 모든 추적기와 디버거가 함께 사용하는 캐시
+SOURCE_CACHE = SourceCache()
+
+def getsourcelines(obj: Any) -> Tuple[List[str], int]:
+    return SOURCE_CACHE.getsourcelines(obj)
+
+def source_line(filename: str, lineno: int,
+                module_globals: Optional[Dict[str, Any]] = None) -> str:
+    return SOURCE_CACHE.line(filename, lineno, module_globals)
@@ -3,11 +3,16 @@ from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable,
 import inspect
 import html
 from DifferenceDebugger import DifferenceDebugger
+from SourceCache import getsourcelines
 
 class SpectrumDebugger(DifferenceDebugger):
     def suspiciousness(self, event: Any) -> Optional[float]:
         return None
 
+    # 여러 이벤트의 의심도를 한 번에 계산 (하위 클래스에서 벡터화)
+    def all_suspiciousness(self, events: List[Any]) -> List[Optional[float]]:
+        return [self.suspiciousness(event) for event in events]
+
     def tooltip(self, event: Any) -> str:
         return self.percentage(event)
 
@@ -26,7 +31,7 @@ class SpectrumDebugger(DifferenceDebugger):
         out = ""
         seen = set()
         for function in functions:
-            source_lines, starting_line_number = inspect.getsourcelines(function)
+            source_lines, starting_line_number = getsourcelines(function)
             if (function.__name__, starting_line_number) in seen:
                 continue
             seen.add((function.__name__, starting_line_number))
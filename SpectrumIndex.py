@@ -0,0 +1,80 @@
+from types import FrameType, TracebackType, FunctionType
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, Iterable, cast
+
+# 컴파일된 스펙트럼: 이벤트마다 정수 id를 부여하고, (이벤트, 결과)마다
+# 해당 결과의 i번째 실행에서 이벤트가 관찰되었으면 i번째 비트가 켜진 비트셋을 저장
+class SpectrumIndex:
+
+    def __init__(self) -> None:
+        self.event_ids: Dict[Any, int] = {}  # 이벤트 -> 정수 id
+        self.events: List[Any] = []  # 정수 id -> 이벤트
+        self.bitsets: Dict[str, List[int]] = {}  # 결과(outcome) -> 이벤트별 실행 비트셋
+        self.run_counts: Dict[str, int] = {}  # 결과별 실행 횟수
+
+    def event_id(self, event: Any) -> int:
+        if event not in self.event_ids:
+            self.event_ids[event] = len(self.events)
+            self.events.append(event)
+        return self.event_ids[event]
+
+    # 한 번의 실행(run)에서 관찰된 이벤트를 추가하고, 결과 내 실행 번호를 반환
+    def add_run(self, outcome: str, events: Iterable[Any]) -> int:
+        run = self.run_counts.get(outcome, 0)
+        self.run_counts[outcome] = run + 1
+        bitsets = self.bitsets.setdefault(outcome, [])
+        bit = 1 << run
+        for event in events:
+            id = self.event_id(event)
+            if id >= len(bitsets):
+                bitsets.extend([0] * (id + 1 - len(bitsets)))
+            bitsets[id] |= bit
+        return run
+
+    # 다른 인덱스의 실행들을 이 인덱스의 실행 뒤에 이어 붙임 (결과별로 비트를 실행 수만큼 이동)
+    # 실행 순서를 이어 붙이므로 결합 법칙이 성립: (a + b) + c == a + (b + c)
+    def extend(self, other: 'SpectrumIndex') -> None:
+        ids = [self.event_id(event) for event in other.events]
+        for outcome, runs in other.run_counts.items():
+            shift = self.runs(outcome)
+            self.run_counts[outcome] = shift + runs
+            bitsets = self.outcome_bitsets(outcome)
+            self.bitsets[outcome] = bitsets
+            for id, bitset in zip(ids, other.bitsets.get(outcome, [])):
+                if bitset:
+                    bitsets[id] |= bitset << shift
+
+    def outcomes(self) -> List[str]:
+        return list(self.run_counts)
+
+    def runs(self, outcome: str) -> int:
+        return self.run_counts.get(outcome, 0)
+
+    # 결과별 비트셋 목록 (이벤트 id 순서, 길이는 이벤트 수와 같음)
+    def outcome_bitsets(self, outcome: str) -> List[int]:
+        bitsets = self.bitsets.get(outcome, [])
+        if len(bitsets) < len(self.events):
+            bitsets.extend([0] * (len(self.events) - len(bitsets)))
+        return bitsets
+
+    def bitset(self, event: Any, outcome: str) -> int:
+        id = self.event_ids.get(event)
+        if id is None:
+            return 0
+        bitsets = self.bitsets.get(outcome, [])
+        if id >= len(bitsets):
+            return 0
+        return bitsets[id]
+
+    # 이벤트가 나타난 실행 수 (비트셋의 popcount)
+    def count(self, event: Any, outcome: str) -> int:
+        return self.bitset(event, outcome).bit_count()
+
+    # 모든 이벤트에 대한 실행 수 배열 (이벤트 id 순서)
+    def counts(self, outcome: str) -> List[int]:
+        return [bitset.bit_count() for bitset in self.outcome_bitsets(outcome)]
+
+    def __contains__(self, event: Any) -> bool:
+        return event in self.event_ids
+
+    def __len__(self) -> int:
+        return len(self.events)
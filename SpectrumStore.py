@@ -0,0 +1,174 @@
+from types import FrameType, TracebackType, FunctionType
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, IO, cast
+import ast
+import json
+import zlib
+import hashlib
+import importlib
+import warnings
+from StatisticalDebugger import StatisticalDebugger
+from RecordedCollector import RecordedCollector, FunctionResolver, FunctionKey, function_key
+from SourceCache import SOURCE_CACHE
+
+# 저장된 스펙트럼 파일: 헤더 다음에 zlib으로 압축한 JSON 문서
+# 문서는 열(column) 단위로 저장됨
+#   events: 이벤트 사전 (id -> 이벤트), functions: 함수 사전 (id -> (qualname, 파일명))
+#   locations: 커버리지 위치 사전 (id -> (함수 id, 줄 번호))
+#   runs: 실행별 열 - 결과, 함수 id, 인자 문자열, 인자별 repr, 예외, 이벤트/위치 비트셋(16진수)
+#   sources: 파일명 -> 소스 지문 (불러올 때 소스가 바뀌었으면 경고)
+SPECTRUM_MAGIC = b'SPECTRUM1\n'
+
+def source_fingerprint(filename: str) -> Optional[str]:
+    try:
+        lines = SOURCE_CACHE.lines(filename)
+    except OSError:
+        return None
+    return hashlib.blake2b(''.join(lines).encode('utf-8'), digest_size=16).hexdigest()
+
+# 이벤트(튜플, 문자열, 숫자)를 JSON 값으로 변환하고 되돌림
+def encode_event(event: Any) -> Any:
+    if isinstance(event, tuple):
+        return [encode_event(elem) for elem in event]
+    return event
+
+def decode_event(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(decode_event(elem) for elem in value)
+    return value
+
+def encode_bits(ids: List[int]) -> str:
+    bits = 0
+    for id in ids:
+        bits |= 1 << id
+    return format(bits, 'x')
+
+def decode_bits(bits: str) -> List[int]:
+    value = int(bits, 16)
+    ids = []
+    while value:
+        low = value & -value
+        ids.append(low.bit_length() - 1)
+        value ^= low
+    return ids
+
+def exception_name(exception: Optional[Type]) -> Optional[str]:
+    if exception is None:
+        return None
+    return f"{exception.__module__}.{exception.__qualname__}"
+
+def resolve_exception(name: Optional[str]) -> Optional[Type]:
+    if name is None:
+        return None
+    module_name, _, qualname = name.rpartition('.')
+    try:
+        item: Any = importlib.import_module(module_name)
+        for part in qualname.split('.'):
+            item = getattr(item, part)
+    except (ImportError, AttributeError, ValueError):
+        return None
+    return item if isinstance(item, type) else None
+
+# 인자의 repr: 리터럴이면 불러올 때 값으로 되돌릴 수 있음
+def args_reprs(args: Optional[Dict[str, Any]]) -> Optional[Dict[str, str]]:
+    if args is None:
+        return None
+    return {var: repr(value) for var, value in args.items()}
+
+def eval_args(reprs: Optional[Dict[str, str]]) -> Optional[Dict[str, Any]]:
+    if reprs is None:
+        return None
+    try:
+        return {var: ast.literal_eval(value) for var, value in reprs.items()}
+    except (ValueError, SyntaxError):
+        return None
+
+
+# 디버거가 수집한 모든 실행을 파일에 저장
+def save_spectrum(debugger: StatisticalDebugger, file: Union[str, IO[bytes]]) -> None:
+    spectrum = debugger.spectrum_index()
+    function_ids: Dict[FunctionKey, int] = {}
+    location_ids: Dict[Tuple[int, int], int] = {}
+
+    def function_id(function: Callable) -> int:
+        key = function_key(function)
+        if key not in function_ids:
+            function_ids[key] = len(function_ids)
+        return function_ids[key]
+
+    runs: Dict[str, List[Any]] = {column: [] for column in
+                                  ['outcome', 'function', 'argstring', 'args',
+                                   'exception', 'events', 'coverage']}
+    for outcome in debugger.collectors:
+        for collector in debugger.collectors[outcome]:
+            locations = []
+            for function, lineno in collector.coverage():
+                location = (function_id(function), lineno)
+                if location not in location_ids:
+                    location_ids[location] = len(location_ids)
+                locations.append(location_ids[location])
+            runs['outcome'].append(outcome)
+            runs['function'].append(function_id(collector.function()))
+            runs['argstring'].append(collector._argstring)
+            runs['args'].append(args_reprs(collector._args))
+            runs['exception'].append(exception_name(collector.exception()))
+            runs['events'].append(encode_bits([spectrum.event_id(event)
+                                               for event in collector.events()]))
+            runs['coverage'].append(encode_bits(locations))
+
+    functions = sorted(function_ids, key=function_ids.__getitem__)
+    document = {
+        'debugger': debugger.__class__.__name__,
+        'events': [encode_event(event) for event in spectrum.events],
+        'functions': [list(key) for key in functions],
+        'locations': [list(location) for location in
+                      sorted(location_ids, key=location_ids.__getitem__)],
+        'runs': runs,
+        'sources': {filename: source_fingerprint(filename)
+                    for filename in sorted({filename for qualname, filename in functions})},
+    }
+    data = SPECTRUM_MAGIC + zlib.compress(json.dumps(document, separators=(',', ':')).encode('utf-8'))
+    if isinstance(file, str):
+        with open(file, 'wb') as f:
+            f.write(data)
+    else:
+        file.write(data)
+
+# 저장된 실행들로 디버거를 다시 만듦 (테스트를 다시 실행하지 않음)
+# 함수는 현재 프로세스에서 찾을 수 있으면 그 함수로, 없으면 같은 이름의 빈 함수로 복원
+def load_spectrum(file: Union[str, IO[bytes]], debugger_class: Optional[Type] = None,
+                  resolver: Optional[FunctionResolver] = None,
+                  **kwargs: Any) -> StatisticalDebugger:
+    if isinstance(file, str):
+        with open(file, 'rb') as f:
+            data = f.read()
+    else:
+        data = file.read()
+    if not data.startswith(SPECTRUM_MAGIC):
+        raise ValueError("Not a spectrum file")
+    document = json.loads(zlib.decompress(data[len(SPECTRUM_MAGIC):]).decode('utf-8'))
+
+    for filename, fingerprint in document['sources'].items():
+        if fingerprint is not None and source_fingerprint(filename) != fingerprint:
+            warnings.warn(f"{filename} has changed since the spectrum was collected")
+
+    if debugger_class is None:
+        from OchiaiDebugger import OchiaiDebugger
+        debugger_class = OchiaiDebugger
+    if resolver is None:
+        resolver = FunctionResolver()
+    debugger = debugger_class(**kwargs)
+
+    events = [decode_event(event) for event in document['events']]
+    functions = [resolver.resolve(tuple(key)) for key in document['functions']]  # type: ignore
+    locations = [(functions[function_id], lineno) for function_id, lineno in document['locations']]
+    runs = document['runs']
+    for i, outcome in enumerate(runs['outcome']):
+        collector = RecordedCollector(
+            function=functions[runs['function'][i]],
+            args=eval_args(runs['args'][i]),
+            argstring=runs['argstring'][i],
+            exception=resolve_exception(runs['exception'][i]),
+            events={events[id] for id in decode_bits(runs['events'][i])},
+            coverage={locations[id] for id in decode_bits(runs['coverage'][i])})
+        debugger.add_collector(outcome, collector)
+    return debugger
@@ -5,6 +5,7 @@ import traceback
 import warnings
 
 Location = Tuple[Callable, int]
+StaticLocation = Tuple[str, int]  # 계측 시점에 정해지는 (스코프 이름, 줄 번호)
 
 class StackInspector:
     def caller_frame(self) -> FrameType:
@@ -0,0 +1,48 @@
+from types import FrameType, TracebackType, FunctionType
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
+import ast
+import bisect
+import itertools
+import random
+
+# 트리(루트 노드)에 저장되는 문장 색인의 속성 이름
+INDEX_ATTR = '_statement_index'
+
+# 트리의 모든 문장과 의심도 가중치, 누적 가중치 배열
+# 수리 후보는 변경되지 않으므로 트리마다 한 번만 만들고 루트 노드에 저장해 재사용
+class StatementIndex:
+    def __init__(self, statements: List[Tuple[ast.AST, str]], weights: List[float],
+                 owner: Any = None) -> None:
+        self.statements = statements  # (문장, 함수명) 리스트
+        self.weights = weights  # 문장별 의심도
+        self.cumulative = list(itertools.accumulate(weights))  # 누적 가중치
+        self.total = self.cumulative[-1] if self.cumulative else 0.0
+        self.owner = owner  # 가중치를 계산한 주체 (다르면 다시 만듦)
+        self.paths: Dict[int, Any] = {}  # id(문장) -> 루트에서의 경로 (PathCopy.Path)
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+    # 의심도에 비례하는 확률로 문장 하나를 선택 (random.choices()와 같은 결과)
+    def choose(self) -> ast.AST:
+        assert len(self.statements) > 0, "No statements"
+        if self.total == 0.0:
+            # 의심도가 없는 경우, 모든 문장에서 무작위로 선택
+            return random.choice(self.statements)[0]
+        i = bisect.bisect(self.cumulative, random.random() * self.total,
+                          0, len(self.cumulative) - 1)
+        return self.statements[i][0]
+
+
+def get_index(tree: ast.AST, owner: Any = None) -> Optional[StatementIndex]:
+    index = tree.__dict__.get(INDEX_ATTR)
+    if index is None or index.owner is not owner:
+        return None
+    return index
+
+def set_index(tree: ast.AST, index: StatementIndex) -> None:
+    setattr(tree, INDEX_ATTR, index)
+
+# 트리를 복사하거나 변경한 뒤에는 저장된 색인을 지워야 함
+def forget_index(tree: ast.AST) -> None:
+    tree.__dict__.pop(INDEX_ATTR, None)
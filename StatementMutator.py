@@ -8,6 +8,8 @@ import copy
 from ast import NodeTransformer
 from StatementVisitor import all_statements_and_functions, all_statements
 from PrintContent import print_content
+from StatementIndex import StatementIndex, get_index, set_index
+from PathCopy import Path, copy_node, node_path, replace_node
 
 RE_SPACE = re.compile(r'\s+')
     
@@ -39,6 +41,8 @@ class StatementMutator(NodeTransformer):
                 print()
                 print()
         self.mutations = 0  # 변이 횟수 초기화
+        # (함수명, 줄 번호) -> 의심도: 수리 중에는 의심도가 변하지 않으므로 한 번만 계산
+        self.suspiciousness_cache: Dict[Tuple[str, int], float] = {}
 
     # AST 노드의 의심도를 평가
     def node_suspiciousness(self, stmt: ast.AST, func_name: str) -> float:
@@ -47,10 +51,13 @@ class StatementMutator(NodeTransformer):
             warnings.warn(f"{self.format_node(stmt)}: 예상된 줄 번호가 없습니다.")
             return 0.0
         # suspiciousness_func를 호출하여 노드의 의심도 계산
-        suspiciousness = self.suspiciousness_func((func_name, stmt.lineno))
-        if suspiciousness is None:  # 실행되지 않은 경우
-            return 0.0
-        return suspiciousness
+        location = (func_name, stmt.lineno)
+        if location not in self.suspiciousness_cache:
+            suspiciousness = self.suspiciousness_func(location)
+            if suspiciousness is None:  # 실행되지 않은 경우
+                suspiciousness = 0.0
+            self.suspiciousness_cache[location] = suspiciousness
+        return self.suspiciousness_cache[location]
     
     # AST 노드의 문자열 표현을 반환
     def format_node(self, node: ast.AST) -> str:
@@ -66,40 +73,55 @@ class StatementMutator(NodeTransformer):
             s = s[:self.NODE_MAX_LENGTH] + "..."
         return repr(s)  # 문자열 표현을 반환
 
-    # 변이할 AST 노드 선택
-    def node_to_be_mutated(self, tree: ast.AST) -> ast.AST:
+    # 트리의 문장 색인 (문장, 의심도, 누적 가중치)을 반환
+    # 트리 루트에 저장해 두므로 같은 트리를 다시 변이할 때는 탐색과 의심도 계산을 생략
+    def statement_index(self, tree: ast.AST) -> StatementIndex:
+        index = get_index(tree, self)
+        if index is not None:
+            return index
         # 모든 문장과 함수명
         statements = all_statements_and_functions(tree)
         assert len(statements) > 0, "No statements"  # 문장이 없는 경우 예외 처리
         # 각 문장의 의심도를 계산하여 가중치 리스트 생성
-        weights = [self.node_suspiciousness(stmt, func_name) 
+        weights = [self.node_suspiciousness(stmt, func_name)
                 for stmt, func_name in statements]
-        # 문장만 따로 리스트로 추출
-        stmts = [stmt for stmt, func_name in statements]
+        index = StatementIndex(statements, weights, owner=self)
+        set_index(tree, index)
+        return index
+
+    # 루트에서 문장까지의 경로 (트리마다 문장 색인에 저장해 한 번만 탐색)
+    def node_path(self, tree: ast.AST, node: ast.AST) -> Optional[Path]:
+        paths = self.statement_index(tree).paths
+        if id(node) not in paths:
+            paths[id(node)] = node_path(tree, node)
+        return paths[id(node)]
+
+    # 변이할 AST 노드 선택
+    def node_to_be_mutated(self, tree: ast.AST) -> ast.AST:
+        index = self.statement_index(tree)
         # 로깅 모드가 2 이상인 경우, 각 노드의 가중치를 출력
         if self.log > 1:
             print("Weights:")
-            for i, stmt in enumerate(statements):
+            for i, stmt in enumerate(index.statements):
                 node, func_name = stmt
-                print(f"{weights[i]:.2} {self.format_node(node)}")
-        # 모든 가중치의 합이 0인 경우, 가중치 없이 랜덤 선택
-        if sum(weights) == 0.0:
-            # 의심도가 없는 경우, 모든 문장에서 무작위로 선택
-            return random.choice(stmts)
-        else:
-            # 의심도를 가중치로 사용하여 랜덤하게 문장 선택
-            return random.choices(stmts, weights=weights)[0]
+                print(f"{index.weights[i]:.2} {self.format_node(node)}")
+        # 의심도를 가중치로 사용하여 랜덤하게 문장 선택 (누적 가중치에서 이진 탐색)
+        return index.choose()
 
     # 변이 연산 중 하나를 랜덤하게 선택
     def choose_op(self) -> Callable:
         return random.choice([self.insert, self.swap, self.delete])
     
-    # AST 노드를 방문하고 변이 연산을 적용   
+    # AST 노드를 방문하고 `mutate_me` 속성이 설정된 노드에 변이 연산을 적용
     def visit(self, node: ast.AST) -> ast.AST:
         super().visit(node)  # 자식 노드들을 방문 및 변환
         # mutate_me 속성이 없는 경우 원래 노드를 반환
-        if not node.mutate_me:  # type: ignore
+        if not getattr(node, 'mutate_me', False):
             return node
+        return self.mutate_node(node)
+
+    # 노드 하나에 변이 연산을 적용하고 대체할 노드(들)를 반환
+    def mutate_node(self, node: ast.AST) -> Any:
         # 변이 연산 선택 및 적용
         op = self.choose_op()
         new_node = op(node)  # 선택된 연산 실행
@@ -112,8 +134,9 @@ class StatementMutator(NodeTransformer):
         return new_node  # 변이된 노드 반환
 
     # 소스에서 랜덤한 문장을 선택하고 복사하여 반환
+    # 변이 연산은 복사본의 최상위 필드만 바꾸므로 자식 노드는 소스와 공유해도 됨
     def choose_statement(self) -> ast.AST:
-        return copy.deepcopy(random.choice(self.source))
+        return copy_node(random.choice(self.source))
         
     # node를 소스에서 랜덤하게 선택된 노드로 교체
     def swap(self, node: ast.AST) -> ast.AST:
@@ -171,24 +194,23 @@ class StatementMutator(NodeTransformer):
         return None
 
     # 노드 변이 후 변이된 트리를 반환
+    # 원본 트리는 바꾸지 않음: 루트에서 변이된 문장까지의 경로만 복사하고 나머지 서브트리는 공유
     def mutate(self, tree: ast.AST) -> ast.AST:
         assert isinstance(tree, ast.AST)  # 입력이 AST인지 확인
-        tree = copy.deepcopy(tree)  # 원본 트리를 깊은 복사
         # 변이에 사용할 소스 문장이 없는 경우, 트리에서 문장을 수집
         if not self.source:
             self.source = all_statements(tree)
-        # 모든 노드의 `mutate_me` 속성을 초기화 (False 설정)
-        for node in ast.walk(tree):
-            node.mutate_me = False  # type: ignore
-        # 변이할 노드를 선택하고 `mutate_me` 속성을 True로 설정
+        # 변이할 노드를 선택하고 루트에서의 경로를 찾음
         node = self.node_to_be_mutated(tree)
-        node.mutate_me = True  # type: ignore
+        path = self.node_path(tree, node)
+        assert path is not None, "Mutated node not in tree"
         self.mutations = 0  # 변이 횟수 초기화
-        # NodeTransformer의 visit() 호출 → 변이 실행
-        tree = self.visit(tree)
-        # 변이가 적용되지 않은 경우 경고 메시지 출력
-        if self.mutations == 0:
-            warnings.warn("No mutations found")
-        # 누락된 위치 정보를 복구
-        ast.fix_missing_locations(tree)
-        return tree  # 변이된 AST 반환
\ No newline at end of file
+        # 노드의 복사본에 변이 연산 적용 (연산은 노드를 직접 바꿀 수 있음)
+        new_node = self.mutate_node(copy_node(node))
+        # 누락된 위치 정보를 복구 (새로 만들어진 노드에만 해당)
+        new_nodes = new_node if isinstance(new_node, list) else [new_node]
+        for elem in new_nodes:
+            if isinstance(elem, ast.AST):
+                ast.fix_missing_locations(elem)
+        # 경로 위의 노드만 복사한 새 트리 생성
+        return replace_node(tree, path, new_node)  # 변이된 AST 반환
@@ -1,40 +1,82 @@
 from types import FrameType, TracebackType, FunctionType
-from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, IO, cast
 import html
+import io
+import copy
+import math
+import heapq
 from Collector import Collector
 from CoverageCollector import CoverageCollector
+from SpectrumIndex import SpectrumIndex
+from RecordedCollector import FunctionResolver, canonical_collector
+from TraceScope import TraceScope
 from IPython.display import Markdown
 
 Coverage = Set[Tuple[Callable, int]]
 
 class StatisticalDebugger:
-    def __init__(self, collector_class: Type = CoverageCollector, log: bool = False):
+    def __init__(self, collector_class: Type = CoverageCollector, log: bool = False,
+                 scope: Optional[TraceScope] = None):
         self.collector_class = collector_class
+        self.scope = scope  # 수집기가 추적할 코드의 범위
         self.collectors: Dict[str, List[Collector]] = {}
         self.log = log
+        self.spectrum = SpectrumIndex()
+        # 아직 스펙트럼 인덱스에 반영되지 않은 (결과, 수집기) 목록
+        self._unindexed: List[Tuple[str, Collector]] = []
 
     def collect(self, outcome: str, *args: Any, **kwargs: Any) -> Collector:
         collector = self.collector_class(*args, **kwargs)
         collector.add_items_to_ignore([self.__class__])
+        if self.scope is not None:
+            collector.set_scope(self.scope)
         return self.add_collector(outcome, collector)
 
     def add_collector(self, outcome: str, collector: Collector) -> Collector:
         if outcome not in self.collectors:
             self.collectors[outcome] = []
         self.collectors[outcome].append(collector)
+        self._unindexed.append((outcome, collector))
         return collector
 
+    # 수집이 끝난 수집기들을 스펙트럼 인덱스에 점진적으로 반영한 뒤 반환
+    # (collect()로 추가된 수집기는 실행이 끝난 뒤 처음 조회될 때 반영됨)
+    def spectrum_index(self) -> SpectrumIndex:
+        for outcome, collector in self._unindexed:
+            self.spectrum.add_run(outcome, collector.events())
+        self._unindexed = []
+        return self.spectrum
+
+    # 같은 설정(수집기 클래스, 범위, 공식 등)을 가졌지만 실행은 없는 디버거
+    def empty_copy(self) -> 'StatisticalDebugger':
+        debugger = copy.copy(self)
+        debugger.collectors = {}
+        debugger.spectrum = SpectrumIndex()
+        debugger._unindexed = []
+        return debugger
+
+    # 여러 디버거(예: 샤드별 결과)의 실행을 합친 새 디버거를 반환 (원래 디버거는 바뀌지 않음)
+    # 실행은 결과별로 순서대로 이어 붙이므로 결합 법칙이 성립해 트리 형태로 합칠 수 있음
+    # 커버리지의 함수는 함수 객체가 아닌 (qualname, 파일명) 키로 통일됨
+    def merge(self, *others: 'StatisticalDebugger',
+              resolver: Optional[FunctionResolver] = None) -> 'StatisticalDebugger':
+        if resolver is None:
+            resolver = FunctionResolver()
+        merged = self.empty_copy()
+        for debugger in (self,) + others:
+            merged.spectrum.extend(debugger.spectrum_index())
+            for outcome in debugger.collectors:
+                merged.collectors.setdefault(outcome, []).extend(
+                    canonical_collector(collector, resolver)
+                    for collector in debugger.collectors[outcome])
+        return merged
+
     def all_events(self, outcome: Optional[str] = None) -> Set[Any]:
-        all_events = set()
+        spectrum = self.spectrum_index()
         if outcome:
-            if outcome in self.collectors:
-                for collector in self.collectors[outcome]:
-                    all_events.update(collector.events())
-        else:
-            for outcome in self.collectors:
-                for collector in self.collectors[outcome]:
-                    all_events.update(collector.events())
-        return all_events
+            return {event for event, bitset in
+                    zip(spectrum.events, spectrum.outcome_bitsets(outcome)) if bitset}
+        return set(spectrum.events)
 
     def function(self) -> Optional[Callable]:
         names_seen = set()
@@ -77,33 +119,52 @@ class StatisticalDebugger:
         return str(event)
 
     def event_table_text(self, *, args: bool = False, color: bool = False) -> str:
+        out = io.StringIO()
+        self.write_event_table(out, args=args, color=color)
+        return out.getvalue()
+
+    # 이벤트 표를 file에 한 줄씩 출력하고, 출력한 이벤트 수를 반환
+    # 각 칸은 스펙트럼 인덱스의 (이벤트, 결과)별 비트셋에서 바로 계산
+    # top: 의심도가 가장 높은 top개의 이벤트만 의심도 순으로 출력
+    # offset, limit: 정렬된 이벤트 중 offset번째부터 limit개만 출력 (페이지 단위 출력)
+    def write_event_table(self, file: IO[str], *, args: bool = False, color: bool = False,
+                          top: Optional[int] = None, offset: int = 0,
+                          limit: Optional[int] = None) -> int:
         sep = ' | '
-        all_events = self.all_events()
-        longest_event = max(len(f"{self.event_str(event)}") for event in all_events)
-        out = ""
+        spectrum = self.spectrum_index()
+        events = self.table_events(spectrum.events, top)
+        events = events[offset:None if limit is None else offset + limit]
+        event_names = [self.event_str(event) for event in events]
+        longest_event = max((len(name) for name in event_names), default=0)
+
+        header = ""
         if args:
-            out += '| '
+            header += '| '
             func = self.function()
             if func:
-                out += '`' + func.__name__ + '`'
-            out += sep
+                header += '`' + func.__name__ + '`'
+            header += sep
             for name in self.collectors:
                 for collector in self.collectors[name]:
-                    out += '`' + collector.argstring() + '`' + sep
-            out += '\n'
+                    header += '`' + collector.argstring() + '`' + sep
+            header += '\n'
         else:
-            out += '| ' + ' ' * longest_event + sep
+            header += '| ' + ' ' * longest_event + sep
             for name in self.collectors:
-                for i in range(len(self.collectors[name])):
-                    out += name + sep
-            out += '\n'
-        out += '| ' + '-' * longest_event + sep
+                header += (name + sep) * len(self.collectors[name])
+            header += '\n'
+        header += '| ' + '-' * longest_event + sep
         for name in self.collectors:
-            for i in range(len(self.collectors[name])):
-                out += '-' * len(name) + sep
-        out += '\n'
-        for event in sorted(all_events):
-            event_name = self.event_str(event).rjust(longest_event)
+            header += ('-' * len(name) + sep) * len(self.collectors[name])
+        header += '\n'
+        file.write(header)
+
+        # 결과별 칸 모양: 비트셋을 이진 문자열로 바꾼 뒤 '1'/'0'을 칸으로 치환
+        cells = {name: str.maketrans({'1': ' ' * (len(name) - 1) + 'X' + sep,
+                                      '0': ' ' * (len(name) - 1) + '-' + sep})
+                 for name in self.collectors}
+        for event, event_name in zip(events, event_names):
+            event_name = event_name.rjust(longest_event)
             tooltip = self.tooltip(event)
             if tooltip:
                 title = f' title="{tooltip}"'
@@ -116,17 +177,26 @@ class StatisticalDebugger:
                         f'<samp style="background-color: {color_name}"{title}>' \
                         f'{html.escape(event_name)}' \
                         f'</samp>'
-            out += f"| {event_name}" + sep
+            row = [f"| {event_name}" + sep]
             for name in self.collectors:
-                for collector in self.collectors[name]:
-                    out += ' ' * (len(name) - 1)
-                    if event in collector.events():
-                        out += "X"
-                    else:
-                        out += "-"
-                    out += sep
-            out += '\n'
-        return out
+                runs = len(self.collectors[name])
+                bits = format(spectrum.bitset(event, name), 'b').zfill(runs)[::-1][:runs]
+                row.append(bits.translate(cells[name]))
+            row.append('\n')
+            file.write(''.join(row))
+        return len(events)
+
+    # 표에 출력할 이벤트: 기본은 정렬 순서, top이 주어지면 의심도가 높은 순서
+    def table_events(self, events: List[Any], top: Optional[int] = None) -> List[Any]:
+        if top is None:
+            return sorted(events)
+        if not hasattr(self, 'all_suspiciousness'):
+            raise ValueError(f"{self.__class__.__name__} does not rank events")
+        events = sorted(events)
+        scores = self.all_suspiciousness(events)
+        best = heapq.nlargest(top, range(len(events)),
+                              key=lambda i: -math.inf if scores[i] is None else scores[i])
+        return [events[i] for i in best]
 
     def event_table(self, **_args: Any) -> Any:
         return Markdown(self.event_table_text(**_args))
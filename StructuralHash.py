@@ -0,0 +1,45 @@
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
+import ast
+import hashlib
+
+# 노드마다 한 번 계산한 (해시, 서브트리 크기)를 저장하는 속성 이름
+HASH_ATTR = '_structural_hash'
+
+# ast.dump()와 같은 구조(필드만, 위치 정보 제외)에 대한 안정적인 해시
+# 프로세스/세션이 달라도 같은 값이므로 캐시 키로 디스크에 저장할 수 있음
+def structural_hash(node: ast.AST) -> bytes:
+    return _hash_and_size(node)[0]
+
+# ast.walk()로 센 노드 수와 같은 서브트리 크기
+def tree_size(node: ast.AST) -> int:
+    return _hash_and_size(node)[1]
+
+def _hash_and_size(node: ast.AST) -> Tuple[bytes, int]:
+    cached = node.__dict__.get(HASH_ATTR)
+    if cached is not None:
+        return cached
+    h = hashlib.blake2b(type(node).__name__.encode(), digest_size=16)
+    size = 1
+    for name, value in ast.iter_fields(node):
+        h.update(b'\0' + name.encode() + b'=')
+        if isinstance(value, list):
+            h.update(b'[%d' % len(value))
+            for item in value:
+                size += _update(h, item)
+        else:
+            size += _update(h, value)
+    cached = (h.digest(), size)
+    setattr(node, HASH_ATTR, cached)
+    return cached
+
+def _update(h: Any, value: Any) -> int:
+    if isinstance(value, ast.AST):
+        digest, size = _hash_and_size(value)
+        h.update(digest)
+        return size
+    h.update(repr(value).encode() + b'\0')
+    return 0
+
+# 트리를 변경한 뒤에는 저장된 해시를 지워야 함
+def forget_hash(node: ast.AST) -> None:
+    node.__dict__.pop(HASH_ATTR, None)
@@ -0,0 +1,115 @@
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
+import math
+
+# 의심도 공식: 모든 이벤트의 (ef, ep, nf, np) 배열을 받아 의심도 배열을 반환
+# ef/ep: 이벤트가 나타난 실패/통과 실행 수, nf/np: 나타나지 않은 실패/통과 실행 수
+Formula = Callable[[List[int], List[int], List[int], List[int]], List[Optional[float]]]
+Score = Callable[[int, int, int, int], Optional[float]]
+
+FORMULAS: Dict[str, Formula] = {}
+
+# 이벤트 하나에 대한 공식을 배열 전체에 대한 공식으로 변환 (0으로 나누면 None)
+def vectorize(score: Score) -> Formula:
+    def formula(ef: List[int], ep: List[int], nf: List[int], np: List[int]) -> List[Optional[float]]:
+        scores: List[Optional[float]] = []
+        for counts in zip(ef, ep, nf, np):
+            try:
+                scores.append(score(*counts))
+            except ZeroDivisionError:
+                scores.append(None)
+        return scores
+    formula.__name__ = score.__name__
+    return formula
+
+def register_formula(name: str, formula: Formula) -> Formula:
+    FORMULAS[name] = formula
+    return formula
+
+def get_formula(formula: Union[str, Formula]) -> Formula:
+    if callable(formula):
+        return formula
+    if formula not in FORMULAS:
+        raise ValueError(f"Unknown formula {repr(formula)}. "
+                         f"Possible formulas are: {', '.join(sorted(FORMULAS))}")
+    return FORMULAS[formula]
+
+
+def tarantula(ef: int, ep: int, nf: int, np: int) -> Optional[float]:
+    failed = ef / (ef + nf) if ef + nf else 0.0
+    passed = ep / (ep + np) if ep + np else 0.0
+    if failed + passed == 0:
+        return None
+    return failed / (failed + passed)
+
+def ochiai(ef: int, ep: int, nf: int, np: int) -> Optional[float]:
+    return ef / math.sqrt((ef + nf) * (ef + ep))
+
+def jaccard(ef: int, ep: int, nf: int, np: int) -> Optional[float]:
+    return ef / (ef + nf + ep)
+
+def sorensen_dice(ef: int, ep: int, nf: int, np: int) -> Optional[float]:
+    return 2 * ef / (2 * ef + nf + ep)
+
+def kulczynski2(ef: int, ep: int, nf: int, np: int) -> Optional[float]:
+    return (ef / (ef + nf) + ef / (ef + ep)) / 2
+
+def barinel(ef: int, ep: int, nf: int, np: int) -> Optional[float]:
+    return 1 - ep / (ep + ef)
+
+def op2(ef: int, ep: int, nf: int, np: int) -> Optional[float]:
+    return ef - ep / (ep + np + 1)
+
+def russell_rao(ef: int, ep: int, nf: int, np: int) -> Optional[float]:
+    return ef / (ef + nf + ep + np)
+
+def simple_matching(ef: int, ep: int, nf: int, np: int) -> Optional[float]:
+    return (ef + np) / (ef + nf + ep + np)
+
+def ample(ef: int, ep: int, nf: int, np: int) -> Optional[float]:
+    return abs(ef / (ef + nf) - ep / (ep + np))
+
+def zoltar(ef: int, ep: int, nf: int, np: int) -> Optional[float]:
+    if ef == 0:
+        return 0.0
+    return ef / (ef + nf + ep + 10000 * nf * ep / ef)
+
+def wong1(ef: int, ep: int, nf: int, np: int) -> Optional[float]:
+    return float(ef)
+
+# DStar(n): 분모가 0이면 (모든 실패 실행에만 나타난 경우) 무한대
+def dstar(n: int = 2) -> Score:
+    def dstar_n(ef: int, ep: int, nf: int, np: int) -> Optional[float]:
+        if ep + nf == 0:
+            return math.inf if ef > 0 else None
+        return ef ** n / (ep + nf)
+    dstar_n.__name__ = f"dstar{n}"
+    return dstar_n
+
+
+for _score in [tarantula, ochiai, jaccard, sorensen_dice, kulczynski2, barinel,
+               op2, russell_rao, simple_matching, ample, zoltar, wong1]:
+    register_formula(_score.__name__, vectorize(_score))
+register_formula('dstar', vectorize(dstar(2)))
+register_formula('dstar2', vectorize(dstar(2)))
+register_formula('dstar3', vectorize(dstar(3)))
+
+
+# 색상 표시를 위해 의심도를 [0, 1] 범위로 정규화 (무한대는 1.0)
+def normalize(scores: List[Optional[float]]) -> List[Optional[float]]:
+    finite = [s for s in scores if s is not None and not math.isinf(s)]
+    if not finite:
+        return [None if s is None else 1.0 for s in scores]
+    lo, hi = min(finite), max(finite)
+    if lo >= 0.0 and hi <= 1.0:
+        return [None if s is None else min(s, 1.0) for s in scores]
+    normalized: List[Optional[float]] = []
+    for s in scores:
+        if s is None:
+            normalized.append(None)
+        elif math.isinf(s):
+            normalized.append(1.0 if s > 0 else 0.0)
+        elif hi == lo:
+            normalized.append(1.0)
+        else:
+            normalized.append((s - lo) / (hi - lo))
+    return normalized
@@ -0,0 +1,34 @@
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, Hashable, cast
+
+# 테스트별 실행 기록: 수리 후보를 얼마나 자주 탈락시키는지(kill rate)에 따라 테스트 순서를 정함
+class TestHistory:
+    def __init__(self) -> None:
+        self.kills: Dict[Hashable, int] = {}  # 테스트 -> 후보가 실패한 횟수
+        self.runs: Dict[Hashable, int] = {}  # 테스트 -> 실행 횟수
+        self.outcomes: List[Tuple[Hashable, bool]] = []  # 마지막 초기화 이후 기록된 결과
+        self.log_outcomes = False  # 결과를 outcomes에 기록할지 여부 (작업 프로세스용)
+
+    # 라플라스 보정을 적용한 탈락 비율 (처음 보는 테스트는 0.5)
+    def kill_rate(self, test: Hashable) -> float:
+        return (self.kills.get(test, 0) + 1) / (self.runs.get(test, 0) + 2)
+
+    # 기대 손실(탈락 비율 x 가중치)이 큰 테스트부터 정렬
+    def order(self, tests: List[Hashable], weight: Callable[[Hashable], float]) -> List[Hashable]:
+        return sorted(tests, key=lambda test: self.kill_rate(test) * weight(test), reverse=True)
+
+    def record(self, test: Hashable, passed: bool) -> None:
+        self.runs[test] = self.runs.get(test, 0) + 1
+        if not passed:
+            self.kills[test] = self.kills.get(test, 0) + 1
+        if self.log_outcomes:
+            self.outcomes.append((test, passed))
+
+    # 다른 프로세스에서 기록된 결과를 합침
+    def update(self, outcomes: List[Tuple[Hashable, bool]]) -> None:
+        for test, passed in outcomes:
+            self.record(test, passed)
+
+    def clear_outcomes(self) -> List[Tuple[Hashable, bool]]:
+        outcomes = self.outcomes
+        self.outcomes = []
+        return outcomes
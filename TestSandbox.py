@@ -0,0 +1,139 @@
+from types import FrameType, TracebackType, FunctionType
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
+import os
+import sys
+import time
+import pickle
+import signal
+import select
+import threading
+
+try:
+    import resource
+    HAVE_RESOURCE = True
+except ImportError:  # Windows
+    HAVE_RESOURCE = False
+
+HAVE_FORK = hasattr(os, 'fork')
+HAVE_ALARM = hasattr(signal, 'setitimer') and hasattr(signal, 'SIGALRM')
+
+# 제한 시간 안에 끝나지 않은 테스트
+class TestTimeout(Exception):
+    pass
+
+# 테스트 프로세스가 결과를 보내지 못하고 종료된 경우 (시그널, 자원 제한 등)
+class TestCrashed(Exception):
+    pass
+
+
+# 제한 시간이 지나면 실행 중인 코드에 TestTimeout을 발생시키는 감시자 (SIGALRM 사용)
+# 메인 스레드에서만 동작하며, 그 밖의 경우에는 아무 일도 하지 않음
+class Watchdog:
+    def __init__(self, timeout: Optional[float]) -> None:
+        self.timeout = timeout
+        self.active = (timeout is not None and HAVE_ALARM and
+                       threading.current_thread() is threading.main_thread())
+        self.original_handler: Any = None
+
+    def handler(self, signum: int, frame: Optional[FrameType]) -> None:
+        raise TestTimeout(f"Test did not finish within {self.timeout} seconds")
+
+    def __enter__(self) -> Any:
+        if self.active:
+            self.original_handler = signal.signal(signal.SIGALRM, self.handler)
+            # 후보가 예외를 잡아 무시해도 다시 발생하도록 주기적으로 반복
+            signal.setitimer(signal.ITIMER_REAL, self.timeout, self.timeout)  # type: ignore
+        return self
+
+    def __exit__(self, exc_tp: Type, exc_value: BaseException,
+                 exc_traceback: TracebackType) -> Optional[bool]:
+        if self.active:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self.original_handler)
+        return None
+
+
+# 현재 프로세스가 사용 중인 가상 메모리 크기 (알 수 없으면 0)
+def virtual_memory() -> int:
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return 0
+
+# 메모리 제한: 현재 사용량에 memory_limit 바이트까지 더 할당할 수 있도록 설정
+def limit_memory(memory_limit: int) -> None:
+    if not HAVE_RESOURCE:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    limit = virtual_memory() + memory_limit
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+# function(**args)를 제한 시간과 메모리 제한 아래에서 실행
+# 자식 프로세스에서 실행하므로 무한 루프나 과도한 메모리 사용이 호출자에 영향을 주지 않음
+# 테스트가 예외를 발생시키면 같은 예외를 다시 발생시킴
+def sandboxed_call(function: Callable, args: Dict[str, Any],
+                   timeout: Optional[float] = None,
+                   memory_limit: Optional[int] = None) -> None:
+    if not HAVE_FORK:
+        with Watchdog(timeout):
+            function(**args)
+        return
+
+    read_fd, write_fd = os.pipe()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:  # 자식 프로세스: 테스트 실행 후 결과(예외)를 파이프로 보냄
+        os.close(read_fd)
+        status = 0
+        try:
+            if memory_limit is not None:
+                limit_memory(memory_limit)
+            with Watchdog(timeout):
+                function(**args)
+            result = pickle.dumps(None)
+        except BaseException as exc:
+            status = 1
+            try:
+                result = pickle.dumps(exc)
+            except Exception:
+                result = pickle.dumps(TestCrashed(f"{type(exc).__name__}: {exc}"))
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            with os.fdopen(write_fd, 'wb') as pipe:
+                pipe.write(result)
+        finally:
+            os._exit(status)
+
+    # 부모 프로세스: 파이프가 닫힐 때까지 읽고, 감시자가 동작하지 않으면 강제로 종료
+    os.close(write_fd)
+    deadline = None if timeout is None else time.monotonic() + timeout + 1.0
+    chunks = []
+    killed = False
+    with os.fdopen(read_fd, 'rb', buffering=0) as pipe:
+        while True:
+            wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([pipe], [], [], wait)
+            if not ready:
+                os.kill(pid, signal.SIGKILL)
+                killed = True
+                break
+            chunk = pipe.read(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    _, status = os.waitpid(pid, 0)
+
+    if killed:
+        raise TestTimeout(f"Test did not finish within {timeout} seconds")
+    data = b''.join(chunks)
+    if not data:
+        raise TestCrashed(f"Test process terminated with status {status}")
+    exc = pickle.loads(data)
+    if exc is not None:
+        raise exc
@@ -0,0 +1,61 @@
+from types import FrameType, TracebackType, FunctionType, CodeType, ModuleType
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
+import os
+import sys
+import inspect
+import fnmatch
+import sysconfig
+
+# 범위 항목: 함수, 코드 객체, 모듈 또는 파일 이름 패턴(glob)
+ScopeItem = Union[Callable, CodeType, ModuleType, str]
+
+# 표준 라이브러리와 설치된 패키지의 파일 이름 패턴
+def library_patterns() -> List[str]:
+    paths = sysconfig.get_paths()
+    dirs = {paths[key] for key in ['stdlib', 'platstdlib', 'purelib', 'platlib'] if key in paths}
+    return [os.path.join(d, '*') for d in sorted(dirs)] + ['<frozen *>']
+
+
+# 추적할 코드의 범위 (include가 None이면 exclude에 해당하지 않는 모든 코드)
+# 판단 결과는 코드 객체마다 한 번만 계산해 저장
+class TraceScope:
+    def __init__(self, include: Optional[List[ScopeItem]] = None,
+                 exclude: Optional[List[ScopeItem]] = None, *,
+                 exclude_libraries: bool = False) -> None:
+        self.include = include
+        self.exclude = list(exclude) if exclude is not None else []
+        if exclude_libraries:
+            self.exclude += library_patterns()
+        self._contains: Dict[CodeType, bool] = {}
+
+    def matches(self, item: ScopeItem, code: CodeType) -> bool:
+        if isinstance(item, str):
+            return fnmatch.fnmatch(code.co_filename, item)
+        if isinstance(item, CodeType):
+            return item is code
+        if isinstance(item, ModuleType):
+            filename = getattr(item, '__file__', None)
+            return (filename is not None and
+                    os.path.abspath(filename) == os.path.abspath(code.co_filename))
+        function = inspect.unwrap(item)
+        return getattr(function, '__code__', None) is code
+
+    def matches_any(self, items: List[ScopeItem], code: CodeType) -> bool:
+        return any(self.matches(item, code) for item in items)
+
+    def contains(self, code: CodeType) -> bool:
+        result = self._contains.get(code)
+        if result is None:
+            result = ((self.include is None or self.matches_any(self.include, code)) and
+                      not self.matches_any(self.exclude, code))
+            self._contains[code] = result
+        return result
+
+    def __contains__(self, code: CodeType) -> bool:
+        return self.contains(code)
+
+    # 코드 객체는 피클할 수 없으므로 저장된 판단 결과는 제외
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state['_contains'] = {}
+        return state
@@ -0,0 +1,255 @@
+from types import FrameType, TracebackType, FunctionType, CodeType
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, Iterator, IO, cast
+from collections import deque
+import sys
+import struct
+from SourceCache import source_line
+
+# 이벤트 종류 <-> 바이너리 로그의 레코드 종류
+EVENT_TYPES = {'call': 1, 'line': 2, 'return': 3, 'exception': 4}
+EVENT_NAMES = {tp: event for event, tp in EVENT_TYPES.items()}
+RECORD_CODE = 0  # 코드 객체 정의 (id, 첫 줄 번호, 이름, 파일 이름)
+RECORD_MESSAGE = 5  # 그 밖의 출력 (Tracer.log)
+
+LOG_MAGIC = b'TRACELOG1\n'
+
+# 추적 결과 한 줄: Tracer의 출력 형식
+def format_changes(changes: Dict[str, str]) -> str:
+    return ", ".join([var + " = " + changes[var] for var in changes])
+
+# 이벤트 하나를 Tracer가 출력하던 텍스트 줄들로 변환
+# changes와 value는 이미 repr()로 변환된 문자열
+def format_event(event: str, name: str, filename: str, lineno: int,
+                 changes: Dict[str, str], value: Optional[str] = None,
+                 module_globals: Optional[Dict[str, Any]] = None) -> List[str]:
+    lines = []
+    changes_s = format_changes(changes)
+    if event == 'call':
+        lines.append("Calling " + name + '(' + changes_s + ')')
+    elif changes:
+        lines.append(' ' * 40 + ' # ' + changes_s)
+
+    if event == 'line':
+        try:
+            current_line = source_line(filename, lineno, module_globals)
+        except OSError as err:
+            lines.append(f"{err.__class__.__name__}: {err}")
+            current_line = ""
+        lines.append(repr(lineno) + ' ' + current_line)
+
+    if event == 'return':
+        lines.append(name + '()' + " returns " + cast(str, value))
+    return lines
+
+def repr_changes(changes: Dict[str, Any]) -> Dict[str, str]:
+    return {var: repr(changes[var]) for var in changes}
+
+
+# Tracer가 이벤트를 기록하는 출력 대상
+class TraceSink:
+    # 이벤트 하나 기록. changes: 바뀐 변수와 값, arg: 'return' 이벤트의 반환값
+    def event(self, event: str, frame: FrameType, changes: Dict[str, Any], arg: Any) -> None:
+        pass
+
+    # 그 밖의 텍스트 출력
+    def message(self, text: str) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> Any:
+        return self
+
+    def __exit__(self, exc_tp: Type, exc_value: BaseException,
+                 exc_traceback: TracebackType) -> Optional[bool]:
+        self.close()
+        return None
+
+
+# 텍스트 출력. file이 None이면 그 시점의 sys.stdout에 씀
+# buffered=True이면 buffer_size 줄마다 한 번에 씀 (flush() 또는 Tracer 종료 시에도 씀)
+class TextSink(TraceSink):
+    def __init__(self, file: Optional[IO[str]] = None, *,
+                 buffered: bool = False, buffer_size: int = 1000) -> None:
+        self.file = file
+        self.buffered = buffered
+        self.buffer_size = buffer_size
+        self.buffer: List[str] = []
+
+    def output(self) -> IO[str]:
+        return self.file if self.file is not None else sys.stdout
+
+    def write(self, text: str) -> None:
+        if not self.buffered:
+            out = self.output()
+            out.write(text)
+            out.flush()
+            return
+        self.buffer.append(text)
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def event(self, event: str, frame: FrameType, changes: Dict[str, Any], arg: Any) -> None:
+        code = frame.f_code
+        value = repr(arg) if event == 'return' else None
+        for line in format_event(event, code.co_name, code.co_filename, frame.f_lineno,
+                                 repr_changes(changes), value, frame.f_globals):
+            self.write(line + '\n')
+
+    def message(self, text: str) -> None:
+        self.write(text)
+
+    def flush(self) -> None:
+        if self.buffer:
+            out = self.output()
+            out.write(''.join(self.buffer))
+            self.buffer = []
+        self.output().flush()
+
+
+# 마지막 maxlen개의 이벤트만 메모리에 유지
+# 값은 기록할 때 repr()로 변환해 문자열만 저장 (나중에 바뀐 값이 아닌 기록 당시의 값을 출력)
+# 텍스트 줄은 출력할 때 만듦
+class RingBufferSink(TraceSink):
+    def __init__(self, maxlen: int = 1000) -> None:
+        self.records: deque = deque(maxlen=maxlen)
+
+    def event(self, event: str, frame: FrameType, changes: Dict[str, Any], arg: Any) -> None:
+        code = frame.f_code
+        self.records.append((event, code.co_name, code.co_filename, frame.f_lineno,
+                             repr_changes(changes), repr(arg) if event == 'return' else None))
+
+    def message(self, text: str) -> None:
+        self.records.append(text)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def clear(self) -> None:
+        self.records.clear()
+
+    # 저장된 이벤트를 Tracer 출력 형식의 텍스트로 반환
+    def text(self) -> str:
+        out = []
+        for record in self.records:
+            if isinstance(record, str):
+                out.append(record)
+                continue
+            for line in format_event(*record):
+                out.append(line + '\n')
+        return ''.join(out)
+
+    def dump(self, file: Optional[IO[str]] = None) -> None:
+        (file if file is not None else sys.stdout).write(self.text())
+
+
+# 이벤트를 간결한 바이너리 형식으로 기록 (print_event_log()로 나중에 출력)
+# 레코드: 종류(1바이트), 코드 id, 줄 번호, 바뀐 변수 수, (변수 이름, 값 repr)..., [반환값 repr]
+# 코드 객체는 처음 등장할 때 RECORD_CODE 레코드로 한 번만 기록
+class BinaryEventLog(TraceSink):
+    def __init__(self, file: Union[str, IO[bytes]]) -> None:
+        if isinstance(file, str):
+            self.file: IO[bytes] = open(file, 'wb')
+            self.owns_file = True
+        else:
+            self.file = file
+            self.owns_file = False
+        self.code_ids: Dict[CodeType, int] = {}
+        self.file.write(LOG_MAGIC)
+
+    def write_string(self, s: str) -> None:
+        data = s.encode('utf-8', 'backslashreplace')
+        self.file.write(struct.pack('<I', len(data)))
+        self.file.write(data)
+
+    def code_id(self, code: CodeType) -> int:
+        code_id = self.code_ids.get(code)
+        if code_id is None:
+            code_id = len(self.code_ids)
+            self.code_ids[code] = code_id
+            self.file.write(struct.pack('<BII', RECORD_CODE, code_id, code.co_firstlineno))
+            self.write_string(code.co_name)
+            self.write_string(code.co_filename)
+        return code_id
+
+    def event(self, event: str, frame: FrameType, changes: Dict[str, Any], arg: Any) -> None:
+        code_id = self.code_id(frame.f_code)
+        self.file.write(struct.pack('<BIIH', EVENT_TYPES[event], code_id,
+                                    frame.f_lineno, len(changes)))
+        for var in changes:
+            self.write_string(var)
+            self.write_string(repr(changes[var]))
+        if event == 'return':
+            self.write_string(repr(arg))
+
+    def message(self, text: str) -> None:
+        self.file.write(struct.pack('<B', RECORD_MESSAGE))
+        self.write_string(text)
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def close(self) -> None:
+        self.flush()
+        if self.owns_file:
+            self.file.close()
+
+
+def _read_exact(file: IO[bytes], size: int) -> bytes:
+    data = file.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated event log")
+    return data
+
+def _read_string(file: IO[bytes]) -> str:
+    size, = struct.unpack('<I', _read_exact(file, 4))
+    return _read_exact(file, size).decode('utf-8')
+
+# 바이너리 로그의 레코드를 순서대로 반환
+# 이벤트: (이벤트, 함수 이름, 파일 이름, 줄 번호, {변수: 값 repr}, 반환값 repr 또는 None)
+# 메시지: 텍스트 문자열
+def read_event_log(file: Union[str, IO[bytes]]) -> Iterator[Any]:
+    if isinstance(file, str):
+        with open(file, 'rb') as f:
+            yield from read_event_log(f)
+        return
+    if file.read(len(LOG_MAGIC)) != LOG_MAGIC:
+        raise ValueError("Not an event log")
+    codes: Dict[int, Tuple[str, str]] = {}
+    while True:
+        tp = file.read(1)
+        if not tp:
+            return
+        record_type = tp[0]
+        if record_type == RECORD_CODE:
+            code_id, firstlineno = struct.unpack('<II', _read_exact(file, 8))
+            name = _read_string(file)
+            codes[code_id] = (name, _read_string(file))
+        elif record_type == RECORD_MESSAGE:
+            yield _read_string(file)
+        elif record_type in EVENT_NAMES:
+            code_id, lineno, n_changes = struct.unpack('<IIH', _read_exact(file, 10))
+            changes = {}
+            for i in range(n_changes):
+                var = _read_string(file)
+                changes[var] = _read_string(file)
+            event = EVENT_NAMES[record_type]
+            value = _read_string(file) if event == 'return' else None
+            name, filename = codes[code_id]
+            yield (event, name, filename, lineno, changes, value)
+        else:
+            raise ValueError(f"Unknown record type {record_type}")
+
+# 바이너리 로그를 Tracer 출력 형식으로 출력
+def print_event_log(log: Union[str, IO[bytes]], file: Optional[IO[str]] = None) -> None:
+    out = file if file is not None else sys.stdout
+    for record in read_event_log(log):
+        if isinstance(record, str):
+            out.write(record)
+            continue
+        for line in format_event(*record):
+            out.write(line + '\n')
@@ -3,17 +3,37 @@ from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable,
 import sys
 import inspect
 from StackInspector import StackInspector
+from TraceSink import TraceSink, TextSink
+from TraceScope import TraceScope
 
 class Tracer(StackInspector):
+    # 출력 대상 (기본값: 매번 sys.stdout에 바로 출력)
+    sink: TraceSink = TextSink()
+    # 추적할 코드의 범위 (기본값: 제한 없음)
+    scope: Optional[TraceScope] = None
 
-    def __init__(self) -> None:
+    def __init__(self, *, sink: Optional[TraceSink] = None,
+                 scope: Optional[TraceScope] = None) -> None:
         self.original_trace_function: Optional[Callable] = None
         self.last_vars: Dict[str, Any] = {}
+        if sink is not None:
+            self.sink = sink
+        if scope is not None:
+            self.scope = scope
+
+    def set_scope(self, scope: Optional[TraceScope]) -> None:
+        self.scope = scope
+
+    def in_trace_scope(self, code: Any) -> bool:
+        return self.scope is None or self.scope.contains(code)
 
     def traceit(self, frame: FrameType, event: str, arg: Any) -> None:
         self.print_debugger_status(frame, event, arg)
 
     def _traceit(self, frame: FrameType, event: str, arg: Any) -> Optional[Callable]:
+        # 범위 밖의 함수는 지역 추적 함수를 설정하지 않으므로 'line' 등 이후 이벤트가 발생하지 않음
+        if event == 'call' and not self.in_trace_scope(frame.f_code):
+            return None
         if self.our_frame(frame):
             pass
         else:
@@ -22,28 +42,10 @@ class Tracer(StackInspector):
     
     def print_debugger_status(self, frame: FrameType, event: str, arg: Any) -> None:
         changes = self.changed_vars(frame.f_locals)
-        changes_s = ", ".join([var + " = " + repr(changes[var]) for var in changes])
-
-        if event == 'call':
-            self.log("Calling " + frame.f_code.co_name + '(' + changes_s + ')')
-        elif changes:
-            self.log(' ' * 40, '#', changes_s)
-
-        if event == 'line':
-            try:
-                module = inspect.getmodule(frame.f_code)
-                if module is None:
-                    source = inspect.getsource(frame.f_code)
-                else:
-                    source = inspect.getsource(module)
-                current_line = source.split('\n')[frame.f_lineno - 1]
-            except OSError as err:
-                self.log(f"{err.__class__.__name__}: {err}")
-                current_line = ""
-            self.log(repr(frame.f_lineno) + ' ' + current_line)
+        # 출력 형식은 출력 대상이 결정 (텍스트, 바이너리 로그, 링 버퍼)
+        self.sink.event(event, frame, changes, arg)
 
         if event == 'return':
-            self.log(frame.f_code.co_name + '()' + " returns " + repr(arg))
             self.last_vars = {}  #\\
     
     def changed_vars(self, new_vars: Dict[str, Any]) -> Dict[str, Any]:
@@ -54,8 +56,15 @@ class Tracer(StackInspector):
         self.last_vars = new_vars.copy()
         return changed
 
+    # 출력 대상의 코드(파이썬 함수)가 추적되지 않도록 출력하는 동안 추적을 멈춤
+    # (추적되면 그 이벤트가 쓰는 중인 메시지 사이에 기록됨)
     def log(self, *objects: Any, sep: str = ' ', end: str = '\n', flush: bool = True) -> None:
-        print(*objects, sep=sep, end=end, flush=flush)
+        trace_function = sys.gettrace()
+        sys.settrace(None)
+        try:
+            self.sink.message(sep.join(str(obj) for obj in objects) + end)
+        finally:
+            sys.settrace(trace_function)
 
     def __enter__(self) -> Any:
         self.original_trace_function = sys.gettrace()
@@ -64,6 +73,7 @@ class Tracer(StackInspector):
 
     def __exit__(self, exc_tp: Type, exc_value: BaseException, exc_traceback: TracebackType) -> Optional[bool]:
         sys.settrace(self.original_trace_function)
+        self.sink.flush()
         if self.is_internal_error(exc_tp, exc_value, exc_traceback):
             return False
         else:
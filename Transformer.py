@@ -11,7 +11,88 @@ from ast import Module, Load, Store, \
     NodeTransformer, NodeVisitor, Name, AST
 from Visitor import *
 
-class TrackGetTransformer(NodeTransformer):
+# 방문 중인 노드가 실행될 스코프(함수, 클래스, 람다, 컴프리헨션)를 추적하는 변환기
+# location(node): 추적기에 상수로 전달할 정적 위치 (스코프 이름, 줄 번호)
+class TrackLocationTransformer(NodeTransformer):
+    def __init__(self) -> None:
+        super().__init__()
+        self.scopes: List[str] = []
+
+    def location(self, node: AST) -> Optional[StaticLocation]:
+        lineno = getattr(node, 'lineno', None)
+        if lineno is None:
+            return None
+        return '.'.join(self.scopes) or '<module>', lineno
+
+    # generic_visit()과 같지만 주어진 필드만 방문
+    def visit_fields(self, node: AST, fields: List[str]) -> None:
+        for field in fields:
+            old_value = getattr(node, field, None)
+            if isinstance(old_value, list):
+                new_values = []
+                for value in old_value:
+                    if isinstance(value, AST):
+                        value = self.visit(value)
+                        if value is None:
+                            continue
+                        elif not isinstance(value, AST):
+                            new_values.extend(value)
+                            continue
+                    new_values.append(value)
+                old_value[:] = new_values
+            elif isinstance(old_value, AST):
+                new_node = self.visit(old_value)
+                if new_node is None:
+                    delattr(node, field)
+                else:
+                    setattr(node, field, new_node)
+
+    # outer 필드는 바깥 스코프에서, inner 필드는 새 스코프 name 안에서 실행됨
+    def visit_scope(self, node: AST, name: str, outer: List[str], inner: List[str]) -> AST:
+        self.visit_fields(node, outer)
+        self.scopes.append(name)
+        self.visit_fields(node, inner)
+        self.scopes.pop()
+        return node
+
+    def visit_FunctionDef(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> AST:
+        return self.visit_scope(node, node.name, ['decorator_list', 'args', 'returns'], ['body'])
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> AST:
+        return self.visit_FunctionDef(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> AST:
+        return self.visit_scope(node, node.name, ['decorator_list', 'bases', 'keywords'], ['body'])
+
+    def visit_Lambda(self, node: ast.Lambda) -> AST:
+        return self.visit_scope(node, '<lambda>', ['args'], ['body'])
+
+    # 컴프리헨션은 첫 번째 반복 대상만 바깥 스코프에서 평가됨
+    def visit_comprehension_scope(self, node: AST, name: str, inner: List[str]) -> AST:
+        first = node.generators[0]  # type: ignore
+        self.visit_fields(first, ['iter'])
+        self.scopes.append(name)
+        self.visit_fields(first, ['target', 'ifs'])
+        for generator in node.generators[1:]:  # type: ignore
+            self.visit_fields(generator, ['target', 'iter', 'ifs'])
+        self.visit_fields(node, inner)
+        self.scopes.pop()
+        return node
+
+    def visit_ListComp(self, node: ast.ListComp) -> AST:
+        return self.visit_comprehension_scope(node, '<listcomp>', ['elt'])
+
+    def visit_SetComp(self, node: ast.SetComp) -> AST:
+        return self.visit_comprehension_scope(node, '<setcomp>', ['elt'])
+
+    def visit_GeneratorExp(self, node: ast.GeneratorExp) -> AST:
+        return self.visit_comprehension_scope(node, '<genexpr>', ['elt'])
+
+    def visit_DictComp(self, node: ast.DictComp) -> AST:
+        return self.visit_comprehension_scope(node, '<dictcomp>', ['key', 'value'])
+
+
+class TrackGetTransformer(TrackLocationTransformer):
     def visit_Name(self, node: Name) -> AST:
         self.generic_visit(node)
         if is_internal(node.id):
@@ -20,12 +101,12 @@ class TrackGetTransformer(NodeTransformer):
             return node
         if not isinstance(node.ctx, Load):
             return node
-        new_node = make_get_data(node.id)
+        new_node = make_get_data(node.id, location=self.location(node))
         ast.copy_location(new_node, node)
         return new_node
 
 
-class TrackSetTransformer(NodeTransformer):
+class TrackSetTransformer(TrackLocationTransformer):
     def visit_Assign(self, node: Assign) -> Assign:
         value = ast.unparse(node.value)
         if value.startswith(DATA_TRACKER + '.set'):
@@ -33,7 +114,8 @@ class TrackSetTransformer(NodeTransformer):
         for target in node.targets:
             loads = load_names(target)
             for store_name in store_names(target):
-                node.value = make_set_data(store_name, node.value, loads=loads)
+                node.value = make_set_data(store_name, node.value, loads=loads,
+                                           location=self.location(node.value))
                 loads = set()
         return node
 
@@ -42,7 +124,8 @@ class TrackSetTransformer(NodeTransformer):
         if value.startswith(DATA_TRACKER):
             return node
         id = cast(str, leftmost_name(node.target))
-        node.value = make_set_data(id, node.value, method='augment')
+        node.value = make_set_data(id, node.value, method='augment',
+                                   location=self.location(node.value))
         return node
 
     def visit_AnnAssign(self, node: AnnAssign) -> AnnAssign:
@@ -53,7 +136,8 @@ class TrackSetTransformer(NodeTransformer):
             return node
         loads = load_names(node.target)
         for store_name in store_names(node.target):
-            node.value = make_set_data(store_name, node.value, loads=loads)
+            node.value = make_set_data(store_name, node.value, loads=loads,
+                                       location=self.location(node.value))
             loads = set()
         return node
 
@@ -62,7 +146,8 @@ class TrackSetTransformer(NodeTransformer):
         if value.startswith(DATA_TRACKER + '.set'):
             return node
         loads = load_names(node.test)
-        node.test = make_set_data("<assertion>", node.test, loads=loads)
+        node.test = make_set_data("<assertion>", node.test, loads=loads,
+                                  location=self.location(node.test))
         return node
 
 
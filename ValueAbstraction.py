@@ -0,0 +1,71 @@
+from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
+import math
+import hashlib
+
+# 값 추상화: 변수 값을 이벤트에 기록할 짧은 문자열로 변환
+Abstraction = Callable[[Any], str]
+
+ABSTRACTIONS: Dict[str, Abstraction] = {}
+
+HASH_DIGEST_SIZE = 4  # 값 지문의 길이 (바이트)
+
+def register_abstraction(name: str, abstraction: Abstraction) -> Abstraction:
+    ABSTRACTIONS[name] = abstraction
+    return abstraction
+
+def get_abstraction(abstraction: Union[str, Abstraction]) -> Abstraction:
+    if callable(abstraction):
+        return abstraction
+    if abstraction not in ABSTRACTIONS:
+        raise ValueError(f"Unknown abstraction {repr(abstraction)}. "
+                         f"Possible abstractions are: {', '.join(sorted(ABSTRACTIONS))}")
+    return ABSTRACTIONS[abstraction]
+
+
+# 길이 구간: 0, 1, 2-3, 4-7, 8-15, ...
+def length_bucket(length: int) -> str:
+    if length <= 1:
+        return str(length)
+    bits = length.bit_length()
+    return f"{1 << (bits - 1)}-{(1 << bits) - 1}"
+
+# 부호 구간: < 0, 0, > 0
+def sign_bucket(number: Union[int, float]) -> str:
+    if isinstance(number, float) and math.isnan(number):
+        return 'nan'
+    if number < 0:
+        return '< 0'
+    if number > 0:
+        return '> 0'
+    return '0'
+
+
+# 원래 값 그대로 (repr)
+def value_repr(value: Any) -> str:
+    return repr(value)
+
+# 타입 이름만
+def value_type(value: Any) -> str:
+    return type(value).__name__
+
+# 숫자는 부호, 길이가 있는 값은 길이 구간, True/False/None은 그대로, 그 밖에는 타입 이름
+def value_bucket(value: Any) -> str:
+    if value is None or isinstance(value, bool):
+        return repr(value)
+    if isinstance(value, (int, float)):
+        return sign_bucket(value)
+    if isinstance(value, (str, bytes, list, tuple, dict, set, frozenset)):
+        return f"{type(value).__name__} of length {length_bucket(len(value))}"
+    return type(value).__name__
+
+# 타입 이름과 repr()의 짧은 지문: 값이 크더라도 이벤트 길이는 일정
+def value_hash(value: Any) -> str:
+    digest = hashlib.blake2b(repr(value).encode('utf-8', 'backslashreplace'),
+                             digest_size=HASH_DIGEST_SIZE).hexdigest()
+    return f"{type(value).__name__}#{digest}"
+
+
+register_abstraction('repr', value_repr)
+register_abstraction('type', value_type)
+register_abstraction('bucket', value_bucket)
+register_abstraction('hash', value_hash)
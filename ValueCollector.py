@@ -1,17 +1,50 @@
 from types import FrameType, TracebackType, FunctionType
 from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable, cast
 from Collector import Collector
+from ValueAbstraction import Abstraction, get_abstraction
+
+# 변수별 값 개수 제한을 넘은 값을 대신하는 이벤트 값
+OTHER_VALUES = '<other>'
+
+# 변경할 수 없는 타입: 같은 객체이면 값도 같으므로 다시 추상화하지 않음
+IMMUTABLE_TYPES = (int, float, complex, str, bytes, bool, type(None))
 
 class ValueCollector(Collector):
-    def __init__(self) -> None:
+    # 기본 값 추상화와 변수별 값 개수 제한 (None이면 제한 없음)
+    ABSTRACTION: Union[str, Abstraction] = 'repr'
+    MAX_VALUES: Optional[int] = None
+
+    def __init__(self, *, abstraction: Optional[Union[str, Abstraction]] = None,
+                 max_values: Optional[int] = None) -> None:
         super().__init__()
         self.vars: Set[str] = set()
+        self.abstraction = get_abstraction(abstraction if abstraction is not None
+                                           else self.ABSTRACTION)
+        self.max_values = max_values if max_values is not None else self.MAX_VALUES
+        self.values: Dict[str, Set[str]] = {}  # 변수 -> 기록된 (추상화된) 값
+        self.last_values: Dict[str, Any] = {}  # 변수 -> 마지막으로 본 변경 불가능한 값
 
     def collect(self, frame: FrameType, event: str, arg: Any) -> None:
-        local_vars = frame.f_locals  
+        local_vars = frame.f_locals
         for var in local_vars:
             value = local_vars[var]
-            self.vars.add(f"{var} = {repr(value)}") 
+            if isinstance(value, IMMUTABLE_TYPES):
+                if var in self.last_values and self.last_values[var] is value:
+                    continue  # 이미 기록된 값
+                self.last_values[var] = value
+            else:
+                self.last_values.pop(var, None)
+            self.add_value(var, self.abstraction(value))
+
+    def add_value(self, var: str, value: str) -> None:
+        if self.max_values is not None:
+            seen = self.values.setdefault(var, set())
+            if value not in seen:
+                if len(seen) >= self.max_values:
+                    value = OTHER_VALUES
+                else:
+                    seen.add(value)
+        self.vars.add(f"{var} = {value}")
 
     def events(self) -> Set[str]:
-        return self.vars
\ No newline at end of file
+        return self.vars
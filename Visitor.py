@@ -2,6 +2,7 @@ from typing import Any, Dict, List, Set, Optional, Union, Tuple, Type, Callable,
 import ast
 from ast import Load, Store, Attribute, keyword, Call, NodeVisitor, Name, AST
 import typing
+from StackInspector import StaticLocation
 
 DATA_TRACKER = '_data'
 
@@ -61,12 +62,19 @@ def load_names(tree: AST) -> Set[str]:
 def is_internal(id: str) -> bool:
     return (id in dir(__builtins__) or id in dir(typing))
 
-def make_get_data(id: str, method: str = 'get') -> Call:
+# 정적 위치를 loc= 인자로 전달하면 추적기가 실행 중에 스택을 탐색하지 않아도 됨
+def make_location(location: Optional[StaticLocation]) -> List[keyword]:
+    if location is None:
+        return []
+    return [keyword(arg='loc', value=ast.Constant(value=location))]
+
+def make_get_data(id: str, method: str = 'get', location: Optional[StaticLocation] = None) -> Call:
     return Call(func=Attribute(value=Name(id=DATA_TRACKER, ctx=Load()), attr=method, ctx=Load()),
                 args=[ast.Str(id), Name(id=id, ctx=Load())],
-                keywords=[])
+                keywords=make_location(location))
 
-def make_set_data(id: str, value: Any, loads: Optional[Set[str]] = None, method: str = 'set') -> Call:
+def make_set_data(id: str, value: Any, loads: Optional[Set[str]] = None, method: str = 'set',
+                  location: Optional[StaticLocation] = None) -> Call:
     keywords=[]
     if loads:
         keywords = [
@@ -76,6 +84,7 @@ def make_set_data(id: str, value: Any, loads: Optional[Set[str]] = None, method:
                         ctx=Load()
                     ))
         ]
+    keywords += make_location(location)
     new_node = Call(func=Attribute(value=Name(id=DATA_TRACKER, ctx=Load()), 
                     attr=method, ctx=Load()),
                     args=[ast.Str(id), value],
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 모듈들은 저장소 최상위에 있음
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
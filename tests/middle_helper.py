@@ -0,0 +1,19 @@
+# 테스트가 보조 함수를 거쳐 수리 대상을 호출하는 예제 (pytest가 assert를 바꾸지 않도록 별도 모듈에 둠)
+def middle(x, y, z):  # type: ignore
+    if y < z:
+        if x < y:
+            return y
+        elif x < z:
+            return y
+    else:
+        if x > y:
+            return y
+        elif x > z:
+            return x
+    return z
+
+def helper(x, y, z):  # type: ignore
+    return middle(x, y, z)
+
+def middle_test(x, y, z):  # type: ignore
+    assert helper(x, y, z) == sorted([x, y, z])[1]
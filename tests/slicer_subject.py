@@ -0,0 +1,27 @@
+# 슬라이서로 계측할 예제 (pytest가 assert를 바꾸지 않도록 별도 모듈에 둠)
+# 계측된 코드는 함수 호출을 추적하지 못하므로 호출이 없는 코드만 사용
+def middle(x, y, z):  # type: ignore
+    if y < z:
+        if x < y:
+            return y
+        elif x < z:
+            return y
+    else:
+        if x > y:
+            return y
+        elif x > z:
+            return x
+    return z
+
+def loop(n):  # type: ignore
+    total = 0
+    i = 0
+    while i < n:
+        total += i * i
+        ys = [total + j for j in (0, 1) if j < i]
+        total = total + (i if ys else 0)
+        i = i + 1
+    for k in (1, 2, 3):
+        total -= k
+    assert total > 0
+    return total
@@ -0,0 +1,75 @@
+import pytest
+import slicer_subject
+from Slicer import Slicer
+from DependencyLog import DependencyLog, load_dependencies, read_dependency_log
+from DependencyTracker import DependencyTracker
+
+# Dependencies.validate()는 제어 의존성마다 경고를 냄 (이 테스트와 무관)
+pytestmark = pytest.mark.filterwarnings('ignore::UserWarning')
+
+def name(node):  # type: ignore
+    var, (function, lineno) = node
+    return (var, function.__name__, lineno)
+
+def edges(deps):  # type: ignore
+    return sorted((name(node), sorted(map(name, deps.data[node])),
+                   sorted(map(name, deps.control[node]))) for node in deps.data)
+
+def sliced(function, args, **kwargs):  # type: ignore
+    with Slicer(function, globals=vars(slicer_subject), **kwargs) as slicer:
+        getattr(slicer_subject, function.__name__)(*args)
+    return slicer
+
+SUBJECTS = [(slicer_subject.middle, (2, 1, 3), '<middle() return value>'),
+            (slicer_subject.loop, (20,), '<assertion>')]
+
+
+# 로그에 기록한 의존성과 메모리에 모은 의존성, 그 슬라이스가 같음
+@pytest.mark.parametrize('function, args, criterion', SUBJECTS)
+def test_stream_matches_memory(tmp_path, function, args, criterion) -> None:  # type: ignore
+    log = str(tmp_path / 'deps.log')
+    memory = sliced(function, args).dependencies()
+    streamed = sliced(function, args, stream=log).dependencies()
+    assert edges(streamed) == edges(memory)
+    assert [name(node) for node in streamed.data] == [name(node) for node in memory.data]
+    for mode in ['cd', 'd', 'c']:
+        for depth in [-1, 0, 1, 2]:
+            assert (edges(streamed.backward_slice(criterion, mode=mode, depth=depth)) ==
+                    edges(memory.backward_slice(criterion, mode=mode, depth=depth)))
+
+    # 새 프로세스처럼 함수 정보 없이 다시 읽어도 같은 그래프
+    loaded = load_dependencies(log)
+    assert edges(loaded) == edges(memory)
+
+def test_stream_closes_own_log(tmp_path) -> None:  # type: ignore
+    slicer = sliced(slicer_subject.loop, (5,), stream=str(tmp_path / 'deps.log'))
+    assert slicer.dependency_tracker.stream.file.closed
+    assert edges(slicer.dependencies()) == edges(sliced(slicer_subject.loop, (5,)).dependencies())
+
+def test_stream_and_tracker_are_exclusive(tmp_path) -> None:  # type: ignore
+    with pytest.raises(ValueError):
+        Slicer(slicer_subject.loop, stream=str(tmp_path / 'deps.log'),
+               dependency_tracker=DependencyTracker())
+
+# 같은 간선은 한 번만 기록되고, 기록한 의존성을 그대로 다시 읽음
+def test_log_round_trip(tmp_path) -> None:  # type: ignore
+    def f():  # type: ignore
+        pass
+    a, b, c = ('a', (f, 1)), ('b', (f, 2)), ('c', (f, 3))
+    filename = str(tmp_path / 'deps.log')
+    with DependencyLog(filename) as log:
+        log.add(b, [a], [])
+        for i in range(10):
+            log.add(c, [a, b], [b])
+        log.add(a, [], [])
+        deps = log.dependencies()
+    with open(filename, 'rb') as file:
+        records = list(read_dependency_log(file.read()))
+    assert sum(tag == b'E' for tag, values in records) == 4
+    assert sum(tag == b'K' for tag, values in records) == 3
+    assert list(deps.data) == [b, c, a]
+    assert deps.data[c] == {a, b} and deps.control[c] == {b}
+    assert deps.data[a] == set() and deps.control[b] == set()
+
+    with pytest.raises(ValueError):
+        list(read_dependency_log(b'not a log'))
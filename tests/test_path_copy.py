@@ -0,0 +1,53 @@
+import ast
+import random
+import inspect
+from PathCopy import copy_node, node_path, replace_node
+from StatementMutator import StatementMutator
+from CrossoverOperator import CrossoverOperator
+from middle_helper import middle
+
+def middle_tree() -> ast.AST:
+    return ast.parse(inspect.getsource(middle))
+
+# 경로 끝의 문장을 노드, 노드 리스트, None으로 바꿔도 원본 트리는 그대로
+def test_replace_node_leaves_original_unchanged() -> None:
+    tree = middle_tree()
+    before = ast.dump(tree, include_attributes=True)
+    target = tree.body[0].body[0].body[0].body[0]  # type: ignore
+    path = node_path(tree, target)
+    assert path is not None
+    for replacement in [ast.Pass(), [ast.Pass(), copy_node(target)], None]:
+        new_tree = replace_node(tree, path, replacement)
+        assert ast.dump(tree, include_attributes=True) == before
+        assert ast.dump(new_tree) != ast.dump(tree)
+    # 경로 밖의 서브트리는 복사하지 않고 공유
+    assert new_tree.body[0].body[0].orelse[0] is tree.body[0].body[0].orelse[0]  # type: ignore
+
+def test_mutate_leaves_original_unchanged() -> None:
+    random.seed(0)
+    tree = middle_tree()
+    before = ast.dump(tree, include_attributes=True)
+    mutator = StatementMutator()
+    changed = 0
+    for _ in range(50):
+        new_tree = mutator.mutate(tree)
+        assert ast.dump(tree, include_attributes=True) == before
+        changed += ast.dump(new_tree) != before
+        # 변이된 트리를 다시 변이해도 이전 트리는 그대로
+        before_new = ast.dump(new_tree, include_attributes=True)
+        mutator.mutate(new_tree)
+        assert ast.dump(new_tree, include_attributes=True) == before_new
+    assert changed > 0
+
+def test_crossover_leaves_parents_unchanged() -> None:
+    random.seed(0)
+    mutator = StatementMutator()
+    t1 = middle_tree()
+    t2 = mutator.mutate(middle_tree())
+    before_1 = ast.dump(t1, include_attributes=True)
+    before_2 = ast.dump(t2, include_attributes=True)
+    crossover = CrossoverOperator()
+    for _ in range(20):
+        crossover.crossover(t1, t2)
+        assert ast.dump(t1, include_attributes=True) == before_1
+        assert ast.dump(t2, include_attributes=True) == before_2
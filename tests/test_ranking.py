@@ -0,0 +1,54 @@
+import math
+import pytest
+from Middle import middle, MIDDLE_PASSING_TESTCASES, MIDDLE_FAILING_TESTCASES
+from CoverageCollector import CoverageCollector
+from MonitoringCoverageCollector import MonitoringCoverageCollector
+from OchiaiDebugger import OchiaiDebugger
+from TarantulaDebugger import TarantulaDebugger
+
+def middle_debugger(debugger_class, collector_class=CoverageCollector):  # type: ignore
+    debugger = debugger_class(collector_class=collector_class)
+    for x, y, z in MIDDLE_PASSING_TESTCASES:
+        with debugger.collect_pass():
+            middle(x, y, z)
+    for x, y, z in MIDDLE_FAILING_TESTCASES:
+        with debugger.collect_fail():
+            middle(x, y, z)
+    return debugger
+
+def counts(debugger, event):  # type: ignore
+    passed = sum(event in c.events() for c in debugger.collectors[debugger.PASS])
+    failed = sum(event in c.events() for c in debugger.collectors[debugger.FAIL])
+    return passed, failed, len(debugger.collectors[debugger.PASS]), len(debugger.collectors[debugger.FAIL])
+
+# 비트셋/공식 사전을 쓰기 전의 정의 그대로 계산한 의심 점수
+def ochiai(debugger, event):  # type: ignore
+    passed, failed, total_passed, total_failed = counts(debugger, event)
+    return failed / math.sqrt(total_failed * (failed + passed))
+
+def tarantula(debugger, event):  # type: ignore
+    passed, failed, total_passed, total_failed = counts(debugger, event)
+    passed_fraction = passed / total_passed
+    failed_fraction = failed / total_failed
+    return 1 - passed_fraction / (passed_fraction + failed_fraction)
+
+
+@pytest.mark.parametrize('debugger_class, reference', [(OchiaiDebugger, ochiai),
+                                                        (TarantulaDebugger, tarantula)])
+def test_rankings_unchanged(debugger_class, reference) -> None:  # type: ignore
+    debugger = middle_debugger(debugger_class)
+    expected = {event: reference(debugger, event) for event in debugger.all_events()}
+    for event, score in expected.items():
+        assert debugger.suspiciousness(event) == pytest.approx(score)
+    ranking = debugger.rank()
+    assert set(ranking) == set(expected)
+    scores = [expected[event] for event in ranking]
+    assert scores == sorted(scores, reverse=True)
+
+@pytest.mark.parametrize('debugger_class', [OchiaiDebugger, TarantulaDebugger])
+def test_monitoring_collector_ranks_like_settrace(debugger_class) -> None:  # type: ignore
+    settrace = middle_debugger(debugger_class)
+    monitoring = middle_debugger(debugger_class, MonitoringCoverageCollector)
+    assert monitoring.all_events() == settrace.all_events()
+    for event in settrace.all_events():
+        assert monitoring.suspiciousness(event) == pytest.approx(settrace.suspiciousness(event))
@@ -0,0 +1,58 @@
+import ast
+import random
+import inspect
+from OchiaiDebugger import OchiaiDebugger
+from Repairer import Repairer
+import middle_helper
+from middle_helper import middle, helper, middle_test
+
+FIXED_MIDDLE = inspect.getsource(middle).replace("""        elif x < z:
+            return y""", """        elif x < z:
+            return x""")
+
+TESTCASES = [(3, 3, 5), (1, 2, 3), (3, 2, 1), (5, 5, 5), (5, 3, 4), (2, 1, 3)]
+
+def middle_debugger() -> OchiaiDebugger:
+    debugger = OchiaiDebugger()
+    for args in TESTCASES:
+        try:
+            with debugger:
+                middle_test(*args)
+        except AssertionError:
+            pass
+    return debugger
+
+
+# 수리 후보는 테스트가 보조 함수를 거쳐 호출해도 실행되어야 함
+def test_candidate_reached_through_helper() -> None:
+    repairer = Repairer(middle_debugger(), targets=[middle], globals=vars(middle_helper))
+    assert repairer.fitness(repairer.target_tree) == 0.99
+    assert repairer.fitness(ast.parse(FIXED_MIDDLE)) == 1.0
+    # 평가 후에는 원래 정의로 복원됨
+    assert helper.__globals__['middle'] is middle
+    assert middle(2, 1, 3) == 1
+
+def test_repair_through_helper() -> None:
+    random.seed(0)
+    repairer = Repairer(middle_debugger(), targets=[middle], globals=vars(middle_helper))
+    tree, fitness = repairer.repair(population_size=20, iterations=30)
+    assert fitness == 1.0
+    assert middle_helper.middle is middle
+
+# 조기 종료로 얻은 상한은 적합도 캐시에 남지 않고, 선택 기준이 바뀌면 다시 평가됨
+def test_truncated_bounds_are_not_cached() -> None:
+    repairer = Repairer(middle_debugger(), targets=[middle], globals=vars(middle_helper))
+    always_x = ast.parse("def middle(x, y, z):\n    return x\n")
+    exact = repairer.fitness(always_x)
+    repairer.fitness_cache.entries.clear()
+
+    repairer.cutoff = 1.0
+    bound = repairer.fitness(always_x)
+    assert repairer.truncated
+    assert bound > exact
+    assert len(repairer.fitness_cache) == 0
+
+    # 다음 세대에서는 (더 낮은 기준으로) 다시 평가
+    repairer.evolve([])
+    repairer.cutoff = None
+    assert repairer.fitness(always_x) == exact
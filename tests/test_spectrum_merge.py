@@ -0,0 +1,49 @@
+import io
+from Middle import middle, MIDDLE_PASSING_TESTCASES, MIDDLE_FAILING_TESTCASES
+from OchiaiDebugger import OchiaiDebugger
+from SpectrumStore import save_spectrum, load_spectrum
+
+TESTS = ([('PASS', args) for args in MIDDLE_PASSING_TESTCASES] +
+         [('FAIL', args) for args in MIDDLE_FAILING_TESTCASES])
+
+def collect(tests):  # type: ignore
+    debugger = OchiaiDebugger()
+    for outcome, (x, y, z) in tests:
+        with debugger.collect(outcome):
+            middle(x, y, z)
+    return debugger
+
+def summary(debugger):  # type: ignore
+    return ({outcome: sorted((c.argstring(), sorted(c.events()))
+                             for c in debugger.collectors[outcome])
+             for outcome in debugger.collectors},
+            {event: debugger.suspiciousness(event) for event in debugger.all_events()})
+
+def shards():  # type: ignore
+    return [collect(TESTS[i::3]) for i in range(3)]
+
+
+# 나누어 수집한 스펙트럼을 합치면 한 번에 수집한 것과 같음
+def test_merge_matches_single_run() -> None:
+    a, b, c = shards()
+    assert summary(a.merge(b, c)) == summary(collect(TESTS))
+
+def test_merge_is_associative_and_does_not_modify_inputs() -> None:
+    a, b, c = shards()
+    before = summary(a)
+    left = a.merge(b).merge(c)
+    right = a.merge(b.merge(c))
+    assert summary(left) == summary(right) == summary(a.merge(b, c))
+    assert summary(a) == before
+
+# 저장 후 다시 불러온 조각도 (다른 프로세스에서 만든 것처럼) 합칠 수 있음
+def test_merge_loaded_shards() -> None:
+    loaded = []
+    for shard in shards():
+        data = io.BytesIO()
+        save_spectrum(shard, data)
+        data.seek(0)
+        loaded.append(load_spectrum(data))
+    merged = loaded[0].merge(*loaded[1:])
+    assert summary(merged) == summary(collect(TESTS))
+    assert merged.function() is middle
@@ -0,0 +1,52 @@
+import io
+import warnings
+from Middle import middle, MIDDLE_PASSING_TESTCASES, MIDDLE_FAILING_TESTCASES
+from OchiaiDebugger import OchiaiDebugger
+from TarantulaDebugger import TarantulaDebugger
+from SpectrumStore import save_spectrum, load_spectrum
+
+def middle_debugger(debugger_class=OchiaiDebugger):  # type: ignore
+    debugger = debugger_class()
+    for x, y, z in MIDDLE_PASSING_TESTCASES:
+        with debugger.collect_pass():
+            middle(x, y, z)
+    for x, y, z in MIDDLE_FAILING_TESTCASES:
+        with debugger.collect_fail():
+            middle(x, y, z)
+    return debugger
+
+def scores(debugger):  # type: ignore
+    return {event: debugger.suspiciousness(event) for event in debugger.all_events()}
+
+def runs(debugger):  # type: ignore
+    return {outcome: sorted((c.function().__name__, c.argstring(), c.exception(),
+                             sorted(c.events()), sorted((f.__name__, l) for f, l in c.coverage()))
+                            for c in debugger.collectors[outcome])
+            for outcome in debugger.collectors}
+
+
+# 저장한 뒤 다시 불러온 디버거는 같은 실행, 순위, 표를 가짐
+def test_save_load_round_trip() -> None:
+    debugger = middle_debugger()
+    data = io.BytesIO()
+    save_spectrum(debugger, data)
+    data.seek(0)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')  # 소스가 바뀌지 않았으므로 경고 없음
+        loaded = load_spectrum(data)
+    assert isinstance(loaded, OchiaiDebugger)
+    assert runs(loaded) == runs(debugger)
+    assert scores(loaded) == scores(debugger)
+    assert loaded.event_table_text(args=True) == debugger.event_table_text(args=True)
+    # 현재 프로세스의 함수로 복원됨
+    assert loaded.function() is middle
+    assert loaded.collectors[loaded.PASS][0].args() == debugger.collectors[debugger.PASS][0].args()
+
+def test_load_with_other_debugger_class() -> None:
+    debugger = middle_debugger(TarantulaDebugger)
+    data = io.BytesIO()
+    save_spectrum(debugger, data)
+    data.seek(0)
+    loaded = load_spectrum(data, TarantulaDebugger)
+    assert isinstance(loaded, TarantulaDebugger)
+    assert scores(loaded) == scores(debugger)
@@ -0,0 +1,56 @@
+import io
+from Tracer import Tracer
+from TraceSink import TextSink, RingBufferSink, BinaryEventLog, read_event_log, print_event_log
+
+def count(n):  # type: ignore
+    total = 0
+    for i in range(n):
+        total += i
+    return total
+
+def traced_text() -> str:
+    out = io.StringIO()
+    with Tracer(sink=TextSink(out)) as tracer:
+        count(2)
+        tracer.log("checkpoint", 1)
+        count(1)
+    return out.getvalue()
+
+
+# 바이너리 로그를 다시 읽으면 텍스트 출력과 같은 내용이 나옴
+def test_binary_log_round_trip() -> None:
+    data = io.BytesIO()
+    with Tracer(sink=BinaryEventLog(data)) as tracer:
+        count(2)
+        tracer.log("checkpoint", 1)
+        count(1)
+    data.seek(0)
+    records = list(read_event_log(data))
+    assert "checkpoint 1\n" in records
+    assert [r for r in records if isinstance(r, str)] == ["checkpoint 1\n"]
+    data.seek(0)
+    out = io.StringIO()
+    print_event_log(data, out)
+    assert out.getvalue() == traced_text()
+
+# log()로 출력한 메시지 사이에 출력 대상 자신의 이벤트가 끼어들지 않음
+def test_log_is_not_traced() -> None:
+    text = traced_text()
+    assert "checkpoint 1\n" in text
+    assert "genexpr" not in text and "message" not in text
+    assert text.count("Calling count") == 2
+
+def test_ring_buffer_keeps_recorded_values() -> None:
+    sink = RingBufferSink()
+    def grow():  # type: ignore
+        out = []
+        out = out + [1]
+        out.append(2)
+        return out
+    with Tracer(sink=sink):
+        grow()
+    out = io.StringIO()
+    with Tracer(sink=TextSink(out)):
+        grow()
+    assert sink.text() == out.getvalue()
+    assert "out = [1]\n" in sink.text()